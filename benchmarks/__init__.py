@@ -0,0 +1,5 @@
+"""
+독립유공자 공훈록 MCP 서버 - 벤치마크
+
+저장소 루트에서 `python -m benchmarks.<모듈>` 형식으로 실행합니다.
+"""
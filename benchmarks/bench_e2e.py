@@ -0,0 +1,292 @@
+"""
+종단 간 벤치마크
+
+가짜 업스트림 서버(benchmarks.fake_upstream)를 별도 프로세스로 띄우고 gonghun_mcp를 그 서버에 연결하여
+parse_xml_response, format_response, fetch_merit_list, fetch_public_report, call_tool을 측정합니다.
+시나리오별 p50/p95/p99 응답 시간, 처리량, 메모리 할당(tracemalloc 최대치), 캐시 적중률을 출력하고
+결과를 benchmarks/results/에 JSON으로 저장하여 이전 실행과 비교할 수 있습니다.
+
+실행: python -m benchmarks.bench_e2e [--ops 200] [--concurrency 16] [--latency-ms 80] [--error-rate 0.01]
+비교: python -m benchmarks.bench_e2e --compare benchmarks/results/<이전 결과>.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .payloads import make_page, page_to_xml
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+def percentile(samples: List[float], q: float) -> float:
+    """정렬된 표본의 분위수를 반환합니다."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+def start_upstream(args: argparse.Namespace) -> Tuple[subprocess.Popen, str]:
+    """가짜 업스트림 서버 프로세스를 시작하고 BASE_URL을 반환합니다."""
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "benchmarks.fake_upstream",
+            "--port", "0",
+            "--items", str(args.items),
+            "--latency-ms", str(args.latency_ms),
+            "--jitter-ms", str(args.jitter_ms),
+            "--error-rate", str(args.error_rate),
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    line = process.stdout.readline().strip()
+    if not line.startswith("BASE_URL="):
+        process.kill()
+        raise RuntimeError(f"가짜 업스트림 서버를 시작하지 못했습니다: {line}")
+    return process, line.split("=", 1)[1]
+
+class Runner:
+    """시나리오를 실행하고 결과를 모으는 클래스"""
+
+    def __init__(self, modules: Dict[str, Any], args: argparse.Namespace):
+        self.m = modules
+        self.args = args
+        self.results: List[Dict[str, Any]] = []
+
+    def cache_counters(self) -> Dict[str, int]:
+        stats = self.m["cache"].cache_manager.stats()
+        return {"hits": stats["hits"], "textHits": stats["textHits"], "misses": stats["misses"]}
+
+    def record(
+        self,
+        name: str,
+        latencies: List[float],
+        wall: float,
+        alloc_peak: int,
+        before: Dict[str, int],
+        errors: int
+    ) -> None:
+        after = self.cache_counters()
+        hits = (after["hits"] - before["hits"]) + (after["textHits"] - before["textHits"])
+        misses = after["misses"] - before["misses"]
+        result = {
+            "name": name,
+            "ops": len(latencies),
+            "errors": errors,
+            "p50Ms": percentile(latencies, 0.50) * 1000,
+            "p95Ms": percentile(latencies, 0.95) * 1000,
+            "p99Ms": percentile(latencies, 0.99) * 1000,
+            "throughput": len(latencies) / wall if wall > 0 else 0.0,
+            "allocPeakKiB": alloc_peak / 1024,
+            "cacheHitRate": hits / (hits + misses) if hits + misses else None,
+        }
+        self.results.append(result)
+        hit_rate = f"{result['cacheHitRate'] * 100:5.1f}%" if result["cacheHitRate"] is not None else "    -"
+        print(
+            f"{name:<34} p50 {result['p50Ms']:8.2f}  p95 {result['p95Ms']:8.2f}  p99 {result['p99Ms']:8.2f} ms  "
+            f"{result['throughput']:9.1f} ops/s  peak {result['allocPeakKiB']:9.1f} KiB  "
+            f"hit {hit_rate}  errors {errors}"
+        )
+
+    def run_sync(self, name: str, func: Callable[[], Any], ops: int) -> None:
+        """동기 함수를 반복 실행하여 측정합니다."""
+        before = self.cache_counters()
+        latencies = []
+        started = time.perf_counter()
+        for _ in range(ops):
+            t = time.perf_counter()
+            func()
+            latencies.append(time.perf_counter() - t)
+        wall = time.perf_counter() - started
+
+        tracemalloc.start()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.record(name, latencies, wall, peak, before, 0)
+
+    async def run_async(
+        self,
+        name: str,
+        make_op: Callable[[int], Awaitable[Any]],
+        ops: int,
+        concurrency: int
+    ) -> None:
+        """코루틴을 제한된 동시성으로 실행하여 측정합니다. 메모리 할당은 같은 부하로 한 번 더 실행하여 측정합니다."""
+        before = self.cache_counters()
+        latencies, errors, wall = await self._drive(make_op, 0, ops, concurrency)
+
+        tracemalloc.start()
+        await self._drive(make_op, ops, min(ops, 50), concurrency)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.record(name, latencies, wall, peak, before, errors)
+
+    async def _drive(
+        self,
+        make_op: Callable[[int], Awaitable[Any]],
+        offset: int,
+        ops: int,
+        concurrency: int
+    ) -> Tuple[List[float], int, float]:
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies: List[float] = []
+        errors = 0
+
+        async def one(i: int) -> None:
+            nonlocal errors
+            async with semaphore:
+                t = time.perf_counter()
+                try:
+                    await make_op(offset + i)
+                except Exception:
+                    errors += 1
+                latencies.append(time.perf_counter() - t)
+
+        started = time.perf_counter()
+        await asyncio.gather(*[one(i) for i in range(ops)])
+        return latencies, errors, time.perf_counter() - started
+
+async def run_scenarios(runner: Runner) -> None:
+    m = runner.m
+    args = runner.args
+    api = m["api"]
+    cache_manager = m["cache"].cache_manager
+    call_tool = m["tools"].call_tool
+
+    page = make_page(count_per_page=50, total_count=args.items)
+    xml_bytes = page_to_xml(page).encode("utf-8")
+    runner.run_sync("parse_xml_response (50 items)", lambda: m["utils"].parse_xml_response(xml_bytes), args.ops)
+    runner.run_sync("format_response pretty (50 items)", lambda: m["utils"].format_response(page, compact=False), args.ops)
+    runner.run_sync("format_response compact (50 items)", lambda: m["utils"].format_response(page, compact=True), args.ops)
+
+    await m["client"].http_client_manager.start()
+    try:
+        # 캐시 미스: 매번 다른 조건으로 조회
+        cache_manager.clear()
+        await runner.run_async(
+            "fetch_merit_list cold (JSON)",
+            lambda i: api.fetch_merit_list(name_ko=f"홍길동{i}"),
+            args.ops, args.concurrency
+        )
+        await runner.run_async(
+            "fetch_public_report cold (XML)",
+            lambda i: api.fetch_public_report(name_ko=f"홍길동{i}", response_type="XML"),
+            args.ops, args.concurrency
+        )
+        # 캐시 적중: 앞에서 조회한 조건을 다시 조회
+        await runner.run_async(
+            "fetch_merit_list warm (JSON)",
+            lambda i: api.fetch_merit_list(name_ko=f"홍길동{i % args.ops}"),
+            args.ops, args.concurrency
+        )
+
+        # 실제 사용과 비슷하게 일부 조건이 자주 반복되는 조회 (Zipf 분포)
+        cache_manager.clear()
+        rng = random.Random(0)
+        weights = [1 / (rank + 1) for rank in range(args.distinct_queries)]
+        picks = rng.choices(range(args.distinct_queries), weights=weights, k=args.ops + 50)
+        await runner.run_async(
+            "call_tool get_merit_list (zipf)",
+            lambda i: call_tool("get_merit_list", {"judge_year": str(1949 + picks[i] % 76), "page_index": 1 + picks[i] // 76}),
+            args.ops, args.concurrency
+        )
+    finally:
+        await m["client"].http_client_manager.close()
+
+def save_results(runner: Runner, base_url: str, path: Optional[str]) -> str:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = "unknown"
+
+    if path is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, f"{datetime.now():%Y%m%d-%H%M%S}-{commit}.json")
+
+    counters = dict(runner.m["resilience"].upstream_counters)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": commit,
+            "python": platform.python_version(),
+            "args": vars(runner.args),
+            "upstream": counters,
+            "results": runner.results,
+        }, f, ensure_ascii=False, indent=2)
+    return path
+
+def compare(current: List[Dict[str, Any]], previous_path: str) -> None:
+    with open(previous_path, encoding="utf-8") as f:
+        previous = {result["name"]: result for result in json.load(f)["results"]}
+
+    print(f"\n비교 기준: {previous_path}")
+    for result in current:
+        old = previous.get(result["name"])
+        if old is None:
+            continue
+        def delta(key: str) -> str:
+            if not old[key]:
+                return "     -"
+            return f"{(result[key] - old[key]) / old[key] * 100:+6.1f}%"
+        print(f"{result['name']:<34} p50 {delta('p50Ms')}  p95 {delta('p95Ms')}  p99 {delta('p99Ms')}  "
+              f"throughput {delta('throughput')}  peak {delta('allocPeakKiB')}")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="gonghun_mcp 종단 간 벤치마크")
+    parser.add_argument("--ops", type=int, default=200, help="시나리오별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 요청 수")
+    parser.add_argument("--items", type=int, default=5000, help="가짜 업스트림 전체 항목 수")
+    parser.add_argument("--distinct-queries", type=int, default=300, help="call_tool 시나리오의 서로 다른 조회 조건 수")
+    parser.add_argument("--latency-ms", type=float, default=80.0, help="업스트림 기본 응답 지연(밀리초)")
+    parser.add_argument("--jitter-ms", type=float, default=40.0, help="업스트림 추가 무작위 지연 최대값(밀리초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="업스트림 503 오류 비율 (0~1)")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="UPSTREAM_RATE_LIMIT (0이면 제한 없음)")
+    parser.add_argument("--output", help="결과 저장 경로 (기본값은 benchmarks/results/<시각>-<커밋>.json)")
+    parser.add_argument("--compare", help="비교할 이전 결과 파일")
+    args = parser.parse_args()
+
+    process, base_url = start_upstream(args)
+    try:
+        # gonghun_mcp 설정은 가져올 때 환경 변수에서 읽으므로 먼저 지정
+        os.environ.update({
+            "BASE_URL": base_url,
+            "UPSTREAM_RATE_LIMIT": str(args.rate_limit),
+            "DATA_SOURCE": "live",
+            "CACHE_DB_PATH": "",
+            "MIRROR_DB_PATH": "",
+        })
+        from gonghun_mcp import api, cache, client, config, resilience, tools, utils
+        # 요청마다 남는 INFO 로그가 측정에 섞이지 않도록 경고 이상만 출력
+        config.logger.setLevel("WARNING")
+        logging.getLogger("httpx").setLevel("WARNING")
+        runner = Runner(
+            {"api": api, "cache": cache, "client": client, "resilience": resilience, "tools": tools, "utils": utils},
+            args
+        )
+        print(f"upstream: {base_url} ({args.items} items, {args.latency_ms}+{args.jitter_ms} ms, "
+              f"error rate {args.error_rate}), ops {args.ops}, concurrency {args.concurrency}")
+        asyncio.run(run_scenarios(runner))
+    finally:
+        process.terminate()
+        process.wait()
+
+    path = save_results(runner, base_url, args.output)
+    print(f"\n결과 저장: {path}")
+    if args.compare:
+        compare(runner.results, args.compare)
+
+if __name__ == "__main__":
+    main()
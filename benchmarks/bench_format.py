@@ -0,0 +1,88 @@
+"""
+도구 응답 직렬화 벤치마크
+
+들여쓰기(pretty)/압축(compact) 직렬화와 필드 선택(fields)에 따른 처리 시간과 응답 크기를
+표준 json 모듈과 orjson(설치된 경우)으로 비교합니다.
+
+실행: python -m benchmarks.bench_format [--items 50] [--achivement-length 2000] [--repeat 50]
+"""
+
+import argparse
+import json
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from gonghun_mcp.utils import project_fields
+from .payloads import make_page
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 목록 탐색에 흔히 쓰는 필드 조합
+SUMMARY_FIELDS = ["mngNo", "nameKo", "hunkuk", "workoutAffil", "judgeYear"]
+
+def json_pretty(data: Dict[str, Any]) -> str:
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+def json_compact(data: Dict[str, Any]) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+def orjson_pretty(data: Dict[str, Any]) -> str:
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+def orjson_compact(data: Dict[str, Any]) -> str:
+    return orjson.dumps(data).decode("utf-8")
+
+def measure(
+    name: str,
+    serialize: Callable[[Dict[str, Any]], str],
+    data: Dict[str, Any],
+    fields: Optional[List[str]],
+    repeat: int
+) -> Dict[str, Any]:
+    """필드 선택과 직렬화를 합친 처리 시간과 응답 크기를 측정합니다."""
+    timings = []
+    text = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = serialize(project_fields(data, fields))
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "name": name,
+        "medianMs": statistics.median(timings) * 1000,
+        "chars": len(text),
+        "kib": len(text.encode("utf-8")) / 1024,
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="도구 응답 직렬화 벤치마크")
+    parser.add_argument("--items", type=int, default=50, help="페이지 당 항목 수")
+    parser.add_argument("--achivement-length", type=int, default=2000, help="항목별 공적 내용 길이")
+    parser.add_argument("--repeat", type=int, default=50, help="반복 횟수")
+    args = parser.parse_args()
+
+    data = make_page(count_per_page=args.items, achivement_length=args.achivement_length)
+
+    backends = [("json", json_pretty, json_compact)]
+    if orjson is not None:
+        backends.append(("orjson", orjson_pretty, orjson_compact))
+    else:
+        print("orjson이 설치되어 있지 않아 표준 json 모듈만 측정합니다. (pip install orjson)")
+
+    results = []
+    for backend, pretty, compact in backends:
+        results.append(measure(f"{backend} pretty", pretty, data, None, args.repeat))
+        results.append(measure(f"{backend} compact", compact, data, None, args.repeat))
+        results.append(measure(f"{backend} compact + fields", compact, data, SUMMARY_FIELDS, args.repeat))
+
+    print(f"payload: {args.items} items, fields={','.join(SUMMARY_FIELDS)}")
+    for result in results:
+        print(f"{result['name']:<24} median {result['medianMs']:8.3f} ms  "
+              f"size {result['kib']:9.1f} KiB  ({result['chars']} chars)")
+
+if __name__ == "__main__":
+    main()
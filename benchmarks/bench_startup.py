@@ -0,0 +1,108 @@
+"""
+서버 시작 시간 벤치마크
+
+MCP 클라이언트는 필요할 때마다 서버 프로세스를 띄우므로 initialize 응답 전까지의 시간이 그대로 사용자에게 보입니다.
+새 프로세스에서 서버 모듈을 가져오는 시간과, 서버 프로세스를 띄운 뒤 initialize 응답과
+첫 list_tools 응답을 받기까지의 시간을 여러 번 측정하여 중앙값/최대값을 출력합니다.
+첫 list_tools 응답 시간의 중앙값이 예산(--budget-ms)을 넘으면 종료 코드 1을 반환합니다.
+
+실행: python -m benchmarks.bench_startup [--runs 5] [--budget-ms 1500]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+# 서버 프로세스가 가져오는 모듈 (handler 등록 포함)
+IMPORT_SNIPPET = (
+    "import time; started = time.perf_counter(); "
+    "import gonghun_mcp.main; "
+    "print((time.perf_counter() - started) * 1000)"
+)
+
+SERVER_SNIPPET = "from gonghun_mcp import run; run()"
+
+def server_env() -> Dict[str, str]:
+    """서버 프로세스 환경 변수 (현재 환경에 로그/캐시 파일을 만들지 않는 설정을 더함)"""
+    env = dict(os.environ)
+    # 임시 디렉터리에서 실행하므로 설치하지 않은 저장소의 src도 찾을 수 있게 절대 경로로 추가
+    src_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    paths = [os.path.abspath(path) for path in env.get("PYTHONPATH", "").split(os.pathsep) if path]
+    env["PYTHONPATH"] = os.pathsep.join([src_dir] + paths)
+    env.update({
+        "LOG_FILE": "",
+        "CACHE_DB_PATH": "",
+        "MIRROR_DB_PATH": "",
+        "METRICS_EXPORT_PATH": "",
+        "WARMUP_PATH": "",
+    })
+    return env
+
+def measure_import(cwd: str) -> float:
+    """새 프로세스에서 서버 모듈을 가져오는 시간(밀리초)을 측정합니다."""
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET],
+        capture_output=True, text=True, check=True, cwd=cwd, env=server_env()
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+async def measure_first_response(cwd: str) -> Dict[str, float]:
+    """서버 프로세스를 띄우고 initialize 응답과 첫 list_tools 응답까지의 시간(밀리초)을 측정합니다."""
+    from mcp import ClientSession, StdioServerParameters
+    from mcp.client.stdio import stdio_client
+
+    params = StdioServerParameters(command=sys.executable, args=["-c", SERVER_SNIPPET], env=server_env(), cwd=cwd)
+    started = time.perf_counter()
+    with open(os.devnull, "w") as errlog:
+        async with stdio_client(params, errlog=errlog) as (read_stream, write_stream):
+            async with ClientSession(read_stream, write_stream) as session:
+                await session.initialize()
+                initialized = time.perf_counter()
+                tools = await session.list_tools()
+                listed = time.perf_counter()
+    return {
+        "initializeMs": (initialized - started) * 1000,
+        "firstListToolsMs": (listed - started) * 1000,
+        "tools": len(tools.tools),
+    }
+
+def summarize(name: str, samples: List[float]) -> None:
+    print(f"{name:<26} median {statistics.median(samples):8.1f} ms  max {max(samples):8.1f} ms")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="gonghun_mcp 서버 시작 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=5, help="측정 횟수")
+    parser.add_argument("--budget-ms", type=float, default=1500.0, help="첫 list_tools 응답 시간 중앙값 예산(밀리초)")
+    args = parser.parse_args()
+
+    import_times: List[float] = []
+    initialize_times: List[float] = []
+    list_tools_times: List[float] = []
+    with tempfile.TemporaryDirectory() as cwd:
+        # 첫 실행은 .pyc 생성이 섞이므로 측정에서 제외
+        measure_import(cwd)
+        for _ in range(args.runs):
+            import_times.append(measure_import(cwd))
+            result = asyncio.run(measure_first_response(cwd))
+            initialize_times.append(result["initializeMs"])
+            list_tools_times.append(result["firstListToolsMs"])
+
+    print(f"runs {args.runs}, tools {result['tools']}")
+    summarize("import gonghun_mcp.main", import_times)
+    summarize("spawn -> initialize", initialize_times)
+    summarize("spawn -> first list_tools", list_tools_times)
+
+    median = statistics.median(list_tools_times)
+    if median > args.budget_ms:
+        print(f"예산 초과: 첫 list_tools 응답 {median:.1f} ms > {args.budget_ms:.1f} ms")
+        sys.exit(1)
+    print(f"예산 이내: 첫 list_tools 응답 {median:.1f} ms <= {args.budget_ms:.1f} ms")
+
+if __name__ == "__main__":
+    main()
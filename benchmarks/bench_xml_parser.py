@@ -0,0 +1,73 @@
+"""
+XML 응답 파서 벤치마크
+
+전체 트리를 만드는 기존 방식(ET.fromstring)과 XMLPullParser 기반 스트리밍 파서의
+처리 시간과 최대 메모리 사용량을 비교합니다.
+
+실행: python -m benchmarks.bench_xml_parser [--items 50] [--achivement-length 2000] [--repeat 20]
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from typing import Any, Callable, Dict
+
+from gonghun_mcp.utils import XML_HEADER_FIELDS, _xml_item_to_dict, parse_xml_response
+from .payloads import make_page, page_to_xml
+
+def parse_with_tree(response_text: str) -> Dict[str, Any]:
+    """비교 기준: 전체 트리를 만든 뒤 순회하는 기존 방식의 파서"""
+    root = ET.fromstring(response_text)
+    result: Dict[str, Any] = {}
+    for tag, key in XML_HEADER_FIELDS.items():
+        elem = root.find(tag)
+        result[key] = int(elem.text) if elem is not None and elem.text else 0
+    items_elem = root.find("ITEMS")
+    result["items"] = [_xml_item_to_dict(item) for item in items_elem.findall("ITEM")] if items_elem is not None else []
+    return result
+
+def measure(name: str, func: Callable[[Any], Dict[str, Any]], payload: Any, repeat: int) -> Dict[str, Any]:
+    """파서의 처리 시간과 최대 메모리 사용량을 측정합니다."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(payload)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(payload)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "name": name,
+        "medianMs": statistics.median(timings) * 1000,
+        "minMs": min(timings) * 1000,
+        "peakKiB": peak / 1024,
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="XML 응답 파서 벤치마크")
+    parser.add_argument("--items", type=int, default=50, help="페이지 당 항목 수")
+    parser.add_argument("--achivement-length", type=int, default=2000, help="항목별 공적 내용 길이")
+    parser.add_argument("--repeat", type=int, default=20, help="반복 횟수")
+    args = parser.parse_args()
+
+    xml_text = page_to_xml(make_page(count_per_page=args.items, achivement_length=args.achivement_length))
+    xml_bytes = xml_text.encode("utf-8")
+    assert parse_with_tree(xml_text) == parse_xml_response(xml_text)
+
+    print(f"payload: {args.items} items, {len(xml_bytes) / 1024:.1f} KiB")
+    results = [
+        measure("tree (ET.fromstring, str)", parse_with_tree, xml_text, args.repeat),
+        measure("streaming (pull parser, str)", parse_xml_response, xml_text, args.repeat),
+        measure("streaming (pull parser, bytes)", parse_xml_response, xml_bytes, args.repeat),
+    ]
+    for result in results:
+        print(f"{result['name']:<32} median {result['medianMs']:8.2f} ms  "
+              f"min {result['minMs']:8.2f} ms  peak {result['peakKiB']:9.1f} KiB")
+
+if __name__ == "__main__":
+    main()
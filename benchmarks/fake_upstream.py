@@ -0,0 +1,206 @@
+"""
+벤치마크용 가짜 e-gonghun 업스트림 서버
+
+contribuMeritList.do와 publicReportList.do를 흉내 내는 로컬 HTTP 서버입니다.
+실제 응답과 비슷한 JSON/XML 페이지를 돌려주며, 응답 지연과 오류 비율을 설정할 수 있습니다.
+
+단독 실행: python -m benchmarks.fake_upstream [--port 8765] [--latency-ms 80] [--error-rate 0.01]
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .payloads import make_item, page_to_xml
+
+ENDPOINTS = ("/opnAPI/contribuMeritList.do", "/opnAPI/publicReportList.do")
+
+class FakeUpstream:
+    """가짜 업스트림 데이터와 요청 처리 로직"""
+
+    def __init__(
+        self,
+        total_count: int = 5000,
+        achivement_length: int = 2000,
+        latency_ms: float = 80.0,
+        jitter_ms: float = 40.0,
+        error_rate: float = 0.0,
+        seed: int = 0
+    ):
+        """
+        가짜 업스트림을 초기화합니다.
+
+        Args:
+            total_count: 전체 항목 수
+            achivement_length: 항목별 공적 내용 길이
+            latency_ms: 기본 응답 지연(밀리초)
+            jitter_ms: 응답 지연에 더할 무작위 지연의 최대값(밀리초)
+            error_rate: 503 오류를 돌려줄 비율 (0~1)
+            seed: 지연/오류 난수 시드
+        """
+        self.items = [make_item(index, achivement_length) for index in range(total_count)]
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.requests = 0
+        self.errors = 0
+
+    def search(self, params: Dict[str, str]) -> List[Dict[str, Any]]:
+        """검색 조건(mngNo 일치, nameKo 포함, judgeYear/hunkuk/workoutAffil 일치)에 맞는 항목을 반환합니다."""
+        items = self.items
+        if params.get("mngNo"):
+            items = [item for item in items if item["mngNo"] == params["mngNo"]]
+        if params.get("nameKo"):
+            items = [item for item in items if params["nameKo"] in item["nameKo"]]
+        for key in ("judgeYear", "hunkuk", "workoutAffil", "sex"):
+            if params.get(key):
+                items = [item for item in items if item[key] == params[key]]
+        return items
+
+    def respond(self, path: str, params: Dict[str, str]) -> Tuple[int, str, bytes]:
+        """
+        요청에 대한 응답을 만듭니다.
+
+        Returns:
+            (상태 코드, Content-Type, 본문) 튜플
+        """
+        self.requests += 1
+        if path not in ENDPOINTS:
+            return 404, "text/plain", b"not found"
+        if self.error_rate and self.rng.random() < self.error_rate:
+            self.errors += 1
+            return 503, "text/plain", b"service unavailable"
+
+        page_index = max(1, int(params.get("nPageIndex") or 1))
+        count_per_page = min(50, max(1, int(params.get("nCountPerPage") or 10)))
+        matched = self.search(params)
+        start = (page_index - 1) * count_per_page
+        items = matched[start:start + count_per_page]
+        page = {
+            "totalCount": len(matched),
+            "pageCount": math.ceil(len(matched) / count_per_page),
+            "pageIndex": page_index,
+            "countPerPage": count_per_page,
+            "itemCount": len(items),
+            "items": items,
+        }
+        if (params.get("type") or "JSON").upper() == "XML":
+            return 200, "application/xml; charset=utf-8", page_to_xml(page).encode("utf-8")
+        return 200, "application/json; charset=utf-8", json.dumps(page, ensure_ascii=False).encode("utf-8")
+
+    def delay(self) -> float:
+        """이번 응답의 지연 시간(초)을 반환합니다."""
+        return (self.latency_ms + self.rng.uniform(0, self.jitter_ms)) / 1000
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """HTTP/1.1 keep-alive 연결 하나를 처리합니다."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                _, target, _ = request_line.decode("latin-1").split(" ", 2)
+                url = urlsplit(target)
+                params = {key: values[0] for key, values in parse_qs(url.query).items()}
+                await asyncio.sleep(self.delay())
+                status, content_type, body = self.respond(url.path, params)
+
+                writer.write(
+                    f"HTTP/1.1 {status} {'OK' if status == 200 else 'ERROR'}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    "Connection: keep-alive\r\n\r\n".encode("latin-1") + body
+                )
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+class FakeUpstreamServer:
+    """가짜 업스트림을 별도 스레드의 이벤트 루프에서 실행하는 서버"""
+
+    def __init__(self, upstream: FakeUpstream, host: str = "127.0.0.1", port: int = 0):
+        """
+        서버를 초기화합니다.
+
+        Args:
+            upstream: 요청을 처리할 가짜 업스트림
+            host: 바인딩할 주소
+            port: 바인딩할 포트 (0이면 빈 포트 사용)
+        """
+        self.upstream = upstream
+        self.host = host
+        self.port = port
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+
+    @property
+    def base_url(self) -> str:
+        """서버의 BASE_URL (gonghun_mcp 설정에 사용)"""
+        return f"http://{self.host}:{self.port}/opnAPI"
+
+    def start(self) -> "FakeUpstreamServer":
+        """서버 스레드를 시작하고 요청을 받을 준비가 될 때까지 기다립니다."""
+        self._thread = threading.Thread(target=self._run, name="fake-upstream", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def stop(self) -> None:
+        """서버를 종료합니다."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._server = self._loop.run_until_complete(
+            asyncio.start_server(self.upstream.handle, self.host, self.port, backlog=1024)
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._server.close()
+            self._loop.close()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="벤치마크용 가짜 e-gonghun 업스트림 서버")
+    parser.add_argument("--port", type=int, default=8765, help="포트")
+    parser.add_argument("--items", type=int, default=5000, help="전체 항목 수")
+    parser.add_argument("--latency-ms", type=float, default=80.0, help="기본 응답 지연(밀리초)")
+    parser.add_argument("--jitter-ms", type=float, default=40.0, help="추가 무작위 지연 최대값(밀리초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 오류 비율 (0~1)")
+    args = parser.parse_args()
+
+    upstream = FakeUpstream(args.items, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate)
+    server = FakeUpstreamServer(upstream, port=args.port).start()
+    print(f"BASE_URL={server.base_url}", flush=True)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+if __name__ == "__main__":
+    main()
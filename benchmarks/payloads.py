@@ -0,0 +1,118 @@
+"""
+벤치마크용 공훈록/공적조서 응답 데이터 생성 모듈
+
+실제 응답과 비슷한 크기의 항목(긴 공적 내용, 참고문헌/링크 포함)을 만들어 JSON/XML 응답을 생성합니다.
+"""
+
+import math
+import random
+from typing import Any, Dict, List
+from xml.sax.saxutils import escape
+
+HUNKUK = ["PSG00002", "PSG00003", "PSG00004", "PSG00005", "PSG00006", "PSG00007", "PSG00008"]
+WORKOUT = ["UGC00002", "UGC00003", "UGC00004", "UGC00005", "UGC00006", "UGC00008", "UGC00010"]
+ACHIVEMENT_SENTENCE = "1919년 3월 1일 서울 탑골공원에서 독립선언서를 낭독하고 만세시위에 참여하여 체포되었다. "
+
+def make_item(index: int, achivement_length: int = 2000, references: int = 3) -> Dict[str, Any]:
+    """
+    벤치마크용 항목 하나를 생성합니다.
+
+    Args:
+        index: 항목 번호 (관리번호 생성에 사용)
+        achivement_length: 공적 내용 길이(글자 수)
+        references: 참고문헌 개수
+
+    Returns:
+        JSON 응답 형식의 항목
+    """
+    rng = random.Random(index)
+    repeat = max(1, achivement_length // len(ACHIVEMENT_SENTENCE))
+    return {
+        "mngNo": f"{index:06d}",
+        "nameKo": f"홍길동{index}",
+        "nameCh": "洪吉童",
+        "diffName": "",
+        "birthday": f"18{rng.randint(60, 99)}0{rng.randint(1, 9)}1{rng.randint(0, 9)}",
+        "lastday": f"19{rng.randint(20, 70)}0{rng.randint(1, 9)}2{rng.randint(0, 9)}",
+        "sex": str(rng.randint(0, 1)),
+        "registerLargeDiv": "경기도",
+        "registerMidDiv": "이천",
+        "judgeYear": str(rng.randint(1949, 2024)),
+        "hunkuk": rng.choice(HUNKUK),
+        "workoutAffil": rng.choice(WORKOUT),
+        "achivement": ACHIVEMENT_SENTENCE * repeat,
+        "references": [
+            {
+                "bookName": f"독립운동사 제{ref + 1}권",
+                "links": [
+                    {"name": f"원문 {link + 1}", "url": f"https://e-gonghun.mpva.go.kr/ref/{index}/{ref}/{link}"}
+                    for link in range(2)
+                ],
+            }
+            for ref in range(references)
+        ],
+    }
+
+def make_page(
+    page_index: int = 1,
+    count_per_page: int = 50,
+    total_count: int = 18000,
+    achivement_length: int = 2000
+) -> Dict[str, Any]:
+    """
+    벤치마크용 JSON 응답 한 페이지를 생성합니다.
+
+    Args:
+        page_index: 페이지 번호
+        count_per_page: 페이지 당 데이터 건수
+        total_count: 전체 건수
+        achivement_length: 항목별 공적 내용 길이
+
+    Returns:
+        JSON 응답 형식의 딕셔너리
+    """
+    start = (page_index - 1) * count_per_page
+    items = [make_item(index, achivement_length) for index in range(start, min(start + count_per_page, total_count))]
+    return {
+        "totalCount": total_count,
+        "pageCount": math.ceil(total_count / count_per_page),
+        "pageIndex": page_index,
+        "countPerPage": count_per_page,
+        "itemCount": len(items),
+        "items": items,
+    }
+
+def page_to_xml(page: Dict[str, Any]) -> str:
+    """
+    JSON 응답 형식의 페이지를 업스트림 XML 응답 형식으로 변환합니다.
+
+    Args:
+        page: make_page로 생성한 페이지
+
+    Returns:
+        XML 문자열
+    """
+    parts: List[str] = ['<?xml version="1.0" encoding="UTF-8"?>', "<RESULT>"]
+    parts.append(f"<TOTAL_COUNT>{page['totalCount']}</TOTAL_COUNT>")
+    parts.append(f"<PAGE_COUNT>{page['pageCount']}</PAGE_COUNT>")
+    parts.append(f"<PAGE_INDEX>{page['pageIndex']}</PAGE_INDEX>")
+    parts.append(f"<COUNT_PER_PAGE>{page['countPerPage']}</COUNT_PER_PAGE>")
+    parts.append(f"<ITEM_COUNT>{page['itemCount']}</ITEM_COUNT>")
+    parts.append("<ITEMS>")
+    for item in page["items"]:
+        parts.append("<ITEM>")
+        for key in ("mngNo", "nameKo", "nameCh", "diffName", "birthday", "lastday", "sex",
+                    "registerLargeDiv", "registerMidDiv", "judgeYear", "hunkuk", "workoutAffil", "achivement"):
+            tag = "".join("_" + ch if ch.isupper() else ch for ch in key).upper()
+            parts.append(f"<{tag}>{escape(item[key])}</{tag}>")
+        parts.append("<REFERENCES>")
+        for ref in item["references"]:
+            parts.append(f"<REFERENCE><BOOK_NAME>{escape(ref['bookName'])}</BOOK_NAME><LINKS>")
+            for link in ref["links"]:
+                parts.append(f"<LINK><NAME>{escape(link['name'])}</NAME><URL>{escape(link['url'])}</URL></LINK>")
+            parts.append("</LINKS></REFERENCE>")
+        parts.append("</REFERENCES>")
+        parts.append("</ITEM>")
+    parts.append("</ITEMS>")
+    parts.append("</RESULT>")
+    return "".join(parts)
@@ -5,10 +5,15 @@
 독립유공자 공훈록 및 공적조서 정보를 조회하는 MCP 서버를 제공합니다.
 
 사용 가능한 리소스:
-1. gonghun://merit/all - 독립유공자 공훈록 전체 목록 조회
-2. gonghun://report/all - 독립유공자 공적조서 전체 목록 조회
+1. gonghun://merit/all - 독립유공자 공훈록 목록 첫 페이지 조회
+2. gonghun://report/all - 독립유공자 공적조서 목록 첫 페이지 조회
 3. gonghun://code/hunkuk - 훈격 코드 정보 조회
 4. gonghun://code/workout - 운동계열 코드 정보 조회
+5. gonghun://stats - 서버 실행 지표 조회
+
+사용 가능한 리소스 템플릿:
+1. gonghun://merit/{mngNo}, gonghun://report/{mngNo} - 관리번호로 공훈록/공적조서 단건 조회
+2. gonghun://merit/page/{n}, gonghun://report/page/{n} - 목록 페이지 조회 (nextCursor로 다음 페이지 URI 제공)
 
 사용 가능한 도구:
 1. get_merit_list - 독립유공자 공훈록 목록 조회
@@ -16,43 +21,67 @@
 3. get_hunkuk_codes - 훈격 코드 정보 조회
 4. get_workout_affil_codes - 운동계열 코드 정보 조회
 5. clear_cache - 캐시 초기화
+6. sync_mirror - 로컬 미러 동기화 시작
+7. get_mirror_status - 로컬 미러 동기화 상태 조회
+8. get_merits_by_ids - 여러 관리번호의 공훈록 일괄 조회
+9. get_activist_profile - 공훈록과 공적조서를 합친 독립유공자 프로필 조회
+10. get_server_stats - 서버 실행 지표 조회
+11. set_profiling - 도구 호출 프로파일링 설정 및 느린 호출 조회
 """
 
 # 버전 정보
 __version__ = '0.1.0'
 
-# 모듈 가져오기
-from . import config
-from . import cache
-from . import utils
-from . import api
-from . import tools
-from . import main
-from . import server
-
-# 메인 실행 함수 노출
-from .main import run
+import importlib
+from typing import Any
 
-# 서버 인스턴스 노출
-app = config.app
+# 하위 모듈과 노출 이름은 처음 사용할 때 가져옴
+# (MCP 클라이언트가 필요할 때마다 서버 프로세스를 띄우므로 initialize 응답 전 가져오기 시간을 줄임)
+_SUBMODULES = (
+    "logs", "config", "cache_backend", "disk_cache", "cache", "client", "singleflight", "limiter", "resilience",
+    "metrics", "profiling", "sessions", "warmup", "utils", "mirror", "api", "sync", "tools", "main", "server",
+    "sse_server",
+)
 
-# 캐시 매니저 노출
-cache_manager = cache.cache_manager
+_EXPORTS = {
+    # 메인 실행 함수
+    "run": ("main", "run"),
+    # 서버 인스턴스
+    "app": ("config", "app"),
+    # 캐시 매니저
+    "cache_manager": ("cache", "cache_manager"),
+    # HTTP 클라이언트 매니저
+    "http_client_manager": ("client", "http_client_manager"),
+    # 로거
+    "logger": ("config", "logger"),
+    # API 함수
+    "fetch_merit_list": ("api", "fetch_merit_list"),
+    "fetch_public_report": ("api", "fetch_public_report"),
+    # 유틸리티 함수
+    "parse_xml_response": ("utils", "parse_xml_response"),
+    "iter_xml_items": ("utils", "iter_xml_items"),
+    "parse_resource_uri": ("utils", "parse_resource_uri"),
+    "format_response": ("utils", "format_response"),
+    "create_error_response": ("utils", "create_error_response"),
+    "build_query_params": ("utils", "build_query_params"),
+}
 
-# 로거 노출
-logger = config.logger
+__all__ = list(_SUBMODULES) + list(_EXPORTS)
 
-# API 함수 노출
-fetch_merit_list = api.fetch_merit_list
-fetch_public_report = api.fetch_public_report
+def __getattr__(name: str) -> Any:
+    """하위 모듈이나 노출 이름을 처음 참조할 때 가져옵니다."""
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _EXPORTS:
+        module_name, attr = _EXPORTS[name]
+        value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# 유틸리티 함수 노출
-parse_xml_response = utils.parse_xml_response
-parse_resource_uri = utils.parse_resource_uri
-format_response = utils.format_response
-create_error_response = utils.create_error_response
-build_query_params = utils.build_query_params
+def __dir__() -> list:
+    return sorted(list(globals()) + __all__)
 
 # 스크립트로 직접 실행될 때의 진입점
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    __getattr__("run")()
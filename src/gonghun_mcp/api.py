@@ -4,11 +4,478 @@
 이 모듈은 독립유공자 공훈록 API와의 통신을 담당합니다.
 """
 
+import asyncio
+import math
+import time
 import httpx
-from typing import Dict, Any, Optional
-from .config import logger, BASE_URL
+from typing import Dict, Any, Awaitable, Callable, List, Optional, Set
+from .config import (
+    logger,
+    request_logger,
+    CACHE_STALE_MODE,
+    CACHE_LEASE_TIMEOUT,
+    CACHE_LEASE_POLL_INTERVAL,
+    DATA_SOURCE,
+    MAX_COUNT_PER_PAGE,
+    UPSTREAM_RETRIES,
+    HEDGE_ENABLED,
+    FANOUT_CONCURRENCY,
+    BATCH_CONCURRENCY,
+    MERIT_LIST_ENDPOINT,
+    PUBLIC_REPORT_ENDPOINT,
+    SEX_CODES,
+    HUNKUK_CODES,
+    WORKOUT_AFFIL_CODES,
+)
 from .cache import cache_manager
-from .utils import parse_xml_response, build_query_params
+from .client import http_client_manager
+from .singleflight import single_flight
+from .limiter import upstream_limiter, background_priority
+from .metrics import metrics
+from .profiling import profile_phase
+from .resilience import (
+    CircuitOpenError,
+    circuit_breaker,
+    upstream_latency,
+    upstream_counters,
+    backoff_delay,
+)
+from .mirror import mirror_store
+from .warmup import cache_warmer
+from .logs import lazy_payload
+from .utils import parse_xml_response, build_query_params, make_cache_key, get_item_field
+
+# 백그라운드 갱신 작업 참조 (가비지 컬렉션 방지)
+_background_tasks: Set[asyncio.Task] = set()
+
+# 재시도할 HTTP 상태 코드 (모든 업스트림 요청은 멱등한 GET)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+async def _send_once(client: httpx.AsyncClient, endpoint: str, params: Dict[str, Any]) -> httpx.Response:
+    """
+    프로세스 전체의 속도/동시성 제한을 거쳐 업스트림에 요청을 한 번 보냅니다.
+    
+    Args:
+        client: HTTP 클라이언트
+        endpoint: 요청할 API 엔드포인트
+        params: 쿼리 파라미터
+        
+    Returns:
+        HTTP 응답
+    """
+    with profile_phase("upstream_wait"):
+        await upstream_limiter.acquire()
+    upstream_counters["attempts"] += 1
+    endpoint_name = endpoint.rsplit("/", 1)[-1]
+    started = time.monotonic()
+    try:
+        with profile_phase("network"):
+            response = await client.get(endpoint, params=params)
+    except asyncio.CancelledError:
+        upstream_limiter.abandon()
+        raise
+    except Exception as e:
+        latency = time.monotonic() - started
+        upstream_limiter.release(latency, False)
+        metrics.upstream_finished(
+            endpoint_name, "timeout" if isinstance(e, httpx.TimeoutException) else "error", latency
+        )
+        raise
+    
+    latency = time.monotonic() - started
+    metrics.upstream_finished(endpoint_name, str(response.status_code), latency)
+    ok = response.status_code not in RETRYABLE_STATUS_CODES
+    upstream_limiter.release(latency, ok)
+    if ok:
+        upstream_latency.record(latency)
+    return response
+
+async def _send_hedged(client: httpx.AsyncClient, endpoint: str, params: Dict[str, Any]) -> httpx.Response:
+    """
+    요청을 보내고, HEDGE_ENABLED이면 최근 응답 시간의 분위수가 지나도 응답이 없을 때
+    같은 요청을 한 번 더 보내 먼저 도착한 응답을 사용합니다.
+    
+    Args:
+        client: HTTP 클라이언트
+        endpoint: 요청할 API 엔드포인트
+        params: 쿼리 파라미터
+        
+    Returns:
+        HTTP 응답
+    """
+    if not HEDGE_ENABLED:
+        return await _send_once(client, endpoint, params)
+    
+    first = asyncio.ensure_future(_send_once(client, endpoint, params))
+    tasks = {first}
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=upstream_latency.hedge_delay())
+        if done:
+            return first.result()
+        
+        upstream_counters["hedged"] += 1
+        tasks.add(asyncio.ensure_future(_send_once(client, endpoint, params)))
+        error: Optional[BaseException] = None
+        while tasks:
+            done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is not first:
+                        upstream_counters["hedgeWins"] += 1
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in tasks:
+            task.cancel()
+
+async def _get_with_retries(endpoint: str, params: Dict[str, Any]) -> httpx.Response:
+    """
+    서킷 브레이커를 확인한 뒤 업스트림에 요청하고, 일시적인 오류는 지수 백오프로 재시도합니다.
+    
+    Args:
+        endpoint: 요청할 API 엔드포인트
+        params: 쿼리 파라미터
+        
+    Returns:
+        정상(2xx~4xx) HTTP 응답
+        
+    Raises:
+        CircuitOpenError: 업스트림 장애로 서킷 브레이커가 열려 있는 경우
+        httpx.HTTPError: 재시도 후에도 요청이 실패한 경우
+    """
+    client = await http_client_manager.get_client()
+    attempt = 0
+    while True:
+        if not circuit_breaker.allow():
+            raise CircuitOpenError("업스트림 API 장애로 잠시 요청을 중단했습니다. 잠시 후 다시 시도해주세요.")
+        
+        try:
+            response = await _send_hedged(client, endpoint, params)
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                circuit_breaker.record_success()
+                response.raise_for_status()
+                return response
+            circuit_breaker.record_failure()
+            if attempt >= UPSTREAM_RETRIES:
+                response.raise_for_status()
+            reason = f"HTTP {response.status_code}"
+        except (httpx.TimeoutException, httpx.TransportError) as e:
+            circuit_breaker.record_failure()
+            if attempt >= UPSTREAM_RETRIES:
+                raise
+            reason = type(e).__name__
+        
+        delay = backoff_delay(attempt)
+        attempt += 1
+        upstream_counters["retries"] += 1
+        logger.warning(f"업스트림 요청 재시도 {attempt}/{UPSTREAM_RETRIES} ({reason}), {delay:.2f}초 후: {endpoint}")
+        with profile_phase("retry_backoff"):
+            await asyncio.sleep(delay)
+
+async def _request_upstream(
+    endpoint: str,
+    params: Dict[str, Any],
+    response_type: str,
+    cache_key: Optional[str]
+) -> Dict[str, Any]:
+    """
+    업스트림 API를 호출하고 응답을 파싱하여 캐시에 저장합니다.
+    
+    Args:
+        endpoint: 요청할 API 엔드포인트
+        params: 쿼리 파라미터
+        response_type: 응답 형식 (JSON/XML)
+        cache_key: 결과를 저장할 캐시 키 (None이면 캐시하지 않음)
+        
+    Returns:
+        파싱된 응답 데이터
+    """
+    request_logger.info("업스트림 요청: %s, 파라미터: %s", endpoint, lazy_payload(params))
+    response = await _get_with_retries(endpoint, params)
+    
+    # 응답 형식에 따라 처리
+    if response_type.upper() == "JSON":
+        with profile_phase("decode_json"):
+            result = response.json()
+    else:  # XML
+        # XML 응답 파싱
+        with profile_phase("parse_xml"):
+            result = parse_xml_response(response.content)
+    
+    if cache_key is not None and "error" not in result:
+        # 캐시 저장
+        await cache_manager.set_async(cache_key, result)
+    
+    return result
+
+async def _request_upstream_shared(
+    endpoint: str,
+    params: Dict[str, Any],
+    response_type: str,
+    cache_key: str
+) -> Dict[str, Any]:
+    """
+    다른 서버 프로세스와 함께 쓰는 캐시 저장소가 있으면 임대를 얻은 프로세스만 업스트림을 호출하고,
+    나머지 프로세스는 그 결과가 저장소에 저장되기를 기다려 사용합니다.
+    임대한 프로세스의 요청이 실패하거나 프로세스가 종료되어 임대가 풀리면 기다리던 프로세스가 임대를 얻어 직접 호출합니다.
+    저장소 잠금을 기다리는 동안 이벤트 루프가 멈추지 않도록 임대와 저장소 조회는 스레드에서 실행합니다.
+    
+    Args:
+        endpoint: 요청할 API 엔드포인트
+        params: 쿼리 파라미터
+        response_type: 응답 형식 (JSON/XML)
+        cache_key: 캐시 키
+        
+    Returns:
+        파싱된 응답 데이터
+    """
+    backend = cache_manager.backend
+    if backend is None or not backend.shared:
+        return await _request_upstream(endpoint, params, response_type, cache_key)
+    
+    waited = False
+    while True:
+        token = await asyncio.to_thread(backend.acquire_lease, cache_key, CACHE_LEASE_TIMEOUT)
+        if token is not None:
+            try:
+                # 기다리는 사이 임대한 프로세스가 저장하고 임대를 반환했을 수 있음
+                data = await cache_manager.load_shared(cache_key) if waited else None
+                if data is not None:
+                    return data
+                return await _request_upstream(endpoint, params, response_type, cache_key)
+            finally:
+                await asyncio.to_thread(backend.release_lease, cache_key, token)
+        
+        waited = True
+        with profile_phase("shared_wait"):
+            await asyncio.sleep(CACHE_LEASE_POLL_INTERVAL)
+        data = await cache_manager.load_shared(cache_key)
+        if data is not None:
+            return data
+
+def _mark_stale(data: Dict[str, Any], age: float, reason: str) -> Dict[str, Any]:
+    """
+    오래된 캐시 데이터에 상태 표시를 추가한 사본을 반환합니다.
+    
+    Args:
+        data: 캐시된 데이터
+        age: 저장 후 경과 시간(초)
+        reason: 오래된 데이터를 반환한 이유 (revalidating/upstream_error)
+        
+    Returns:
+        cacheStatus 필드가 추가된 데이터
+    """
+    marked = dict(data)
+    marked["cacheStatus"] = {
+        "stale": True,
+        "ageSeconds": int(age),
+        "reason": reason
+    }
+    return marked
+
+def _refresh_in_background(
+    endpoint: str,
+    params: Dict[str, Any],
+    response_type: str,
+    cache_key: str
+) -> None:
+    """오래된 캐시 항목을 백그라운드 우선순위로 갱신합니다."""
+    with background_priority():
+        task = asyncio.ensure_future(single_flight.do(
+            cache_key,
+            lambda: _request_upstream_shared(endpoint, params, response_type, cache_key)
+        ))
+    _background_tasks.add(task)
+
+    def _done(t: asyncio.Task) -> None:
+        _background_tasks.discard(t)
+        if not t.cancelled() and t.exception() is not None:
+            logger.warning(f"백그라운드 캐시 갱신 실패: {cache_key} - {str(t.exception())}")
+
+    task.add_done_callback(_done)
+
+async def _fetch_cached(
+    endpoint: str,
+    params: Dict[str, Any],
+    response_type: str,
+    cache_key: str
+) -> Dict[str, Any]:
+    """
+    캐시를 확인한 뒤 필요한 경우 업스트림 API를 호출합니다.
+    soft TTL이 지난 데이터는 CACHE_STALE_MODE에 따라 즉시 반환하고 백그라운드에서 갱신하거나,
+    업스트림 호출이 실패했을 때 대신 반환합니다.
+    
+    Args:
+        endpoint: 요청할 API 엔드포인트
+        params: 쿼리 파라미터
+        response_type: 응답 형식 (JSON/XML)
+        cache_key: 캐시 키
+        
+    Returns:
+        응답 데이터 (오래된 데이터인 경우 cacheStatus 필드 포함)
+    """
+    cache_warmer.record(cache_key, endpoint, params, response_type)
+    with profile_phase("cache"):
+        data, stale, age = await cache_manager.lookup_async(cache_key)
+    if data is not None and not stale:
+        return data
+    
+    if data is not None and CACHE_STALE_MODE == "revalidate":
+        _refresh_in_background(endpoint, params, response_type, cache_key)
+        return _mark_stale(data, age, "revalidating")
+    
+    try:
+        # 동일한 요청이 진행 중이면 (캐시 저장소를 공유하는 다른 프로세스 포함) 그 결과를 함께 사용
+        return await single_flight.do(
+            cache_key,
+            lambda: _request_upstream_shared(endpoint, params, response_type, cache_key)
+        )
+    except Exception as e:
+        if data is not None and CACHE_STALE_MODE != "off":
+            logger.warning(f"업스트림 오류로 오래된 캐시 데이터를 반환합니다: {cache_key} - {str(e)}")
+            return _mark_stale(data, age, "upstream_error")
+        raise
+
+async def warm_cache_entry(
+    endpoint: str,
+    params: Dict[str, Any],
+    response_type: str,
+    cache_key: str
+) -> bool:
+    """
+    캐시 예열용으로 캐시 키의 데이터를 미리 가져옵니다. 신선한 캐시가 있으면 업스트림을 호출하지 않습니다.
+    
+    Args:
+        endpoint: 요청할 API 엔드포인트
+        params: 쿼리 파라미터
+        response_type: 응답 형식 (JSON/XML)
+        cache_key: 캐시 키
+        
+    Returns:
+        캐시에 정상 데이터가 준비되었는지 여부
+    """
+    data = await _fetch_cached(endpoint, params, response_type, cache_key)
+    return "error" not in data
+
+def _slice_window(
+    blocks: List[Dict[str, Any]],
+    first_block: int,
+    page_index: int,
+    count_per_page: int
+) -> Dict[str, Any]:
+    """
+    최대 크기로 조회한 연속된 페이지(블록)에서 요청한 페이지 범위를 잘라 응답을 구성합니다.
+    
+    Args:
+        blocks: 연속된 블록 응답 목록
+        first_block: 첫 번째 블록의 페이지 번호 (MAX_COUNT_PER_PAGE 기준)
+        page_index: 요청한 페이지 번호
+        count_per_page: 요청한 페이지 당 데이터 건수
+        
+    Returns:
+        요청한 페이지 크기 기준으로 다시 계산된 응답 데이터
+    """
+    items = []
+    for block in blocks:
+        items.extend(block["items"])
+    
+    offset = (page_index - 1) * count_per_page - (first_block - 1) * MAX_COUNT_PER_PAGE
+    window = items[offset:offset + count_per_page]
+    
+    result = {key: value for key, value in blocks[0].items() if key != "items"}
+    for block in blocks[1:]:
+        if "cacheStatus" in block:
+            result["cacheStatus"] = block["cacheStatus"]
+    
+    # 페이지 정보를 요청한 페이지 크기 기준으로 갱신
+    if "pageIndex" in result:
+        result["pageIndex"] = page_index
+    if "countPerPage" in result:
+        result["countPerPage"] = count_per_page
+    if "itemCount" in result:
+        result["itemCount"] = len(window)
+    if "pageCount" in result and "totalCount" in result:
+        result["pageCount"] = math.ceil(int(result["totalCount"]) / count_per_page)
+    result["items"] = window
+    return result
+
+def _query_mirror(prefix: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    동기화가 완료된 데이터셋이면 로컬 미러에서 조회합니다 (스레드에서 실행).
+    
+    Args:
+        prefix: 미러의 데이터셋 이름
+        params: build_query_params로 구성한 쿼리 파라미터
+        
+    Returns:
+        미러 조회 결과, 아직 조회에 사용할 수 없는 데이터셋이면 None
+    """
+    if not mirror_store.is_ready(prefix):
+        return None
+    return mirror_store.query(prefix, params)
+
+async def _fetch_page(
+    endpoint: str,
+    prefix: str,
+    params: Dict[str, Any],
+    use_cache: bool = True
+) -> Dict[str, Any]:
+    """
+    요청한 페이지를 조회합니다.
+    DATA_SOURCE가 mirror이고 동기화가 완료된 데이터셋은 로컬 미러에서 조회합니다.
+    재사용률을 높이기 위해 업스트림에는 항상 최대 크기(MAX_COUNT_PER_PAGE) 페이지를 요청하여 캐시하고,
+    요청한 페이지는 해당 레코드 범위를 포함하는 블록(최대 2개)을 잘라서 구성합니다.
+    
+    Args:
+        endpoint: 요청할 API 엔드포인트
+        prefix: 캐시 키 접두사 (미러의 데이터셋 이름)
+        params: build_query_params로 구성한 쿼리 파라미터
+        use_cache: False이면 캐시와 미러를 거치지 않고 요청한 페이지를 업스트림에서 직접 조회
+        
+    Returns:
+        응답 데이터
+    """
+    page_index = int(params["nPageIndex"])
+    count_per_page = int(params["nCountPerPage"])
+    response_type = params["type"]
+    
+    if not use_cache:
+        return await _request_upstream(endpoint, params, response_type, None)
+    
+    if DATA_SOURCE == "mirror" and mirror_store is not None:
+        # 미러 조회(COUNT와 LIKE 검색)는 이벤트 루프를 막지 않도록 스레드에서 실행
+        data = await asyncio.to_thread(_query_mirror, prefix, params)
+        if data is not None:
+            return data
+    
+    if page_index < 1 or not 0 < count_per_page <= MAX_COUNT_PER_PAGE:
+        # 범위를 벗어난 요청은 그대로 전달
+        return await _fetch_cached(endpoint, params, response_type, make_cache_key(prefix, params))
+    
+    start = (page_index - 1) * count_per_page
+    end = start + count_per_page
+    first_block = start // MAX_COUNT_PER_PAGE + 1
+    last_block = (end - 1) // MAX_COUNT_PER_PAGE + 1
+    
+    block_params = []
+    for block in range(first_block, last_block + 1):
+        block_params.append({**params, "nPageIndex": block, "nCountPerPage": MAX_COUNT_PER_PAGE})
+    
+    blocks = await asyncio.gather(*[
+        _fetch_cached(endpoint, bp, response_type, make_cache_key(prefix, bp))
+        for bp in block_params
+    ])
+    
+    if count_per_page == MAX_COUNT_PER_PAGE:
+        return blocks[0]
+    
+    if any("error" in block or not isinstance(block.get("items"), list) for block in blocks):
+        # 오류 응답이 섞였거나 항목 목록을 자를 수 없는 응답이면 요청한 페이지를 그대로 조회
+        # (일부 블록의 오류를 무시하고 자르면 항목이 빠진 페이지를 오류 표시 없이 반환하게 됨)
+        return await _fetch_cached(endpoint, params, response_type, make_cache_key(prefix, params))
+    
+    return _slice_window(blocks, first_block, page_index, count_per_page)
 
 async def fetch_merit_list(
     page_index: int = 1,
@@ -26,7 +493,8 @@ async def fetch_merit_list(
     judge_year: Optional[str] = None,
     hunkuk: Optional[str] = None,
     workout_affil: Optional[str] = None,
-    achivement: Optional[str] = None
+    achivement: Optional[str] = None,
+    use_cache: bool = True
 ) -> Dict[str, Any]:
     """
     독립유공자 공훈록 목록을 조회합니다.
@@ -48,6 +516,7 @@ async def fetch_merit_list(
         hunkuk: 훈격
         workout_affil: 운동계열
         achivement: 공훈록
+        use_cache: False이면 캐시와 로컬 미러를 거치지 않고 업스트림을 직접 조회 (동기화용)
         
     Returns:
         공훈록 목록 정보를 담은 딕셔너리
@@ -55,46 +524,6 @@ async def fetch_merit_list(
     Raises:
         RuntimeError: API 호출 중 오류가 발생한 경우
     """
-    # 캐시 키 생성
-    cache_params = [
-        f"page_{page_index}",
-        f"count_{count_per_page}"
-    ]
-    
-    if mng_no:
-        cache_params.append(f"mng_{mng_no}")
-    if name_ko:
-        cache_params.append(f"name_ko_{name_ko}")
-    if name_ch:
-        cache_params.append(f"name_ch_{name_ch}")
-    if diff_name:
-        cache_params.append(f"diff_{diff_name}")
-    if birthday:
-        cache_params.append(f"birth_{birthday}")
-    if lastday:
-        cache_params.append(f"last_{lastday}")
-    if sex:
-        cache_params.append(f"sex_{sex}")
-    if register_large_div:
-        cache_params.append(f"reg_l_{register_large_div}")
-    if register_mid_div:
-        cache_params.append(f"reg_m_{register_mid_div}")
-    if judge_year:
-        cache_params.append(f"year_{judge_year}")
-    if hunkuk:
-        cache_params.append(f"hunkuk_{hunkuk}")
-    if workout_affil:
-        cache_params.append(f"workout_{workout_affil}")
-    if achivement:
-        cache_params.append(f"achi_{achivement}")
-    
-    cache_key = f"merit_list_{'_'.join(cache_params)}"
-    
-    # 캐시 확인
-    cached_data = cache_manager.get(cache_key)
-    if cached_data:
-        return cached_data
-
     # API 요청 파라미터 구성
     params = build_query_params(
         nPageIndex=page_index,
@@ -115,27 +544,8 @@ async def fetch_merit_list(
         achivement=achivement
     )
     
-    # API 요청
-    endpoint = f"{BASE_URL}/contribuMeritList.do"
-    logger.info(f"공훈록 목록 요청: {endpoint}, 파라미터: {params}")
-    
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(endpoint, params=params)
-            response.raise_for_status()
-            
-            # 응답 형식에 따라 처리
-            if response_type.upper() == "JSON":
-                result = response.json()
-            else:  # XML
-                # XML 응답 파싱
-                result = parse_xml_response(response.text)
-            
-            if "error" not in result:
-                # 캐시 저장
-                cache_manager.set(cache_key, result)
-            
-            return result
+        return await _fetch_page(MERIT_LIST_ENDPOINT, "merit_list", params, use_cache)
     except httpx.TimeoutException:
         logger.error("API 요청 시간 초과")
         raise RuntimeError("API 요청 시간이 초과되었습니다. 잠시 후 다시 시도해주세요.")
@@ -145,6 +555,8 @@ async def fetch_merit_list(
     except httpx.HTTPError as e:
         logger.error(f"HTTP 요청 오류: {str(e)}")
         raise RuntimeError(f"HTTP 요청 오류: {str(e)}")
+    except CircuitOpenError:
+        raise
     except Exception as e:
         logger.error(f"공훈록 목록 조회 중 오류 발생: {str(e)}")
         raise RuntimeError(f"공훈록 목록 조회 중 오류 발생: {str(e)}")
@@ -166,7 +578,8 @@ async def fetch_public_report(
     hunkuk: Optional[str] = None,
     workout_affil: Optional[str] = None,
     achivement: Optional[str] = None,
-    achivement_ko: Optional[str] = None
+    achivement_ko: Optional[str] = None,
+    use_cache: bool = True
 ) -> Dict[str, Any]:
     """
     독립유공자 공적조서를 조회합니다.
@@ -189,6 +602,7 @@ async def fetch_public_report(
         workout_affil: 운동계열
         achivement: 공적개요
         achivement_ko: 공적개요 국한문병기
+        use_cache: False이면 캐시와 로컬 미러를 거치지 않고 업스트림을 직접 조회 (동기화용)
         
     Returns:
         공적조서 정보를 담은 딕셔너리
@@ -196,48 +610,6 @@ async def fetch_public_report(
     Raises:
         RuntimeError: API 호출 중 오류가 발생한 경우
     """
-    # 캐시 키 생성
-    cache_params = [
-        f"page_{page_index}",
-        f"count_{count_per_page}"
-    ]
-    
-    if mng_no:
-        cache_params.append(f"mng_{mng_no}")
-    if name_ko:
-        cache_params.append(f"name_ko_{name_ko}")
-    if name_ch:
-        cache_params.append(f"name_ch_{name_ch}")
-    if diff_name:
-        cache_params.append(f"diff_{diff_name}")
-    if birthday:
-        cache_params.append(f"birth_{birthday}")
-    if lastday:
-        cache_params.append(f"last_{lastday}")
-    if sex:
-        cache_params.append(f"sex_{sex}")
-    if register_large_div:
-        cache_params.append(f"reg_l_{register_large_div}")
-    if register_mid_div:
-        cache_params.append(f"reg_m_{register_mid_div}")
-    if judge_year:
-        cache_params.append(f"year_{judge_year}")
-    if hunkuk:
-        cache_params.append(f"hunkuk_{hunkuk}")
-    if workout_affil:
-        cache_params.append(f"workout_{workout_affil}")
-    if achivement:
-        cache_params.append(f"achi_{achivement}")
-    if achivement_ko:
-        cache_params.append(f"achi_ko_{achivement_ko}")
-    
-    cache_key = f"public_report_{'_'.join(cache_params)}"
-    
-    # 캐시 확인
-    cached_data = cache_manager.get(cache_key)
-    if cached_data:
-        return cached_data
-
     # API 요청 파라미터 구성
     params = build_query_params(
         nPageIndex=page_index,
@@ -259,27 +631,8 @@ async def fetch_public_report(
         achivement_ko=achivement_ko
     )
     
-    # API 요청
-    endpoint = f"{BASE_URL}/publicReportList.do"
-    logger.info(f"공적조서 요청: {endpoint}, 파라미터: {params}")
-    
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(endpoint, params=params)
-            response.raise_for_status()
-            
-            # 응답 형식에 따라 처리
-            if response_type.upper() == "JSON":
-                result = response.json()
-            else:  # XML
-                # XML 응답 파싱
-                result = parse_xml_response(response.text)
-            
-            if "error" not in result:
-                # 캐시 저장
-                cache_manager.set(cache_key, result)
-            
-            return result
+        return await _fetch_page(PUBLIC_REPORT_ENDPOINT, "public_report", params, use_cache)
     except httpx.TimeoutException:
         logger.error("API 요청 시간 초과")
         raise RuntimeError("API 요청 시간이 초과되었습니다. 잠시 후 다시 시도해주세요.")
@@ -289,6 +642,246 @@ async def fetch_public_report(
     except httpx.HTTPError as e:
         logger.error(f"HTTP 요청 오류: {str(e)}")
         raise RuntimeError(f"HTTP 요청 오류: {str(e)}")
+    except CircuitOpenError:
+        raise
     except Exception as e:
         logger.error(f"공적조서 조회 중 오류 발생: {str(e)}")
-        raise RuntimeError(f"공적조서 조회 중 오류 발생: {str(e)}")
\ No newline at end of file
+        raise RuntimeError(f"공적조서 조회 중 오류 발생: {str(e)}")
+
+async def fetch_all_pages(
+    fetch: Callable[..., Awaitable[Dict[str, Any]]],
+    max_results: int,
+    progress_callback: Optional[Callable[[int, int], Awaitable[None]]] = None,
+    concurrency: int = FANOUT_CONCURRENCY,
+    **filters: Any
+) -> Dict[str, Any]:
+    """
+    검색 조건에 맞는 결과를 여러 페이지에 걸쳐 한 번에 조회합니다.
+    첫 페이지로 전체 페이지 수(pageCount)를 확인한 뒤 나머지 페이지를 제한된 동시성으로 조회하고,
+    페이지 순서대로 합치면서 관리번호(mngNo)가 중복된 항목은 제거합니다.
+    
+    Args:
+        fetch: 페이지 조회 함수 (fetch_merit_list/fetch_public_report)
+        max_results: 반환할 최대 항목 수
+        progress_callback: 페이지를 받을 때마다 (받은 페이지 수, 전체 페이지 수)로 호출되는 함수
+        concurrency: 동시에 요청할 최대 페이지 수
+        **filters: 조회 함수에 전달할 검색 조건
+        
+    Returns:
+        totalCount, itemCount, pagesFetched, truncated, items를 담은 딕셔너리
+        
+    Raises:
+        ValueError: max_results가 1보다 작은 경우
+        RuntimeError: API 호출 중 오류가 발생한 경우
+    """
+    if max_results < 1:
+        raise ValueError("max_results는 1 이상이어야 합니다.")
+    
+    first = await fetch(page_index=1, count_per_page=MAX_COUNT_PER_PAGE, **filters)
+    total_count = int(first.get("totalCount") or 0)
+    page_count = int(first.get("pageCount") or math.ceil(total_count / MAX_COUNT_PER_PAGE))
+    pages_needed = max(1, min(page_count, math.ceil(max_results / MAX_COUNT_PER_PAGE)))
+    
+    done = 1
+    if progress_callback is not None:
+        await progress_callback(done, pages_needed)
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def fetch_one(page: int) -> Dict[str, Any]:
+        nonlocal done
+        async with semaphore:
+            data = await fetch(page_index=page, count_per_page=MAX_COUNT_PER_PAGE, **filters)
+        done += 1
+        if progress_callback is not None:
+            await progress_callback(done, pages_needed)
+        return data
+    
+    pages = [first]
+    pages.extend(await asyncio.gather(*[fetch_one(page) for page in range(2, pages_needed + 1)]))
+    
+    # 페이지 순서대로 합치면서 중복 제거
+    items = []
+    seen = set()
+    for page in pages:
+        for item in page.get("items") or []:
+            mng_no = get_item_field(item, "mngNo")
+            if mng_no is not None:
+                if mng_no in seen:
+                    continue
+                seen.add(mng_no)
+            items.append(item)
+    
+    result = {
+        "totalCount": total_count,
+        "itemCount": min(len(items), max_results),
+        "pagesFetched": len(pages),
+        "truncated": total_count > max_results,
+        "items": items[:max_results]
+    }
+    stale = [page["cacheStatus"] for page in pages if "cacheStatus" in page]
+    if stale:
+        result["cacheStatus"] = stale[0]
+    return result
+
+def _pick_item(data: Dict[str, Any], mng_no: str) -> Optional[Dict[str, Any]]:
+    """
+    관리번호 검색 결과에서 해당 관리번호의 항목을 고릅니다.
+    
+    Args:
+        data: 관리번호로 조회한 응답 데이터
+        mng_no: 관리번호
+        
+    Returns:
+        관리번호가 정확히 일치하는 항목, 없으면 None (다른 사람의 항목을 반환하지 않음)
+        
+    Raises:
+        RuntimeError: 응답이 오류인 경우
+    """
+    if "error" in data:
+        raise RuntimeError(data.get("message") or data["error"])
+    items = data.get("items") or []
+    for item in items:
+        if get_item_field(item, "mngNo") == mng_no:
+            return item
+    return None
+
+async def fetch_by_ids(
+    fetch: Callable[..., Awaitable[Dict[str, Any]]],
+    mng_nos: List[str],
+    concurrency: int = BATCH_CONCURRENCY,
+    **filters: Any
+) -> Dict[str, Any]:
+    """
+    여러 관리번호(mngNo)의 항목을 한 번에 조회합니다.
+    중복된 관리번호는 한 번만 조회하고, 관리번호별 조회는 기존 조회 함수를 거치므로
+    캐시나 로컬 미러에 있는 항목은 업스트림을 호출하지 않으며 나머지는 제한된 동시성으로 조회합니다.
+    
+    Args:
+        fetch: 조회 함수 (fetch_merit_list/fetch_public_report)
+        mng_nos: 조회할 관리번호 목록
+        concurrency: 동시에 요청할 최대 관리번호 수
+        **filters: 조회 함수에 전달할 추가 조건 (예: response_type)
+        
+    Returns:
+        requestedCount, uniqueCount, foundCount, errorCount와
+        입력 순서대로 정렬된 관리번호별 결과(results)를 담은 딕셔너리
+    """
+    unique: List[str] = []
+    seen = set()
+    for mng_no in mng_nos:
+        mng_no = str(mng_no).strip()
+        if mng_no and mng_no not in seen:
+            seen.add(mng_no)
+            unique.append(mng_no)
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def fetch_one(mng_no: str) -> Optional[Dict[str, Any]]:
+        async with semaphore:
+            data = await fetch(page_index=1, count_per_page=MAX_COUNT_PER_PAGE, mng_no=mng_no, **filters)
+        return _pick_item(data, mng_no)
+    
+    outcomes = await asyncio.gather(*[fetch_one(mng_no) for mng_no in unique], return_exceptions=True)
+    
+    results = []
+    found = 0
+    errors = 0
+    for mng_no, outcome in zip(unique, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.error(f"관리번호 {mng_no} 조회 실패: {str(outcome)}")
+            results.append({"mngNo": mng_no, "found": False, "error": str(outcome)})
+            errors += 1
+        elif outcome is None:
+            results.append({"mngNo": mng_no, "found": False})
+        else:
+            results.append({"mngNo": mng_no, "found": True, "item": outcome})
+            found += 1
+    
+    return {
+        "requestedCount": len(mng_nos),
+        "uniqueCount": len(unique),
+        "foundCount": found,
+        "errorCount": errors,
+        "results": results
+    }
+
+def _code_text(codes: Dict[str, str], value: Optional[str]) -> Optional[str]:
+    """코드 값을 코드 이름으로 바꿉니다. 코드표에 없으면 값을 그대로 반환합니다."""
+    if value is None:
+        return None
+    return codes.get(value, value)
+
+async def fetch_activist_profile(mng_no: str) -> Dict[str, Any]:
+    """
+    한 독립유공자의 공훈록과 공적조서를 동시에 조회하여 하나의 프로필로 합칩니다.
+    두 조회는 각각의 캐시를 그대로 사용하므로 목록 조회와 캐시를 공유하며,
+    한쪽이 실패해도 나머지 결과와 함께 오류를 반환합니다.
+    
+    Args:
+        mng_no: 관리번호
+        
+    Returns:
+        기본 인적 사항과 훈격/운동계열 코드 이름, 공훈록(merit)과 공적조서(publicReport) 항목,
+        부분 실패 시 errors를 담은 딕셔너리
+        
+    Raises:
+        RuntimeError: 두 조회가 모두 실패한 경우
+    """
+    mng_no = mng_no.strip()
+    merit_result, report_result = await asyncio.gather(
+        fetch_merit_list(page_index=1, count_per_page=MAX_COUNT_PER_PAGE, mng_no=mng_no),
+        fetch_public_report(page_index=1, count_per_page=MAX_COUNT_PER_PAGE, mng_no=mng_no),
+        return_exceptions=True
+    )
+    
+    errors = {}
+    records: Dict[str, Optional[Dict[str, Any]]] = {}
+    for name, result in (("merit", merit_result), ("publicReport", report_result)):
+        try:
+            if isinstance(result, BaseException):
+                raise result
+            records[name] = _pick_item(result, mng_no)
+        except Exception as e:
+            logger.error(f"관리번호 {mng_no} 프로필 조회 실패 ({name}): {str(e)}")
+            errors[name] = str(e)
+            records[name] = None
+    
+    if len(errors) == 2:
+        raise RuntimeError(
+            f"프로필 조회 중 오류 발생: 공훈록 - {errors['merit']}, 공적조서 - {errors['publicReport']}"
+        )
+    
+    # 공훈록 항목을 우선으로 기본 인적 사항을 채움
+    def field(name: str) -> Optional[str]:
+        for record in (records["merit"], records["publicReport"]):
+            if record is not None:
+                value = get_item_field(record, name)
+                if value is not None:
+                    return value
+        return None
+    
+    hunkuk = field("hunkuk")
+    workout_affil = field("workoutAffil")
+    sex = field("sex")
+    profile = {
+        "mngNo": mng_no,
+        "found": records["merit"] is not None or records["publicReport"] is not None,
+        "nameKo": field("nameKo"),
+        "nameCh": field("nameCh"),
+        "diffName": field("diffName"),
+        "birthday": field("birthday"),
+        "lastday": field("lastday"),
+        "sex": sex,
+        "sexText": _code_text(SEX_CODES, sex),
+        "judgeYear": field("judgeYear"),
+        "hunkuk": hunkuk,
+        "hunkukText": _code_text(HUNKUK_CODES, hunkuk),
+        "workoutAffil": workout_affil,
+        "workoutAffilText": _code_text(WORKOUT_AFFIL_CODES, workout_affil),
+        "merit": records["merit"],
+        "publicReport": records["publicReport"],
+    }
+    if errors:
+        profile["errors"] = errors
+    return profile
@@ -2,74 +2,461 @@
 독립유공자 공훈록 MCP 서버 - 캐시 모듈
 
 이 모듈은 API 응답 데이터의 캐싱을 담당합니다.
+메모리 캐시 아래에 2차 캐시 저장소(CacheBackend)를 둘 수 있으며, 저장소를 여러 서버 프로세스가
+함께 쓰면(CACHE_SHARED=true) 다른 프로세스가 저장한 항목도 메모리 캐시로 올려 사용합니다.
+비동기 코드는 lookup_async/set_async를 사용해 2차 캐시 저장소 입출력을 스레드에서 실행합니다.
 """
 
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
-from .config import logger
+import asyncio
+import heapq
+import itertools
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+from .config import (
+    logger,
+    CACHE_TIMEOUT_MINUTES,
+    CACHE_MAX_ENTRIES,
+    CACHE_MAX_BYTES,
+    CACHE_SWEEP_INTERVAL,
+    CACHE_STALE_TIMEOUT_MINUTES,
+    CACHE_DB_PATH,
+    CACHE_SHARED,
+)
+from .cache_backend import CacheBackend
+from .disk_cache import DiskCache
+
+def estimate_size(obj: Any) -> int:
+    """
+    객체가 차지하는 메모리 크기를 대략적으로 계산합니다.
+
+    Args:
+        obj: 크기를 계산할 객체 (JSON 호환 자료형)
+
+    Returns:
+        추정 바이트 크기
+    """
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += sys.getsizeof(key) + estimate_size(value)
+    elif isinstance(obj, (list, tuple)):
+        for value in obj:
+            size += estimate_size(value)
+    return size
+
+class CacheEntry:
+    """캐시 항목 하나를 나타내는 클래스"""
+
+    __slots__ = ("data", "stored_at", "fresh_until", "expires_at", "size")
+
+    def __init__(
+        self,
+        data: Union[Dict[str, Any], str],
+        stored_at: float,
+        fresh_until: float,
+        expires_at: float,
+        size: int
+    ):
+        self.data = data
+        self.stored_at = stored_at
+        self.fresh_until = fresh_until
+        self.expires_at = expires_at
+        self.size = size
 
 class CacheManager:
-    """API 응답 데이터를 캐싱하는 클래스"""
-    
-    def __init__(self, timeout_minutes: int = 30):
+    """API 응답 데이터를 캐싱하는 클래스 (LRU 제거, 항목 수/바이트 상한, 만료 항목 정리)"""
+
+    def __init__(
+        self,
+        timeout_minutes: int = CACHE_TIMEOUT_MINUTES,
+        stale_timeout_minutes: int = CACHE_STALE_TIMEOUT_MINUTES,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        max_bytes: int = CACHE_MAX_BYTES,
+        sweep_interval: float = CACHE_SWEEP_INTERVAL,
+        backend: Optional[CacheBackend] = None
+    ):
         """
         캐시 매니저를 초기화합니다.
-        
+
         Args:
-            timeout_minutes: 캐시 만료 시간(분)
+            timeout_minutes: 캐시 만료 시간(분), 이후에는 오래된 데이터로 취급 (soft TTL)
+            stale_timeout_minutes: 오래된 데이터를 보관하는 최대 시간(분) (hard TTL)
+            max_entries: 최대 캐시 항목 수
+            max_bytes: 최대 캐시 크기(추정 바이트)
+            sweep_interval: 만료 항목 정리 주기(초)
+            backend: 메모리 캐시 아래에 둘 2차 캐시 저장소 (없으면 메모리만 사용)
         """
-        self.timeout = timedelta(minutes=timeout_minutes)
-        self.last_cache_time = {}
-        self.cache_data = {}
-    
+        self.timeout = timeout_minutes * 60.0
+        self.stale_timeout = max(stale_timeout_minutes * 60.0, self.timeout)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+        self.backend = backend
+        # 최근 사용 순서(LRU)로 정렬된 항목
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        # 최종 만료 시각 순 힙 (만료 시각, 순번, 키, 항목)
+        # 데이터(hard TTL), 응답 문자열(soft TTL), 저장소에서 올라온 항목의 만료 시간이 서로 다르므로
+        # 저장 순서가 아닌 만료 시각으로 정렬하며, 덮어쓰거나 제거된 항목은 꺼낼 때 건너뜀
+        self._expiry_heap: List[Tuple[float, int, str, CacheEntry]] = []
+        self._expiry_seq = itertools.count()
+        self.total_bytes = 0
+        self._next_sweep = time.monotonic() + sweep_interval
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.stale_hits = 0
+        self.disk_hits = 0
+        self.text_hits = 0
+        self.shared_hits = 0
+
     def get(self, key: str) -> Optional[Dict[str, Any]]:
         """
-        캐시에서 데이터를 가져옵니다.
-        
+        캐시에서 신선한 데이터를 가져옵니다.
+
         Args:
             key: 캐시 키
-            
+
         Returns:
             캐시된 데이터, 없거나 만료된 경우 None
         """
-        now = datetime.now()
-        if (key in self.cache_data and
-            key in self.last_cache_time and
-            now - self.last_cache_time[key] <= self.timeout):
-            logger.debug(f"캐시된 데이터를 반환합니다: {key}")
-            return self.cache_data[key]
-        return None
-    
+        data, stale, _ = self.lookup(key)
+        return None if stale else data
+
+    def lookup(self, key: str) -> Tuple[Optional[Dict[str, Any]], bool, float]:
+        """
+        캐시에서 데이터를 가져오며, soft TTL이 지났지만 hard TTL 이내인 오래된 데이터도 반환합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            (캐시된 데이터, 오래된 데이터 여부, 저장 후 경과 시간(초)) 튜플,
+            없거나 hard TTL이 지난 경우 데이터는 None
+        """
+        now = time.monotonic()
+        entry = self._memory_entry(key, now)
+        if entry is not None:
+            return self._lookup_result(key, entry, now)
+        found = self.backend.get(key) if self.backend is not None else None
+        return self._backend_result(key, found)
+
+    async def lookup_async(self, key: str) -> Tuple[Optional[Dict[str, Any]], bool, float]:
+        """
+        lookup과 같지만 메모리에 없는 항목은 2차 캐시 저장소를 스레드에서 조회합니다.
+        공유 저장소가 다른 프로세스의 쓰기로 잠겨 있어도 이벤트 루프가 멈추지 않습니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            (캐시된 데이터, 오래된 데이터 여부, 저장 후 경과 시간(초)) 튜플,
+            없거나 hard TTL이 지난 경우 데이터는 None
+        """
+        now = time.monotonic()
+        entry = self._memory_entry(key, now)
+        if entry is not None:
+            return self._lookup_result(key, entry, now)
+        found = await asyncio.to_thread(self.backend.get, key) if self.backend is not None else None
+        return self._backend_result(key, found)
+
+    def _memory_entry(self, key: str, now: float) -> Optional[CacheEntry]:
+        """메모리 캐시에서 hard TTL 이내의 항목을 찾습니다."""
+        self._maybe_sweep(now)
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= now:
+            # 지연 만료: 조회 시점에 만료된 항목 제거
+            self._delete(key)
+            self.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _backend_result(
+        self,
+        key: str,
+        found: Optional[Tuple[Dict[str, Any], float, float, float]]
+    ) -> Tuple[Optional[Dict[str, Any]], bool, float]:
+        """2차 캐시 저장소 조회 결과를 메모리로 올리고 lookup 결과로 변환합니다."""
+        now = time.monotonic()
+        entry = self._promote(key, found, now)
+        if entry is None:
+            self.misses += 1
+            return None, False, 0.0
+        self.disk_hits += 1
+        return self._lookup_result(key, entry, now)
+
+    def _lookup_result(self, key: str, entry: CacheEntry, now: float) -> Tuple[Dict[str, Any], bool, float]:
+        """찾은 항목을 신선도에 따라 lookup 결과로 변환하고 통계를 갱신합니다."""
+        if entry.fresh_until <= now:
+            self.stale_hits += 1
+            logger.debug(f"오래된 캐시 데이터를 찾았습니다: {key}")
+            return entry.data, True, now - entry.stored_at
+
+        self.hits += 1
+        logger.debug(f"캐시된 데이터를 반환합니다: {key}")
+        return entry.data, False, now - entry.stored_at
+
     def set(self, key: str, data: Dict[str, Any]) -> None:
         """
-        캐시에 데이터를 저장합니다.
-        
+        캐시에 데이터를 저장합니다. 2차 캐시 저장소가 있으면 함께 저장합니다.
+
+        Args:
+            key: 캐시 키
+            data: 저장할 데이터
+        """
+        if self.backend is not None:
+            self.backend.set(key, data, self.timeout)
+        self._set_fresh(key, data)
+
+    async def set_async(self, key: str, data: Dict[str, Any]) -> None:
+        """
+        set과 같지만 2차 캐시 저장소 저장은 스레드에서 실행합니다.
+        메모리 캐시에는 먼저 저장하므로 같은 프로세스의 다음 조회는 저장소 쓰기를 기다리지 않습니다.
+
         Args:
             key: 캐시 키
             data: 저장할 데이터
         """
-        self.cache_data[key] = data
-        self.last_cache_time[key] = datetime.now()
+        self._set_fresh(key, data)
+        if self.backend is not None:
+            await asyncio.to_thread(self.backend.set, key, data, self.timeout)
+
+    def _set_fresh(self, key: str, data: Dict[str, Any]) -> None:
+        """방금 가져온 데이터를 메모리 캐시에 저장합니다."""
+        now = time.monotonic()
+        self._set_memory(key, CacheEntry(
+            data, now, now + self.timeout, now + self.stale_timeout, estimate_size(data)
+        ))
+
+    def _set_memory(self, key: str, entry: CacheEntry) -> None:
+        """메모리 캐시에 항목을 저장합니다."""
+        self._maybe_sweep(time.monotonic())
+
+        if entry.size > self.max_bytes:
+            logger.debug(f"캐시 상한보다 큰 데이터는 저장하지 않습니다: {key} ({entry.size} bytes)")
+            if key in self._entries:
+                self._delete(key)
+            return
+
+        if key in self._entries:
+            self._delete(key)
+
+        self._entries[key] = entry
+        heapq.heappush(self._expiry_heap, (entry.expires_at, next(self._expiry_seq), key, entry))
+        if len(self._expiry_heap) > 2 * len(self._entries) + 64:
+            self._rebuild_expiry_heap()
+        self.total_bytes += entry.size
+        self._evict()
         logger.debug(f"데이터가 캐시되었습니다: {key}")
-    
+
+    def get_text(self, key: str) -> Optional[str]:
+        """
+        직렬화된 응답 문자열을 메모리 캐시에서 가져옵니다.
+        오래된 응답을 그대로 돌려주지 않도록 신선한 동안만 반환하며, 디스크 캐시는 조회하지 않습니다.
+
+        Args:
+            key: 응답 캐시 키 (조회 조건, 필드 선택, 출력 형식 포함)
+
+        Returns:
+            직렬화된 응답 문자열, 없거나 만료된 경우 None
+        """
+        now = time.monotonic()
+        self._maybe_sweep(now)
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.fresh_until <= now:
+            self._delete(key)
+            self.expirations += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.text_hits += 1
+        logger.debug(f"캐시된 응답 문자열을 반환합니다: {key}")
+        return entry.data
+
+    def set_text(self, key: str, text: str) -> None:
+        """
+        직렬화된 응답 문자열을 메모리 캐시에 저장합니다. 크기는 캐시 바이트 상한에 포함됩니다.
+
+        Args:
+            key: 응답 캐시 키 (조회 조건, 필드 선택, 출력 형식 포함)
+            text: 직렬화된 응답 문자열
+        """
+        now = time.monotonic()
+        self._set_memory(key, CacheEntry(
+            text, now, now + self.timeout, now + self.timeout, sys.getsizeof(text)
+        ))
+
     def clear(self) -> None:
         """모든 캐시를 초기화합니다."""
-        self.last_cache_time.clear()
-        self.cache_data.clear()
+        self._entries.clear()
+        self._expiry_heap.clear()
+        self.total_bytes = 0
+        if self.backend is not None:
+            self.backend.clear()
         logger.info("캐시가 초기화되었습니다.")
-    
+
     def remove(self, key: str) -> None:
         """
         특정 키의 캐시를 제거합니다.
-        
+
         Args:
             key: 제거할 캐시 키
         """
-        if key in self.cache_data:
-            del self.cache_data[key]
-        if key in self.last_cache_time:
-            del self.last_cache_time[key]
+        if key in self._entries:
+            self._delete(key)
+        if self.backend is not None:
+            self.backend.remove(key)
         logger.debug(f"캐시가 제거되었습니다: {key}")
 
+    def sweep_expired(self) -> int:
+        """
+        만료된 항목을 모두 제거합니다.
+        만료 시각 순 힙에서 꺼내므로 만료되지 않은 첫 항목에서 멈춥니다.
+
+        Returns:
+            제거된 항목 수
+        """
+        now = time.monotonic()
+        removed = 0
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, _, key, entry = heapq.heappop(self._expiry_heap)
+            if self._entries.get(key) is entry:
+                self._delete(key)
+                removed += 1
+
+        self.expirations += removed
+        self._next_sweep = now + self.sweep_interval
+        if removed:
+            logger.debug(f"만료된 캐시 {removed}건을 정리했습니다.")
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            항목 수, 추정 바이트, 적중/미스/제거 횟수를 담은 딕셔너리
+        """
+        return {
+            "entries": len(self._entries),
+            "bytes": self.total_bytes,
+            "maxEntries": self.max_entries,
+            "maxBytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "staleHits": self.stale_hits,
+            "diskHits": self.disk_hits,
+            "textHits": self.text_hits,
+            "sharedHits": self.shared_hits,
+            "backend": self.backend.stats() if self.backend is not None else None,
+        }
+
+    def close(self) -> None:
+        """2차 캐시 저장소 연결을 닫습니다."""
+        if self.backend is not None:
+            self.backend.close()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def load_shared(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        다른 프로세스가 공유 저장소에 저장한 신선한 데이터를 찾아 메모리 캐시로 올립니다.
+        다른 프로세스의 업스트림 요청이 끝나기를 기다리는 동안 사용하며, 적중/미스 통계에는 포함하지 않습니다.
+        저장소 조회는 스레드에서 실행합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            신선한 데이터, 아직 저장되지 않았으면 None
+        """
+        if self.backend is None:
+            return None
+        found = await asyncio.to_thread(self.backend.get, key)
+        now = time.monotonic()
+        entry = self._promote(key, found, now)
+        if entry is None or entry.fresh_until <= now:
+            return None
+        self.shared_hits += 1
+        logger.debug(f"다른 프로세스가 가져온 데이터를 사용합니다: {key}")
+        return entry.data
+
+    def _promote(
+        self,
+        key: str,
+        found: Optional[Tuple[Dict[str, Any], float, float, float]],
+        now: float
+    ) -> Optional[CacheEntry]:
+        """2차 캐시 저장소에서 찾은 항목을 메모리로 올립니다."""
+        if found is None:
+            return None
+
+        # 저장소의 벽시계 기준 시각을 단조 시계 기준으로 변환
+        data, stored_at, fresh_until, expires_at = found
+        offset = now - time.time()
+        entry = CacheEntry(
+            data,
+            stored_at + offset,
+            fresh_until + offset,
+            min(expires_at + offset, now + self.stale_timeout),
+            estimate_size(data)
+        )
+        self._set_memory(key, entry)
+        return entry
+
+    def _maybe_sweep(self, now: float) -> None:
+        """정리 주기가 지났으면 만료 항목을 정리합니다."""
+        if now >= self._next_sweep:
+            self.sweep_expired()
+
+    def _evict(self) -> None:
+        """항목 수나 바이트 상한을 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다."""
+        while self._entries and (
+            len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes
+        ):
+            key = next(iter(self._entries))
+            self._delete(key)
+            self.evictions += 1
+            logger.debug(f"캐시 상한 초과로 항목을 제거했습니다: {key}")
+
+    def _rebuild_expiry_heap(self) -> None:
+        """덮어쓰거나 제거된 항목이 쌓인 힙을 현재 항목으로 다시 만듭니다."""
+        self._expiry_heap = [
+            (entry.expires_at, next(self._expiry_seq), key, entry) for key, entry in self._entries.items()
+        ]
+        heapq.heapify(self._expiry_heap)
+
+    def _delete(self, key: str) -> None:
+        """항목을 제거하고 바이트 합계를 갱신합니다 (만료 힙에 남은 항목은 정리할 때 건너뜀)."""
+        entry = self._entries.pop(key)
+        self.total_bytes -= entry.size
+
+def create_backend() -> Optional[CacheBackend]:
+    """
+    설정에 따라 2차 캐시 저장소를 만듭니다.
+
+    Returns:
+        CACHE_DB_PATH를 지정한 경우 SQLite 저장소 (CACHE_SHARED이면 프로세스 간 공유), 아니면 None
+    """
+    if not CACHE_DB_PATH:
+        if CACHE_SHARED:
+            logger.warning("CACHE_SHARED를 사용하려면 CACHE_DB_PATH를 지정해야 합니다. 메모리 캐시만 사용합니다.")
+        return None
+    return DiskCache(CACHE_DB_PATH, shared=CACHE_SHARED)
+
 # 캐시 매니저 인스턴스 생성
-cache_manager = CacheManager()
\ No newline at end of file
+cache_manager = CacheManager(backend=create_backend())
@@ -0,0 +1,89 @@
+"""
+독립유공자 공훈록 MCP 서버 - 캐시 저장소 인터페이스 모듈
+
+이 모듈은 CacheManager의 메모리 캐시 아래에 두는 2차 캐시 저장소의 인터페이스를 정의합니다.
+저장소는 벽시계(time.time) 기준 만료 시각으로 데이터를 보관하며, 여러 서버 프로세스가 함께 쓰는
+저장소는 같은 키를 한 프로세스만 업스트림에서 가져오도록 임대(lease)를 제공합니다.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple
+
+class CacheBackend(ABC):
+    """CacheManager가 사용하는 2차 캐시 저장소의 기본 클래스"""
+
+    # 다른 프로세스와 함께 쓰는 저장소인지 여부 (True이면 임대로 진행 중인 요청을 프로세스 간에 합침)
+    shared = False
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Tuple[Dict[str, Any], float, float, float]]:
+        """
+        저장소에서 데이터를 가져옵니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            (캐시된 데이터, 저장 시각, 신선 만료 시각, 최종 만료 시각) 튜플(시각은 time.time 기준),
+            없거나 최종 만료된 경우 None
+        """
+
+    @abstractmethod
+    def set(self, key: str, data: Dict[str, Any], fresh_ttl: float) -> None:
+        """
+        저장소에 데이터를 저장합니다.
+
+        Args:
+            key: 캐시 키
+            data: 저장할 데이터
+            fresh_ttl: 데이터를 신선하게 취급할 시간(초)
+        """
+
+    @abstractmethod
+    def remove(self, key: str) -> None:
+        """
+        특정 키의 데이터를 제거합니다.
+
+        Args:
+            key: 제거할 캐시 키
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """모든 데이터를 제거합니다."""
+
+    def acquire_lease(self, key: str, ttl: float) -> Optional[str]:
+        """
+        키를 업스트림에서 가져올 권한(임대)을 얻습니다.
+        다른 프로세스가 임대 중이면 None을 반환하며, 임대는 ttl이 지나면 자동으로 풀립니다
+        (임대한 프로세스가 비정상 종료된 경우 대비). 공유하지 않는 저장소는 항상 임대를 허용합니다.
+
+        Args:
+            key: 캐시 키
+            ttl: 임대 유지 시간(초)
+
+        Returns:
+            release_lease에 전달할 임대 토큰, 다른 프로세스가 임대 중이면 None
+        """
+        return ""
+
+    def release_lease(self, key: str, token: str) -> None:
+        """
+        acquire_lease로 얻은 임대를 반환합니다.
+
+        Args:
+            key: 캐시 키
+            token: acquire_lease가 반환한 임대 토큰
+        """
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        저장소 통계를 반환합니다.
+
+        Returns:
+            저장소 종류와 항목 수 등을 담은 딕셔너리
+        """
+        return {}
+
+    def close(self) -> None:
+        """저장소 연결을 닫습니다."""
@@ -0,0 +1,105 @@
+"""
+독립유공자 공훈록 MCP 서버 - HTTP 클라이언트 모듈
+
+이 모듈은 모든 업스트림 API 호출이 공유하는 HTTP 클라이언트를 관리합니다.
+"""
+
+import asyncio
+from typing import Optional
+import httpx
+from .config import (
+    logger,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP2_ENABLED,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_READ_TIMEOUT,
+    HTTP_WRITE_TIMEOUT,
+    HTTP_POOL_TIMEOUT,
+)
+
+class HttpClientManager:
+    """프로세스 전역에서 공유하는 커넥션 풀 기반 HTTP 클라이언트를 관리하는 클래스"""
+
+    def __init__(
+        self,
+        max_connections: int = HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections: int = HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = HTTP_KEEPALIVE_EXPIRY,
+        http2: bool = HTTP2_ENABLED,
+    ):
+        """
+        HTTP 클라이언트 매니저를 초기화합니다.
+
+        Args:
+            max_connections: 최대 동시 연결 수
+            max_keepalive_connections: 유지할 최대 keep-alive 연결 수
+            keepalive_expiry: keep-alive 연결 유지 시간(초)
+            http2: HTTP/2 사용 여부 (h2 패키지가 필요합니다)
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = httpx.Timeout(
+            connect=HTTP_CONNECT_TIMEOUT,
+            read=HTTP_READ_TIMEOUT,
+            write=HTTP_WRITE_TIMEOUT,
+            pool=HTTP_POOL_TIMEOUT,
+        )
+        self.http2 = http2
+        self._client: Optional[httpx.AsyncClient] = None
+        self._start_lock = asyncio.Lock()
+
+    def _http2_available(self) -> bool:
+        """HTTP/2 사용에 필요한 h2 패키지가 설치되어 있는지 확인합니다."""
+        try:
+            import h2  # noqa: F401
+            return True
+        except ImportError:
+            logger.warning("h2 패키지가 설치되어 있지 않아 HTTP/1.1을 사용합니다.")
+            return False
+
+    async def start(self) -> httpx.AsyncClient:
+        """
+        공유 HTTP 클라이언트를 생성합니다. 이미 생성된 경우 기존 클라이언트를 반환합니다.
+
+        Returns:
+            공유 HTTP 클라이언트
+        """
+        async with self._start_lock:
+            if self._client is None or self._client.is_closed:
+                # 클라이언트 생성(SSL 인증서 로드)은 100ms 이상 걸리므로 이벤트 루프를 막지 않도록 스레드에서 실행
+                self._client = await asyncio.to_thread(
+                    httpx.AsyncClient,
+                    limits=self.limits,
+                    timeout=self.timeout,
+                    http2=self.http2 and self._http2_available(),
+                )
+                logger.info("공유 HTTP 클라이언트가 생성되었습니다.")
+        return self._client
+
+    async def close(self) -> None:
+        """공유 HTTP 클라이언트를 종료하고 커넥션 풀을 정리합니다. 생성 중이면 생성이 끝난 뒤 종료합니다."""
+        async with self._start_lock:
+            if self._client is not None and not self._client.is_closed:
+                await self._client.aclose()
+                logger.info("공유 HTTP 클라이언트가 종료되었습니다.")
+            self._client = None
+
+    async def get_client(self) -> httpx.AsyncClient:
+        """
+        공유 HTTP 클라이언트를 반환합니다.
+        서버 수명주기 밖에서 호출된 경우(예: 라이브러리로 사용) 클라이언트를 지연 생성합니다.
+
+        Returns:
+            공유 HTTP 클라이언트
+        """
+        if self._client is None or self._client.is_closed:
+            return await self.start()
+        return self._client
+
+# HTTP 클라이언트 매니저 인스턴스 생성
+http_client_manager = HttpClientManager()
@@ -8,23 +8,158 @@ import os
 import logging
 from dotenv import load_dotenv
 from mcp.server import Server
+from .logs import setup_logging, SamplingFilter
 
 # 환경 변수 로드
 load_dotenv()
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("gonghun_api.log"),
-        logging.StreamHandler()
-    ]
-)
+# 로깅 설정 (메시지 형식화와 파일 쓰기는 백그라운드 스레드에서 처리)
+# LOG_FILE: 로그 파일 경로 (비워두면 표준 오류 출력에만 기록)
+# LOG_MAX_BYTES/LOG_BACKUPS: 로그 파일 순환 크기와 보관할 이전 파일 수
+# LOG_PAYLOAD_MAX_CHARS: 도구 인수/응답 등 큰 값을 로그에 남길 때의 최대 길이
+# LOG_REQUEST_SAMPLE_RATE: 도구 호출/업스트림 요청 로그를 남길 비율 (0~1, 경고 이상은 항상 기록)
+LOG_FILE = os.getenv("LOG_FILE", "gonghun_api.log")
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+LOG_BACKUPS = int(os.getenv("LOG_BACKUPS", "5"))
+LOG_PAYLOAD_MAX_CHARS = int(os.getenv("LOG_PAYLOAD_MAX_CHARS", "2000"))
+LOG_REQUEST_SAMPLE_RATE = float(os.getenv("LOG_REQUEST_SAMPLE_RATE", "1.0"))
+
+setup_logging(logging.INFO, LOG_FILE, LOG_MAX_BYTES, LOG_BACKUPS, LOG_PAYLOAD_MAX_CHARS)
 logger = logging.getLogger("gonghun-server")
+# 요청마다 남는 로그용 로거 (LOG_REQUEST_SAMPLE_RATE 비율만 기록)
+request_sampling_filter = SamplingFilter(LOG_REQUEST_SAMPLE_RATE)
+request_logger = logging.getLogger("gonghun-server.requests")
+request_logger.addFilter(request_sampling_filter)
+# httpx도 요청마다 INFO 로그를 남기므로 같은 비율로 기록
+logging.getLogger("httpx").addFilter(request_sampling_filter)
+
+# MCP 전송 설정
+# MCP_TRANSPORT: stdio(클라이언트마다 프로세스 하나) 또는 sse(하나의 HTTP 서버가 여러 세션을 처리)
+# MCP_SESSION_MAX_CONCURRENCY: 세션 하나가 동시에 실행할 수 있는 도구 호출 수 (0이면 제한 없음)
+# MCP_MAX_SESSIONS: 동시에 연결할 수 있는 세션 수 (0이면 제한 없음)
+# MCP_SHUTDOWN_GRACE_PERIOD: 종료 시 진행 중인 도구 호출을 기다리는 최대 시간(초)
+MCP_TRANSPORT = os.getenv("MCP_TRANSPORT", "stdio").lower()
+MCP_HTTP_HOST = os.getenv("MCP_HTTP_HOST", "127.0.0.1")
+MCP_HTTP_PORT = int(os.getenv("MCP_HTTP_PORT", "8000"))
+MCP_SESSION_MAX_CONCURRENCY = int(os.getenv("MCP_SESSION_MAX_CONCURRENCY", "4"))
+MCP_MAX_SESSIONS = int(os.getenv("MCP_MAX_SESSIONS", "100"))
+MCP_SHUTDOWN_GRACE_PERIOD = float(os.getenv("MCP_SHUTDOWN_GRACE_PERIOD", "10.0"))
 
 # API 설정
 BASE_URL = os.getenv("BASE_URL", "https://e-gonghun.mpva.go.kr/opnAPI")
+MERIT_LIST_ENDPOINT = f"{BASE_URL}/contribuMeritList.do"
+PUBLIC_REPORT_ENDPOINT = f"{BASE_URL}/publicReportList.do"
+
+# 업스트림 API가 허용하는 페이지 당 최대 데이터 건수
+MAX_COUNT_PER_PAGE = 50
+
+# 여러 페이지 동시 조회(max_results) 설정
+FANOUT_CONCURRENCY = int(os.getenv("FANOUT_CONCURRENCY", "4"))
+FANOUT_MAX_RESULTS = int(os.getenv("FANOUT_MAX_RESULTS", "2000"))
+
+# 여러 관리번호 일괄 조회(get_merits_by_ids) 설정
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "8"))
+BATCH_MAX_IDS = int(os.getenv("BATCH_MAX_IDS", "500"))
+
+# HTTP 클라이언트 설정
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "10"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30.0"))
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "false").lower() in ("1", "true", "yes")
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5.0"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "30.0"))
+HTTP_WRITE_TIMEOUT = float(os.getenv("HTTP_WRITE_TIMEOUT", "10.0"))
+HTTP_POOL_TIMEOUT = float(os.getenv("HTTP_POOL_TIMEOUT", "5.0"))
+
+# 업스트림 호출 제한 설정 (프로세스 전체)
+# 초당 요청 수(토큰 버킷, 0이면 제한 없음)와 동시 요청 수(AIMD 방식으로 목표 응답 시간에 맞춰 조정)
+UPSTREAM_RATE_LIMIT = float(os.getenv("UPSTREAM_RATE_LIMIT", "10.0"))
+UPSTREAM_RATE_BURST = int(os.getenv("UPSTREAM_RATE_BURST", "20"))
+UPSTREAM_CONCURRENCY_INITIAL = int(os.getenv("UPSTREAM_CONCURRENCY_INITIAL", "8"))
+UPSTREAM_CONCURRENCY_MIN = int(os.getenv("UPSTREAM_CONCURRENCY_MIN", "1"))
+UPSTREAM_CONCURRENCY_MAX = int(os.getenv("UPSTREAM_CONCURRENCY_MAX", str(HTTP_MAX_CONNECTIONS)))
+UPSTREAM_LATENCY_TARGET = float(os.getenv("UPSTREAM_LATENCY_TARGET", "2.0"))
+
+# 업스트림 장애 대응 설정
+# 일시적인 오류(시간 초과, 연결 오류, 429/5xx)는 지수 백오프(jitter 포함)로 재시도
+UPSTREAM_RETRIES = int(os.getenv("UPSTREAM_RETRIES", "2"))
+UPSTREAM_RETRY_BASE_DELAY = float(os.getenv("UPSTREAM_RETRY_BASE_DELAY", "0.2"))
+UPSTREAM_RETRY_MAX_DELAY = float(os.getenv("UPSTREAM_RETRY_MAX_DELAY", "2.0"))
+# 연속 실패가 기준을 넘으면 일정 시간 동안 요청을 보내지 않고 즉시 실패(오래된 캐시가 있으면 대신 반환)
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+CIRCUIT_RESET_TIMEOUT = float(os.getenv("CIRCUIT_RESET_TIMEOUT", "30.0"))
+# 헤지 요청: 응답이 최근 응답 시간의 분위수(기본 p95)보다 늦으면 같은 요청을 한 번 더 보내 먼저 온 응답을 사용
+HEDGE_ENABLED = os.getenv("HEDGE_ENABLED", "false").lower() in ("1", "true", "yes")
+HEDGE_QUANTILE = float(os.getenv("HEDGE_QUANTILE", "0.95"))
+HEDGE_MIN_DELAY = float(os.getenv("HEDGE_MIN_DELAY", "0.5"))
+
+# 응답 직렬화 설정
+# RESPONSE_FORMAT: pretty(들여쓰기) 또는 compact(공백 없음)
+# JSON_BACKEND: auto(orjson이 설치되어 있으면 사용), orjson, json
+RESPONSE_FORMAT = os.getenv("RESPONSE_FORMAT", "pretty").lower()
+JSON_BACKEND = os.getenv("JSON_BACKEND", "auto").lower()
+
+# 페이지 리소스(gonghun://merit/page/{n} 등)의 페이지 당 데이터 건수 (최대 MAX_COUNT_PER_PAGE)
+RESOURCE_PAGE_SIZE = min(int(os.getenv("RESOURCE_PAGE_SIZE", "10")), MAX_COUNT_PER_PAGE)
+
+# 캐시 설정
+CACHE_TIMEOUT_MINUTES = int(os.getenv("CACHE_TIMEOUT_MINUTES", "30"))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "1000"))
+CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+CACHE_SWEEP_INTERVAL = float(os.getenv("CACHE_SWEEP_INTERVAL", "60.0"))
+# 만료(soft TTL) 이후에도 오래된 데이터를 보관하는 시간(hard TTL)과 사용 방식
+# revalidate: 오래된 데이터를 즉시 반환하고 백그라운드에서 갱신
+# on_error: 업스트림 호출이 실패한 경우에만 오래된 데이터를 반환
+# off: 오래된 데이터를 사용하지 않음
+CACHE_STALE_TIMEOUT_MINUTES = int(os.getenv("CACHE_STALE_TIMEOUT_MINUTES", "1440"))
+CACHE_STALE_MODE = os.getenv("CACHE_STALE_MODE", "revalidate").lower()
+# 직렬화된 도구 응답 문자열도 함께 캐시할지 여부 (조회 조건, 필드 선택, 출력 형식별)
+CACHE_RESPONSE_TEXT = os.getenv("CACHE_RESPONSE_TEXT", "true").lower() in ("1", "true", "yes")
+
+# 디스크 캐시 설정 (경로를 지정하지 않으면 사용하지 않음)
+CACHE_DB_PATH = os.getenv("CACHE_DB_PATH", "")
+CACHE_DB_TIMEOUT_MINUTES = int(os.getenv("CACHE_DB_TIMEOUT_MINUTES", "1440"))
+CACHE_DB_MAX_BYTES = int(os.getenv("CACHE_DB_MAX_BYTES", str(256 * 1024 * 1024)))
+CACHE_DB_COMPACT_INTERVAL = float(os.getenv("CACHE_DB_COMPACT_INTERVAL", "600.0"))
+# 같은 호스트의 여러 서버 프로세스가 디스크 캐시 파일을 함께 쓰는지 여부
+# (서로 저장한 항목을 보고, 같은 키는 한 프로세스만 업스트림에서 가져오며 나머지는 결과를 기다림)
+CACHE_SHARED = os.getenv("CACHE_SHARED", "false").lower() in ("1", "true", "yes")
+# 업스트림 요청 임대 유지 시간(초)과 다른 프로세스의 결과를 확인하는 간격(초)
+CACHE_LEASE_TIMEOUT = float(os.getenv("CACHE_LEASE_TIMEOUT", "30.0"))
+CACHE_LEASE_POLL_INTERVAL = float(os.getenv("CACHE_LEASE_POLL_INTERVAL", "0.05"))
+
+# 로컬 미러 설정 (경로를 지정하지 않으면 사용하지 않음)
+# DATA_SOURCE가 mirror이면 동기화가 완료된 데이터셋은 업스트림 대신 미러에서 조회
+MIRROR_DB_PATH = os.getenv("MIRROR_DB_PATH", "")
+DATA_SOURCE = os.getenv("DATA_SOURCE", "live").lower()
+MIRROR_SYNC_CONCURRENCY = int(os.getenv("MIRROR_SYNC_CONCURRENCY", "4"))
+# 포상년도 단위 증분 동기화의 첫 포상년도
+MIRROR_FIRST_JUDGE_YEAR = int(os.getenv("MIRROR_FIRST_JUDGE_YEAR", "1949"))
+
+# 지표 내보내기 설정 (경로를 지정하면 Prometheus 텍스트 형식 파일을 주기적으로 저장)
+METRICS_EXPORT_PATH = os.getenv("METRICS_EXPORT_PATH", "")
+METRICS_EXPORT_INTERVAL = float(os.getenv("METRICS_EXPORT_INTERVAL", "15.0"))
+
+# 캐시 예열 설정 (경로를 비워두면 사용하지 않음)
+# 자주 조회된 캐시 키와 요청 인수를 WARMUP_PATH에 기록해두고, 서버 시작 후 상위 WARMUP_TOP_N개와
+# 코드표를 백그라운드 우선순위로 미리 가져옴 (initialize 응답은 기다리지 않음)
+# stdio 서버는 쓸 수 없는 작업 디렉터리(예: /)에서 실행되는 경우가 많으므로 기본값은 사용하지 않음
+WARMUP_PATH = os.getenv("WARMUP_PATH", "")
+WARMUP_TOP_N = int(os.getenv("WARMUP_TOP_N", "20"))
+WARMUP_MAX_TRACKED = int(os.getenv("WARMUP_MAX_TRACKED", "500"))
+WARMUP_CONCURRENCY = int(os.getenv("WARMUP_CONCURRENCY", "2"))
+WARMUP_DELAY = float(os.getenv("WARMUP_DELAY", "1.0"))
+WARMUP_SAVE_INTERVAL = float(os.getenv("WARMUP_SAVE_INTERVAL", "300.0"))
+
+# 도구 호출 프로파일링 설정 (set_profiling 도구로 실행 중에도 변경 가능)
+# 기준 시간(밀리초)보다 오래 걸린 호출은 인수와 단계별 시간을 PROFILE_LOG_PATH에 기록
+# PROFILE_CPROFILE이 true이면 느린 호출의 cProfile 결과(누적 시간 상위 25개 함수)도 함께 기록
+PROFILE_ENABLED = os.getenv("PROFILE_ENABLED", "false").lower() in ("1", "true", "yes")
+PROFILE_SLOW_THRESHOLD_MS = float(os.getenv("PROFILE_SLOW_THRESHOLD_MS", "1000"))
+PROFILE_CPROFILE = os.getenv("PROFILE_CPROFILE", "false").lower() in ("1", "true", "yes")
+PROFILE_LOG_PATH = os.getenv("PROFILE_LOG_PATH", "gonghun_slow_calls.log")
+PROFILE_LOG_MAX_BYTES = int(os.getenv("PROFILE_LOG_MAX_BYTES", str(5 * 1024 * 1024)))
+PROFILE_LOG_BACKUPS = int(os.getenv("PROFILE_LOG_BACKUPS", "3"))
 
 # 코드 정의
 SEX_CODES = {
@@ -0,0 +1,308 @@
+"""
+독립유공자 공훈록 MCP 서버 - 디스크 캐시 모듈
+
+이 모듈은 서버가 재시작되어도 유지되는 SQLite 기반의 2차 캐시를 제공합니다.
+같은 호스트의 여러 서버 프로세스가 하나의 파일을 함께 쓰면(CACHE_SHARED=true) 서로 저장한 항목을 보고,
+SQLite 파일 잠금으로 조율되는 임대 테이블로 같은 키를 한 프로세스만 업스트림에서 가져옵니다.
+다른 프로세스의 쓰기 잠금을 기다리는 동안 이벤트 루프가 멈추지 않도록 호출하는 쪽은 asyncio.to_thread로
+실행하며, 연결은 잠금으로 보호해 여러 스레드에서 함께 씁니다.
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+from .config import (
+    logger,
+    CACHE_DB_TIMEOUT_MINUTES,
+    CACHE_DB_MAX_BYTES,
+    CACHE_DB_COMPACT_INTERVAL,
+)
+from .cache_backend import CacheBackend
+
+if TYPE_CHECKING:
+    import sqlite3
+
+# 모아둔 조회 시각이 이 수에 이르면 정리 주기 전이라도 기록
+TOUCH_FLUSH_SIZE = 256
+
+class DiskCache(CacheBackend):
+    """SQLite(WAL 모드) 파일에 API 응답 데이터를 저장하는 클래스"""
+
+    def __init__(
+        self,
+        path: str,
+        timeout_minutes: int = CACHE_DB_TIMEOUT_MINUTES,
+        max_bytes: int = CACHE_DB_MAX_BYTES,
+        compact_interval: float = CACHE_DB_COMPACT_INTERVAL,
+        shared: bool = False
+    ):
+        """
+        디스크 캐시를 초기화합니다.
+        재시작 이후에도 만료 시간이 유지되어야 하므로 만료 시각은 벽시계(time.time) 기준으로 저장합니다.
+
+        Args:
+            path: SQLite 파일 경로
+            timeout_minutes: 캐시 만료 시간(분)
+            max_bytes: 저장할 데이터의 최대 크기(바이트)
+            compact_interval: 만료 항목 정리 및 압축 주기(초)
+            shared: 여러 서버 프로세스가 함께 쓰는 파일인지 여부 (True이면 임대 사용)
+        """
+        self.path = path
+        self.shared = shared
+        # 이 프로세스가 얻은 임대를 구분하는 접두사 (pid가 재사용되어도 겹치지 않도록 임의 값 포함)
+        self._owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.lease_waits = 0
+        self.timeout = timeout_minutes * 60.0
+        self.max_bytes = max_bytes
+        self.compact_interval = compact_interval
+        self._next_compact = time.monotonic() + compact_interval
+        # 조회 시각은 조회마다 쓰지 않고 모아두었다가 한꺼번에 기록 (키 -> 마지막 조회 시각)
+        self._touched: Dict[str, float] = {}
+        # 여러 스레드(asyncio.to_thread)에서 같은 연결을 쓰므로 한 번에 하나씩 실행
+        self._lock = threading.RLock()
+        # 서버 시작을 늦추지 않도록 파일은 처음 사용할 때 엶
+        self._db: Optional["sqlite3.Connection"] = None
+
+    @property
+    def _conn(self) -> "sqlite3.Connection":
+        """SQLite 연결 (처음 사용할 때 파일을 열고 스키마를 준비)"""
+        if self._db is None:
+            self._open()
+        return self._db
+
+    def _open(self) -> None:
+        """SQLite 파일을 열고 스키마를 준비합니다."""
+        import sqlite3
+        # 다른 프로세스가 쓰는 중이면 잠금이 풀릴 때까지 최대 5초 기다림
+        self._db = sqlite3.connect(self.path, isolation_level=None, timeout=5.0, check_same_thread=False)
+        self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(cache)")]
+        if columns and "fresh_until" not in columns:
+            # 이전 스키마의 캐시 파일은 버리고 새로 만듦
+            self._conn.execute("DROP TABLE cache")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                fresh_until REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache (expires_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_accessed ON cache (accessed_at)")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS leases (
+                key TEXT PRIMARY KEY,
+                owner TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        logger.info(f"디스크 캐시를 사용합니다: {self.path}{' (프로세스 간 공유)' if self.shared else ''}")
+
+    def get(self, key: str) -> Optional[Tuple[Dict[str, Any], float, float, float]]:
+        """
+        디스크 캐시에서 데이터를 가져옵니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            (캐시된 데이터, 저장 시각, 신선 만료 시각, 최종 만료 시각) 튜플(시각은 time.time 기준),
+            없거나 최종 만료된 경우 None
+        """
+        with self._lock:
+            self._maybe_compact()
+            now = time.time()
+            row = self._conn.execute(
+                "SELECT value, stored_at, fresh_until, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, stored_at, fresh_until, expires_at = row
+            if expires_at <= now:
+                self.remove(key)
+                return None
+
+            # 적중할 때마다 쓰기 잠금을 잡지 않도록 조회 시각은 모아서 기록
+            self._touched[key] = now
+            if len(self._touched) >= TOUCH_FLUSH_SIZE:
+                self._flush_touched()
+        logger.debug(f"디스크 캐시된 데이터를 반환합니다: {key}")
+        return json.loads(value), stored_at, fresh_until, expires_at
+
+    def set(self, key: str, data: Dict[str, Any], fresh_ttl: float) -> None:
+        """
+        디스크 캐시에 데이터를 저장합니다.
+
+        Args:
+            key: 캐시 키
+            data: 저장할 데이터
+            fresh_ttl: 데이터를 신선하게 취급할 시간(초), 이후 최종 만료 시까지는 오래된 데이터로 취급
+        """
+        value = json.dumps(data, ensure_ascii=False)
+        size = len(value.encode("utf-8"))
+        if size > self.max_bytes:
+            logger.debug(f"디스크 캐시 상한보다 큰 데이터는 저장하지 않습니다: {key} ({size} bytes)")
+            return
+
+        with self._lock:
+            self._maybe_compact()
+            now = time.time()
+            self._touched.pop(key, None)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, size, stored_at, fresh_until, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, value, size, now, now + min(fresh_ttl, self.timeout), now + self.timeout, now)
+            )
+
+    def remove(self, key: str) -> None:
+        """
+        특정 키의 캐시를 제거합니다.
+
+        Args:
+            key: 제거할 캐시 키
+        """
+        with self._lock:
+            self._touched.pop(key, None)
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """모든 디스크 캐시를 초기화합니다."""
+        with self._lock:
+            self._touched.clear()
+            self._conn.execute("DELETE FROM cache")
+            self.compact()
+
+    def acquire_lease(self, key: str, ttl: float) -> Optional[str]:
+        """
+        키를 업스트림에서 가져올 권한(임대)을 얻습니다.
+        임대가 없거나 만료된 경우에만 한 문장(upsert)으로 기록하므로, 여러 프로세스가 동시에 시도해도
+        SQLite 쓰기 잠금에 의해 하나만 성공합니다. 공유하지 않는 파일은 항상 임대를 허용합니다.
+
+        Args:
+            key: 캐시 키
+            ttl: 임대 유지 시간(초)
+
+        Returns:
+            release_lease에 전달할 임대 토큰, 다른 프로세스가 임대 중이면 None
+        """
+        if not self.shared:
+            return ""
+
+        now = time.time()
+        token = f"{self._owner}-{uuid.uuid4().hex[:8]}"
+        with self._lock:
+            acquired = self._conn.execute(
+                "INSERT INTO leases (key, owner, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at "
+                "WHERE leases.expires_at <= ?",
+                (key, token, now + ttl, now)
+            ).rowcount
+        if not acquired:
+            self.lease_waits += 1
+            logger.debug(f"다른 프로세스가 가져오는 중인 키입니다: {key}")
+            return None
+        return token
+
+    def release_lease(self, key: str, token: str) -> None:
+        """
+        acquire_lease로 얻은 임대를 반환합니다. 만료되어 다른 프로세스가 다시 얻은 임대는 건드리지 않습니다.
+
+        Args:
+            key: 캐시 키
+            token: acquire_lease가 반환한 임대 토큰
+        """
+        if self.shared and token:
+            with self._lock:
+                self._conn.execute("DELETE FROM leases WHERE key = ? AND owner = ?", (key, token))
+
+    def compact(self) -> int:
+        """
+        만료 항목을 제거하고, 크기 상한을 넘으면 오래 사용되지 않은 항목부터 제거한 뒤 파일을 압축합니다.
+
+        Returns:
+            제거된 항목 수
+        """
+        with self._lock:
+            now = time.time()
+            self._flush_touched()
+            removed = self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,)).rowcount
+            self._conn.execute("DELETE FROM leases WHERE expires_at <= ?", (now,))
+
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+            if total > self.max_bytes:
+                # 가장 오래 사용되지 않은 항목부터 상한의 90%까지 줄임
+                target = total - int(self.max_bytes * 0.9)
+                rows = self._conn.execute("SELECT key, size FROM cache ORDER BY accessed_at").fetchall()
+                victims = []
+                for key, size in rows:
+                    if target <= 0:
+                        break
+                    victims.append((key,))
+                    target -= size
+                self._conn.executemany("DELETE FROM cache WHERE key = ?", victims)
+                removed += len(victims)
+
+            self._conn.execute("PRAGMA incremental_vacuum")
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._next_compact = time.monotonic() + self.compact_interval
+        if removed:
+            logger.debug(f"디스크 캐시 {removed}건을 정리했습니다.")
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        디스크 캐시 통계를 반환합니다.
+
+        Returns:
+            항목 수와 저장된 바이트를 담은 딕셔너리
+        """
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache"
+            ).fetchone()
+        return {
+            "kind": "sqlite",
+            "path": self.path,
+            "shared": self.shared,
+            "leaseWaits": self.lease_waits,
+            "entries": count,
+            "bytes": total,
+            "maxBytes": self.max_bytes,
+        }
+
+    def close(self) -> None:
+        """모아둔 조회 시각을 기록하고 SQLite 연결을 닫습니다."""
+        with self._lock:
+            if self._db is not None:
+                self._flush_touched()
+                self._db.close()
+                self._db = None
+
+    def _maybe_compact(self) -> None:
+        """압축 주기가 지났으면 정리 작업을 수행합니다."""
+        if time.monotonic() >= self._next_compact:
+            self.compact()
+
+    def _flush_touched(self) -> None:
+        """모아둔 조회 시각을 한 번의 쓰기로 기록합니다 (오래 사용되지 않은 항목을 고를 때 사용)."""
+        if not self._touched:
+            return
+        touched = [(accessed_at, key) for key, accessed_at in self._touched.items()]
+        self._touched.clear()
+        with self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.executemany("UPDATE cache SET accessed_at = ? WHERE key = ?", touched)
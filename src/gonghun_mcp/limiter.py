@@ -0,0 +1,276 @@
+"""
+독립유공자 공훈록 MCP 서버 - 업스트림 제한 모듈
+
+이 모듈은 업스트림 API 호출 속도(토큰 버킷)와 동시 요청 수(AIMD 방식의 적응형 제한)를
+프로세스 전체에서 제한하며, 대화형 요청이 백그라운드 작업보다 먼저 처리되도록 우선순위를 둡니다.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import Context, ContextVar, copy_context
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from .config import (
+    logger,
+    UPSTREAM_RATE_LIMIT,
+    UPSTREAM_RATE_BURST,
+    UPSTREAM_CONCURRENCY_INITIAL,
+    UPSTREAM_CONCURRENCY_MIN,
+    UPSTREAM_CONCURRENCY_MAX,
+    UPSTREAM_LATENCY_TARGET,
+)
+
+# 요청 우선순위 (값이 작을수록 먼저 처리)
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+# 현재 작업의 요청 우선순위 (백그라운드 작업에서만 낮춤)
+_request_priority: ContextVar[int] = ContextVar("gonghun_request_priority", default=PRIORITY_INTERACTIVE)
+
+@contextmanager
+def background_priority() -> Iterator[None]:
+    """
+    이 블록에서 만든 작업과 요청을 백그라운드 우선순위로 처리합니다.
+    asyncio 작업은 생성 시점의 컨텍스트를 복사하므로 블록 안에서 만든 작업에도 적용됩니다.
+    """
+    token = _request_priority.set(PRIORITY_BACKGROUND)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+def is_background() -> bool:
+    """현재 작업이 백그라운드 우선순위로 실행 중인지 여부를 반환합니다."""
+    return _request_priority.get() == PRIORITY_BACKGROUND
+
+class SharedPriority:
+    """
+    여러 호출자가 함께 기다리는 작업(싱글플라이트)의 우선순위입니다.
+    작업을 시작한 호출자의 우선순위로 시작하며, 더 높은 우선순위의 호출자가 합류하면 UpstreamLimiter.promote로 높입니다.
+    """
+
+    __slots__ = ("priority", "waiting")
+
+    def __init__(self, priority: int):
+        """
+        공유 우선순위를 초기화합니다.
+
+        Args:
+            priority: 작업을 시작한 호출자의 우선순위
+        """
+        self.priority = priority
+        # 이 작업이 제한기에서 기다리는 중인 요청
+        self.waiting: Set[asyncio.Future] = set()
+
+# 현재 작업이 따르는 공유 우선순위 (싱글플라이트 작업 안에서만 설정)
+_shared_priority: ContextVar[Optional[SharedPriority]] = ContextVar("gonghun_shared_priority", default=None)
+
+def shared_priority_context(shared: SharedPriority) -> Context:
+    """
+    현재 컨텍스트를 복사해 공유 우선순위를 설정한 컨텍스트를 반환합니다.
+    이 컨텍스트에서 만든 작업은 shared.priority를 따라 업스트림 슬롯을 기다립니다.
+
+    Args:
+        shared: 작업이 따를 공유 우선순위
+
+    Returns:
+        공유 우선순위가 설정된 컨텍스트
+    """
+    context = copy_context()
+    context.run(_shared_priority.set, shared)
+    return context
+
+def current_priority() -> int:
+    """현재 작업의 요청 우선순위를 반환합니다 (공유 우선순위가 있으면 그 값)."""
+    shared = _shared_priority.get()
+    return shared.priority if shared is not None else _request_priority.get()
+
+class UpstreamLimiter:
+    """토큰 버킷 속도 제한과 AIMD 동시성 제한을 함께 적용하는 우선순위 대기열"""
+
+    def __init__(
+        self,
+        rate: float = UPSTREAM_RATE_LIMIT,
+        burst: int = UPSTREAM_RATE_BURST,
+        initial_limit: int = UPSTREAM_CONCURRENCY_INITIAL,
+        min_limit: int = UPSTREAM_CONCURRENCY_MIN,
+        max_limit: int = UPSTREAM_CONCURRENCY_MAX,
+        latency_target: float = UPSTREAM_LATENCY_TARGET
+    ):
+        """
+        업스트림 제한기를 초기화합니다.
+
+        Args:
+            rate: 초당 허용 요청 수 (0 이하이면 속도 제한 없음)
+            burst: 한 번에 몰아서 보낼 수 있는 최대 요청 수 (토큰 버킷 크기)
+            initial_limit: 처음 허용할 동시 요청 수
+            min_limit: 동시 요청 수의 하한
+            max_limit: 동시 요청 수의 상한
+            latency_target: 목표 응답 시간(초), 이보다 느리거나 실패하면 동시 요청 수를 줄임
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self.latency_target = latency_target
+        self.in_flight = 0
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._last_decrease = 0.0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        # 통계
+        self.throttled = 0
+        self.decreases = 0
+
+    async def acquire(self, priority: Optional[int] = None) -> None:
+        """
+        업스트림 요청 슬롯을 얻을 때까지 기다립니다. 우선순위가 높은 요청이 먼저 슬롯을 얻습니다.
+
+        Args:
+            priority: 요청 우선순위 (기본값은 현재 작업의 우선순위)
+        """
+        shared = _shared_priority.get()
+        if priority is None:
+            priority = current_priority()
+
+        self._refill()
+        if not self._waiters and self._can_start():
+            self._start()
+            return
+
+        self.throttled += 1
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        if shared is not None:
+            shared.waiting.add(future)
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 슬롯을 받은 직후 취소된 경우 슬롯을 돌려줌
+                self.in_flight -= 1
+                self._dispatch()
+            raise
+        finally:
+            if shared is not None:
+                shared.waiting.discard(future)
+
+    def promote(self, shared: SharedPriority, priority: int) -> None:
+        """
+        공유 작업의 우선순위를 높입니다. 이미 대기열에 있는 요청도 새 우선순위로 다시 넣습니다
+        (이전 항목은 요청이 슬롯을 받으면 완료된 대기 요청으로 건너뜀).
+
+        Args:
+            shared: 싱글플라이트 작업의 공유 우선순위
+            priority: 합류한 호출자의 우선순위
+        """
+        if priority >= shared.priority:
+            return
+        shared.priority = priority
+        for future in shared.waiting:
+            if not future.done():
+                heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._dispatch()
+
+    def release(self, latency: float, ok: bool) -> None:
+        """
+        요청 슬롯을 반환하고 결과에 따라 동시 요청 수를 조정합니다.
+        목표 시간 안에 성공하면 한 라운드에 1씩 늘리고(additive increase),
+        실패하거나 느리면 절반으로 줄입니다(multiplicative decrease).
+
+        Args:
+            latency: 요청에 걸린 시간(초)
+            ok: 업스트림이 정상 응답했는지 여부 (시간 초과, 429, 5xx이면 False)
+        """
+        self.in_flight -= 1
+        now = time.monotonic()
+        if ok and latency <= self.latency_target:
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+        elif now - self._last_decrease >= self.latency_target:
+            # 동시에 실패한 요청들로 여러 번 줄어들지 않도록 목표 시간마다 한 번만 줄임
+            self._last_decrease = now
+            self.limit = max(float(self.min_limit), self.limit / 2)
+            self.decreases += 1
+            logger.warning(
+                f"업스트림 {'오류' if not ok else '지연'}로 동시 요청 수를 {int(self.limit)}개로 줄입니다. "
+                f"(응답 시간 {latency:.2f}초)"
+            )
+        self._dispatch()
+
+    def abandon(self) -> None:
+        """
+        결과를 알 수 없이 취소된 요청(예: 헤지 요청에서 진 쪽)의 슬롯을 동시 요청 수 조정 없이 반환합니다.
+        """
+        self.in_flight -= 1
+        self._dispatch()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        제한기 상태를 반환합니다.
+
+        Returns:
+            동시 요청 상한, 진행 중인 요청 수, 대기 중인 요청 수, 남은 토큰 등을 담은 딕셔너리
+        """
+        self._refill()
+        return {
+            "concurrencyLimit": int(self.limit),
+            "inFlight": self.in_flight,
+            "waiting": len({future for _, _, future in self._waiters if not future.done()}),
+            "rateLimit": self.rate,
+            "tokens": round(self._tokens, 2),
+            "throttled": self.throttled,
+            "decreases": self.decreases,
+        }
+
+    def _refill(self) -> None:
+        """경과 시간만큼 토큰을 채웁니다."""
+        now = time.monotonic()
+        if self.rate > 0:
+            self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _can_start(self) -> bool:
+        """동시 요청 상한과 토큰이 모두 여유가 있는지 확인합니다."""
+        return self.in_flight < int(self.limit) and (self.rate <= 0 or self._tokens >= 1)
+
+    def _start(self) -> None:
+        """슬롯 하나와 토큰 하나를 사용합니다."""
+        self.in_flight += 1
+        if self.rate > 0:
+            self._tokens -= 1
+
+    def _dispatch(self) -> None:
+        """여유가 있는 만큼 우선순위 순서대로 대기 중인 요청을 깨웁니다."""
+        self._refill()
+        while self._waiters:
+            future = self._waiters[0][2]
+            if future.done():
+                # 취소된 대기 요청
+                heapq.heappop(self._waiters)
+                continue
+            if self.in_flight >= int(self.limit):
+                return
+            if self.rate > 0 and self._tokens < 1:
+                # 토큰이 찰 때까지 기다렸다가 다시 시도
+                if self._timer is None:
+                    delay = (1 - self._tokens) / self.rate
+                    self._timer = asyncio.get_running_loop().call_later(delay, self._on_timer)
+                return
+            heapq.heappop(self._waiters)
+            self._start()
+            future.set_result(None)
+
+    def _on_timer(self) -> None:
+        """토큰 대기 타이머가 끝나면 대기 중인 요청을 다시 깨웁니다."""
+        self._timer = None
+        self._dispatch()
+
+# 업스트림 제한기 인스턴스 생성
+upstream_limiter = UpstreamLimiter()
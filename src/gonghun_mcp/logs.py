@@ -0,0 +1,160 @@
+"""
+독립유공자 공훈록 MCP 서버 - 로깅 모듈
+
+이 모듈은 로그 기록이 도구 호출 지연에 더해지지 않도록 큐 기반 로깅 파이프라인을 제공합니다.
+이벤트 루프에서는 로그 레코드를 큐에 넣기만 하고, 메시지 형식화와 파일 쓰기(크기 기반 순환)는
+백그라운드 스레드에서 처리합니다. 요청마다 남는 로그는 비율을 정해 일부만 남길 수 있습니다.
+
+설정 값은 config 모듈이 이 모듈을 사용해 로깅을 초기화할 때 전달하므로 다른 패키지 모듈을 가져오지 않습니다.
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, List
+
+# 지연 형식화하는 로그 값의 최대 길이 (setup_logging에서 설정)
+_payload_max_chars = 2000
+
+# 실행 중인 로그 작성 스레드 (종료 시 남은 로그를 모두 쓰고 멈춤)
+_listeners: List[QueueListener] = []
+
+class LazyPayload:
+    """
+    로그에 남길 큰 값(도구 인수, 응답 문자열 등)을 감싸는 클래스입니다.
+    문자열 변환은 로그 작성 스레드에서 실제로 기록할 때만 일어나며, 최대 길이를 넘는 부분은 잘라냅니다.
+    """
+
+    __slots__ = ("value", "limit")
+
+    def __init__(self, value: Any, limit: int):
+        self.value = value
+        self.limit = limit
+
+    def __str__(self) -> str:
+        text = self.value if isinstance(self.value, str) else repr(self.value)
+        if self.limit and len(text) > self.limit:
+            return f"{text[:self.limit]}... (총 {len(text)}자)"
+        return text
+
+    __repr__ = __str__
+
+def lazy_payload(value: Any) -> LazyPayload:
+    """
+    로그 메시지 인수로 사용할 지연 형식화 값을 만듭니다.
+    logger.info("... %s", lazy_payload(value)) 처럼 %-형식 인수로 전달해야 형식화가 지연됩니다.
+
+    Args:
+        value: 로그에 남길 값
+
+    Returns:
+        지연 형식화 값
+    """
+    return LazyPayload(value, _payload_max_chars)
+
+class SamplingFilter(logging.Filter):
+    """
+    WARNING 미만의 로그를 지정한 비율만큼만 통과시키는 필터입니다.
+    무작위가 아니라 메시지 형식 문자열별로 일정한 간격으로 통과시키므로, 비율이 0.1이면
+    도구 호출 로그와 업스트림 요청 로그가 각각 정확히 10건 중 1건씩 남습니다.
+    """
+
+    def __init__(self, rate: float):
+        """
+        필터를 초기화합니다.
+
+        Args:
+            rate: 통과시킬 비율 (0~1, 1이면 모두 통과)
+        """
+        super().__init__()
+        self.rate = max(0.0, min(1.0, rate))
+        self._credits: Dict[str, float] = {}
+        self.dropped = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or self.rate >= 1.0:
+            return True
+        credit = self._credits.get(record.msg, 1.0 - self.rate) + self.rate
+        if credit >= 1.0:
+            self._credits[record.msg] = credit - 1.0
+            return True
+        self._credits[record.msg] = credit
+        self.dropped += 1
+        return False
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    레코드를 형식화하지 않고 그대로 큐에 넣는 핸들러입니다.
+    기본 QueueHandler는 큐에 넣기 전에 호출한 스레드(이벤트 루프)에서 메시지를 형식화하지만,
+    같은 프로세스의 스레드로만 전달하므로 형식화를 작성 스레드의 핸들러에 맡깁니다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+def _start_listener(handlers: List[logging.Handler]) -> QueueHandler:
+    """작성 스레드를 시작하고 그 스레드로 레코드를 보내는 핸들러를 반환합니다."""
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners.append(listener)
+    return DeferredQueueHandler(log_queue)
+
+def _stop_listeners() -> None:
+    """모든 작성 스레드가 남은 로그를 쓰고 멈출 때까지 기다립니다."""
+    while _listeners:
+        _listeners.pop().stop()
+
+atexit.register(_stop_listeners)
+
+def setup_logging(
+    level: int,
+    log_file: str,
+    max_bytes: int,
+    backups: int,
+    payload_max_chars: int
+) -> None:
+    """
+    루트 로거에 큐 기반 로깅을 설정합니다.
+    로그 파일(크기 기반 순환)과 표준 오류 출력은 백그라운드 작성 스레드가 기록합니다.
+
+    Args:
+        level: 루트 로그 레벨
+        log_file: 로그 파일 경로 (비워두면 표준 오류 출력에만 기록)
+        max_bytes: 로그 파일 최대 크기 (0이면 순환하지 않음)
+        backups: 보관할 이전 로그 파일 수
+        payload_max_chars: lazy_payload 값의 최대 길이 (0이면 자르지 않음)
+    """
+    global _payload_max_chars
+    _payload_max_chars = payload_max_chars
+
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers: List[logging.Handler] = [logging.StreamHandler()]
+    if log_file:
+        # 파일은 처음 기록할 때 작성 스레드에서 엶
+        handlers.append(RotatingFileHandler(
+            log_file, maxBytes=max_bytes, backupCount=backups, encoding="utf-8", delay=True
+        ))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    logging.basicConfig(level=level, handlers=[_start_listener(handlers)])
+
+def queued_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    """
+    상위 로거로 전파하지 않고 지정한 핸들러에만 기록하는 로거를 만듭니다 (예: 느린 호출 기록 파일).
+    핸들러는 별도 작성 스레드에서 실행됩니다.
+
+    Args:
+        name: 로거 이름
+        handler: 기록할 핸들러
+
+    Returns:
+        설정된 로거
+    """
+    dedicated = logging.getLogger(name)
+    dedicated.propagate = False
+    dedicated.setLevel(logging.INFO)
+    dedicated.addHandler(_start_listener([handler]))
+    return dedicated
@@ -8,7 +8,14 @@ import asyncio
 import os
 import logging
 import mcp.server.stdio
-from .config import logger, app
+from .config import logger, app, MCP_TRANSPORT, METRICS_EXPORT_PATH
+from .cache import cache_manager
+from .client import http_client_manager
+from .metrics import export_periodically
+from .mirror import mirror_store
+from .warmup import run_warmup
+# 도구/리소스 핸들러 등록
+from . import tools, server  # noqa: F401
 
 async def main():
     """
@@ -16,19 +23,53 @@ async def main():
     """
     logger.info("독립유공자 공훈록 MCP 서버를 시작합니다...")
     
+    # initialize 응답을 늦추지 않도록 HTTP 클라이언트는 백그라운드에서 미리 생성
+    # (실패하면 첫 요청에서 다시 생성하므로 경고만 남김)
+    start_task = asyncio.ensure_future(http_client_manager.start())
+    start_task.add_done_callback(_log_client_start_failure)
+    
+    # 지표 파일 내보내기
+    export_task = asyncio.ensure_future(export_periodically()) if METRICS_EXPORT_PATH else None
+    
+    # 캐시 예열과 조회 기록 저장 (initialize 응답을 기다리지 않고 백그라운드에서 실행)
+    warmup_task = asyncio.ensure_future(run_warmup())
+    
     try:
-        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-            await app.run(
-                read_stream,
-                write_stream,
-                app.create_initialization_options()
-            )
+        if MCP_TRANSPORT == "sse":
+            # 하나의 프로세스가 여러 세션을 처리 (HTTP 서버 의존성은 이 경우에만 가져옴)
+            from .sse_server import serve_sse
+            await serve_sse()
+        else:
+            async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+                await app.run(
+                    read_stream,
+                    write_stream,
+                    app.create_initialization_options()
+                )
     except Exception as e:
         logger.error(f"서버 실행 중 오류 발생: {str(e)}")
         raise
     finally:
+        if export_task is not None:
+            export_task.cancel()
+        warmup_task.cancel()
+        await asyncio.gather(warmup_task, start_task, return_exceptions=True)
+        await http_client_manager.close()
+        cache_manager.close()
+        if mirror_store is not None:
+            mirror_store.close()
         logger.info("독립유공자 공훈록 MCP 서버를 종료합니다.")
 
+def _log_client_start_failure(task: asyncio.Task) -> None:
+    """
+    HTTP 클라이언트 사전 생성 작업이 실패했으면 경고를 남깁니다.
+
+    Args:
+        task: http_client_manager.start 작업
+    """
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"HTTP 클라이언트 사전 생성 실패: {str(task.exception())}")
+
 def run():
     """
     서버 실행 진입점 함수입니다.
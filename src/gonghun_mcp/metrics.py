@@ -0,0 +1,300 @@
+"""
+독립유공자 공훈록 MCP 서버 - 지표 모듈
+
+이 모듈은 도구/엔드포인트별 응답 시간 히스토그램, 업스트림 상태 코드, 캐시와 업스트림 제한기 상태 등
+서버 실행 지표를 모으고, 요약(딕셔너리)과 Prometheus 텍스트 형식으로 내보내는 기능을 제공합니다.
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+from .config import logger, request_sampling_filter, METRICS_EXPORT_PATH, METRICS_EXPORT_INTERVAL
+from .cache import cache_manager
+from .limiter import upstream_limiter
+from .resilience import circuit_breaker, upstream_counters
+from .singleflight import single_flight
+from .sessions import session_manager
+from .warmup import cache_warmer
+
+# 응답 시간 히스토그램 구간 상한(초)
+LATENCY_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+class Histogram:
+    """고정 구간 누적 히스토그램 (Prometheus histogram과 같은 방식)"""
+
+    __slots__ = ("buckets", "counts", "count", "total", "max")
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        """
+        히스토그램을 초기화합니다.
+
+        Args:
+            buckets: 구간 상한 목록(오름차순), 마지막 구간(+Inf)은 자동으로 추가
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        값을 기록합니다.
+
+        Args:
+            value: 기록할 값(초)
+        """
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        구간 안에서 선형 보간하여 분위수를 추정합니다. 추정값은 관측된 최대값을 넘지 않습니다.
+
+        Args:
+            q: 분위 (0~1)
+
+        Returns:
+            추정 분위수(초), 기록이 없으면 None
+        """
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for i, bound in enumerate(self.buckets):
+            if seen + self.counts[i] >= rank:
+                fraction = (rank - seen) / self.counts[i] if self.counts[i] else 0.0
+                return min(self.max, lower + (bound - lower) * fraction)
+            seen += self.counts[i]
+            lower = bound
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        히스토그램 요약을 반환합니다.
+
+        Returns:
+            건수, 평균, p50/p95/p99 추정값, 최대값(밀리초)을 담은 딕셔너리
+        """
+        def ms(value: Optional[float]) -> Optional[float]:
+            return round(value * 1000, 2) if value is not None else None
+
+        return {
+            "count": self.count,
+            "meanMs": ms(self.total / self.count) if self.count else None,
+            "p50Ms": ms(self.quantile(0.50)),
+            "p95Ms": ms(self.quantile(0.95)),
+            "p99Ms": ms(self.quantile(0.99)),
+            "maxMs": ms(self.max) if self.count else None,
+        }
+
+class MetricsRegistry:
+    """서버 실행 지표를 모으는 클래스"""
+
+    def __init__(self):
+        """지표 저장소를 초기화합니다."""
+        self.started_at = time.time()
+        self.tool_latency: Dict[str, Histogram] = defaultdict(Histogram)
+        self.tool_errors: Dict[str, int] = defaultdict(int)
+        self.tools_in_flight = 0
+        self.upstream_latency: Dict[str, Histogram] = defaultdict(Histogram)
+        self.upstream_status: Dict[Tuple[str, str], int] = defaultdict(int)
+
+    def tool_started(self) -> float:
+        """
+        도구 호출 시작을 기록합니다.
+
+        Returns:
+            시작 시각 (tool_finished에 전달)
+        """
+        self.tools_in_flight += 1
+        return time.monotonic()
+
+    def tool_finished(self, name: str, started: float, error: bool) -> None:
+        """
+        도구 호출 완료를 기록합니다.
+
+        Args:
+            name: 도구 이름
+            started: tool_started가 반환한 시작 시각
+            error: 오류 응답을 반환했는지 여부
+        """
+        self.tools_in_flight -= 1
+        self.tool_latency[name].observe(time.monotonic() - started)
+        if error:
+            self.tool_errors[name] += 1
+
+    def upstream_finished(self, endpoint: str, status: str, latency: float) -> None:
+        """
+        업스트림 요청 한 번의 결과를 기록합니다.
+
+        Args:
+            endpoint: 엔드포인트 이름 (예: contribuMeritList.do)
+            status: HTTP 상태 코드, 또는 timeout/error
+            latency: 응답 시간(초)
+        """
+        self.upstream_latency[endpoint].observe(latency)
+        self.upstream_status[(endpoint, status)] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        현재 지표를 요약합니다.
+
+        Returns:
+            세션, 도구, 업스트림, 캐시, 캐시 예열, 제한기, 서킷 브레이커, 로그 샘플링 지표를 담은 딕셔너리
+        """
+        status_counts: Dict[str, Dict[str, int]] = defaultdict(dict)
+        for (endpoint, status), count in sorted(self.upstream_status.items()):
+            status_counts[endpoint][status] = count
+
+        cache_stats = cache_manager.stats()
+        lookups = cache_stats["hits"] + cache_stats["staleHits"] + cache_stats["misses"]
+        return {
+            "uptimeSeconds": int(time.time() - self.started_at),
+            "sessions": session_manager.stats(),
+            "tools": {
+                "inFlight": self.tools_in_flight,
+                "calls": {
+                    name: dict(histogram.summary(), errors=self.tool_errors.get(name, 0))
+                    for name, histogram in sorted(self.tool_latency.items())
+                },
+            },
+            "upstream": {
+                "inFlight": single_flight.in_flight(),
+                "endpoints": {
+                    endpoint: dict(histogram.summary(), status=status_counts.get(endpoint, {}))
+                    for endpoint, histogram in sorted(self.upstream_latency.items())
+                },
+                "attempts": upstream_counters["attempts"],
+                "retries": upstream_counters["retries"],
+                "hedged": upstream_counters["hedged"],
+                "hedgeWins": upstream_counters["hedgeWins"],
+                "limiter": upstream_limiter.stats(),
+                "circuitBreaker": circuit_breaker.stats(),
+            },
+            "cache": dict(
+                cache_stats,
+                hitRatio=round((cache_stats["hits"] + cache_stats["staleHits"]) / lookups, 4) if lookups else None
+            ),
+            "warmup": cache_warmer.stats(),
+            "logging": {
+                "requestSampleRate": request_sampling_filter.rate,
+                "sampledOut": request_sampling_filter.dropped,
+            },
+        }
+
+    def to_prometheus(self) -> str:
+        """
+        지표를 Prometheus 텍스트 형식으로 변환합니다.
+
+        Returns:
+            Prometheus 텍스트 형식 문자열
+        """
+        lines: List[str] = []
+
+        def histogram_lines(metric: str, label: str, histograms: Dict[str, Histogram]) -> None:
+            lines.append(f"# TYPE {metric} histogram")
+            for key, histogram in sorted(histograms.items()):
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f'{metric}_bucket{{{label}="{key}",le="{bound}"}} {cumulative}')
+                lines.append(f'{metric}_bucket{{{label}="{key}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{metric}_sum{{{label}="{key}"}} {histogram.total}')
+                lines.append(f'{metric}_count{{{label}="{key}"}} {histogram.count}')
+
+        def gauge(metric: str, value: Any, kind: str = "gauge") -> None:
+            lines.append(f"# TYPE {metric} {kind}")
+            lines.append(f"{metric} {value}")
+
+        histogram_lines("gonghun_tool_duration_seconds", "tool", self.tool_latency)
+        lines.append("# TYPE gonghun_tool_errors_total counter")
+        for name, count in sorted(self.tool_errors.items()):
+            lines.append(f'gonghun_tool_errors_total{{tool="{name}"}} {count}')
+        gauge("gonghun_tools_in_flight", self.tools_in_flight)
+        gauge("gonghun_sessions", session_manager.sessions)
+
+        histogram_lines("gonghun_upstream_duration_seconds", "endpoint", self.upstream_latency)
+        lines.append("# TYPE gonghun_upstream_responses_total counter")
+        for (endpoint, status), count in sorted(self.upstream_status.items()):
+            lines.append(f'gonghun_upstream_responses_total{{endpoint="{endpoint}",status="{status}"}} {count}')
+        gauge("gonghun_upstream_in_flight", single_flight.in_flight())
+        gauge("gonghun_upstream_retries_total", upstream_counters["retries"], "counter")
+        gauge("gonghun_upstream_hedged_total", upstream_counters["hedged"], "counter")
+        limiter_stats = upstream_limiter.stats()
+        gauge("gonghun_upstream_concurrency_limit", limiter_stats["concurrencyLimit"])
+        gauge("gonghun_upstream_waiting", limiter_stats["waiting"])
+        gauge("gonghun_circuit_open", 0 if circuit_breaker.state == "closed" else 1)
+
+        cache_stats = cache_manager.stats()
+        gauge("gonghun_cache_entries", cache_stats["entries"])
+        gauge("gonghun_cache_bytes", cache_stats["bytes"])
+        for key, metric in (
+            ("hits", "hits"), ("staleHits", "stale_hits"), ("misses", "misses"), ("evictions", "evictions"),
+            ("expirations", "expirations"), ("diskHits", "disk_hits"), ("textHits", "text_hits"),
+            ("sharedHits", "shared_hits"),
+        ):
+            gauge(f"gonghun_cache_{metric}_total", cache_stats[key], "counter")
+
+        warmup_stats = cache_warmer.stats()
+        gauge("gonghun_warmup_planned", warmup_stats["planned"])
+        gauge("gonghun_warmup_completed", warmup_stats["completed"])
+        gauge("gonghun_warmup_failed", warmup_stats["failed"])
+
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: str) -> None:
+        """
+        지표를 Prometheus 텍스트 형식 파일로 저장합니다 (node_exporter textfile collector용).
+        읽는 쪽이 쓰다 만 파일을 보지 않도록 임시 파일에 쓴 뒤 교체합니다.
+
+        Args:
+            path: 저장할 파일 경로
+        """
+        # 같은 경로로 내보내는 다른 프로세스와 임시 파일이 겹치지 않도록 쓸 때마다 새 임시 파일을 만듦
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.to_prometheus())
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+async def export_periodically(
+    path: str = METRICS_EXPORT_PATH,
+    interval: float = METRICS_EXPORT_INTERVAL
+) -> None:
+    """
+    지표를 주기적으로 파일에 저장합니다. 작업이 취소될 때 마지막으로 한 번 더 저장합니다.
+
+    Args:
+        path: 저장할 파일 경로
+        interval: 저장 주기(초)
+    """
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                metrics.export(path)
+            except OSError as e:
+                logger.warning(f"지표 파일 저장 실패: {path} - {str(e)}")
+    finally:
+        try:
+            metrics.export(path)
+        except OSError:
+            pass
+
+# 지표 저장소 인스턴스 생성
+metrics = MetricsRegistry()
@@ -0,0 +1,541 @@
+"""
+독립유공자 공훈록 MCP 서버 - 로컬 미러 모듈
+
+이 모듈은 공훈록/공적조서 전체 데이터를 저장하는 SQLite 기반 로컬 미러 저장소를 제공합니다.
+미러에 데이터를 채우는 동기화 작업은 sync 모듈이 담당합니다.
+조회와 저장은 이벤트 루프를 막지 않도록 호출하는 쪽에서 asyncio.to_thread로 실행합니다.
+"""
+
+import hashlib
+import json
+import math
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+from .config import logger, MIRROR_DB_PATH
+from .utils import get_item_field
+
+if TYPE_CHECKING:
+    import sqlite3
+
+# 미러에 저장하는 검색 필드 (build_query_params 파라미터 이름, 컬럼 이름, 비교 방식)
+# eq: 일치, prefix: 앞부분 일치(년/년월/년월일), like: 부분 일치
+MIRROR_FIELDS = (
+    ("mngNo", "mng_no", "eq"),
+    ("nameKo", "name_ko", "like"),
+    ("nameCh", "name_ch", "like"),
+    ("diffName", "diff_name", "like"),
+    ("birthday", "birthday", "prefix"),
+    ("lastday", "lastday", "prefix"),
+    ("sex", "sex", "eq"),
+    ("registerLargeDiv", "register_large_div", "eq"),
+    ("registerMidDiv", "register_mid_div", "eq"),
+    ("judgeYear", "judge_year", "eq"),
+    ("hunkuk", "hunkuk", "eq"),
+    ("workoutAffil", "workout_affil", "eq"),
+    ("achivement", "achivement", "like"),
+    ("achivement_ko", "achivement_ko", "like"),
+)
+
+class MirrorStore:
+    """공훈록/공적조서 전체 데이터를 저장하고 조회하는 클래스"""
+
+    def __init__(self, path: str):
+        """
+        미러 저장소를 초기화합니다.
+
+        Args:
+            path: SQLite 파일 경로
+        """
+        self.path = path
+        self._ready: Dict[str, bool] = {}
+        # 동기화와 조회가 여러 스레드(asyncio.to_thread)에서 같은 연결을 쓰므로 한 번에 하나씩 실행
+        self._lock = threading.RLock()
+        # 서버 시작을 늦추지 않도록 파일은 처음 사용할 때 엶
+        self._db: Optional["sqlite3.Connection"] = None
+
+    @property
+    def _conn(self) -> "sqlite3.Connection":
+        """SQLite 연결 (처음 사용할 때 파일을 열고 스키마를 준비)"""
+        if self._db is None:
+            self._open()
+        return self._db
+
+    def _open(self) -> None:
+        """SQLite 파일을 열고 스키마를 준비합니다."""
+        import sqlite3
+        self._db = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        columns = ", ".join(f"{column} TEXT" for _, column, _ in MIRROR_FIELDS if column != "mng_no")
+        self._conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS records (
+                dataset TEXT NOT NULL,
+                record_key TEXT NOT NULL,
+                mng_no TEXT,
+                {columns},
+                position INTEGER NOT NULL,
+                run_id INTEGER NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (dataset, record_key)
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_records_position ON records (dataset, position)")
+        for column in ("mng_no", "name_ko", "judge_year", "hunkuk", "workout_affil"):
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_records_{column} ON records (dataset, {column})"
+            )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sync_state (
+                dataset TEXT PRIMARY KEY,
+                run_id INTEGER NOT NULL,
+                total_count INTEGER NOT NULL,
+                page_count INTEGER NOT NULL,
+                started_at REAL NOT NULL,
+                completed_at REAL,
+                completed_run INTEGER
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sync_pages (
+                dataset TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                PRIMARY KEY (dataset, page)
+            )
+            """
+        )
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(sync_partitions)")]
+        if columns and "page_hashes" not in columns:
+            # 이전 스키마의 파티션 정보는 버림 (다음 증분 동기화에서 파티션을 한 번씩 다시 받음)
+            self._conn.execute("DROP TABLE sync_partitions")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sync_partitions (
+                dataset TEXT NOT NULL,
+                judge_year TEXT NOT NULL,
+                total_count INTEGER NOT NULL,
+                page_hashes TEXT NOT NULL,
+                next_probe INTEGER NOT NULL,
+                synced_at REAL NOT NULL,
+                PRIMARY KEY (dataset, judge_year)
+            )
+            """
+        )
+        logger.info(f"로컬 미러를 사용합니다: {self.path}")
+
+    def is_ready(self, dataset: str) -> bool:
+        """
+        데이터셋이 한 번 이상 전체 동기화되어 조회에 사용할 수 있는지 확인합니다.
+
+        Args:
+            dataset: 데이터셋 이름 (merit_list/public_report)
+
+        Returns:
+            사용 가능 여부
+        """
+        with self._lock:
+            if dataset not in self._ready:
+                state = self.get_state(dataset)
+                self._ready[dataset] = bool(state and state["lastCompletedRun"] is not None)
+            return self._ready[dataset]
+
+    def get_state(self, dataset: str) -> Optional[Dict[str, Any]]:
+        """
+        데이터셋의 동기화 상태를 반환합니다.
+
+        Args:
+            dataset: 데이터셋 이름
+
+        Returns:
+            동기화 상태, 동기화한 적이 없으면 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT run_id, total_count, page_count, started_at, completed_at, completed_run "
+                "FROM sync_state WHERE dataset = ?",
+                (dataset,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            run_id, total_count, page_count, started_at, completed_at, completed_run = row
+            done_pages = self._conn.execute(
+                "SELECT COUNT(*) FROM sync_pages WHERE dataset = ?", (dataset,)
+            ).fetchone()[0]
+            record_count = self._conn.execute(
+                "SELECT COUNT(*) FROM records WHERE dataset = ?", (dataset,)
+            ).fetchone()[0]
+            return {
+                "dataset": dataset,
+                "runId": run_id,
+                "totalCount": total_count,
+                "pageCount": page_count,
+                "syncedPages": done_pages,
+                "records": record_count,
+                "startedAt": started_at,
+                "completedAt": completed_at,
+                # 진행 중인 동기화가 있어도 이전에 완료된 데이터로 조회할 수 있음
+                "lastCompletedRun": completed_run,
+            }
+
+    def begin_run(self, dataset: str, total_count: int, page_count: int, resume: bool = True) -> List[int]:
+        """
+        동기화를 시작하고 아직 받지 않은 페이지 목록을 반환합니다.
+        이전 동기화가 중단되었고 전체 건수가 같으면 체크포인트부터 이어서 진행합니다.
+
+        Args:
+            dataset: 데이터셋 이름
+            total_count: 업스트림 전체 건수
+            page_count: 업스트림 전체 페이지 수
+            resume: 중단된 동기화를 이어서 진행할지 여부
+
+        Returns:
+            받아야 할 페이지 번호 목록
+        """
+        with self._lock:
+            state = self.get_state(dataset)
+            if (resume and state is not None and state["completedAt"] is None
+                    and state["totalCount"] == total_count and state["pageCount"] == page_count):
+                done = {
+                    row[0] for row in self._conn.execute(
+                        "SELECT page FROM sync_pages WHERE dataset = ?", (dataset,)
+                    )
+                }
+                logger.info(f"{dataset} 동기화를 이어서 진행합니다: {len(done)}/{page_count} 페이지 완료")
+                return [page for page in range(1, page_count + 1) if page not in done]
+
+            run_id = (state["runId"] + 1) if state is not None else 1
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.execute("DELETE FROM sync_pages WHERE dataset = ?", (dataset,))
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO sync_state "
+                    "(dataset, run_id, total_count, page_count, started_at, completed_at, completed_run) "
+                    "VALUES (?, ?, ?, ?, ?, NULL, ?)",
+                    (dataset, run_id, total_count, page_count, time.time(),
+                     state["lastCompletedRun"] if state is not None else None)
+                )
+            return list(range(1, page_count + 1))
+
+    def store_page(self, dataset: str, page: int, count_per_page: int, items: Iterable[Dict[str, Any]]) -> int:
+        """
+        페이지 하나의 항목을 저장하고 체크포인트를 기록합니다.
+
+        Args:
+            dataset: 데이터셋 이름
+            page: 페이지 번호
+            count_per_page: 페이지 당 데이터 건수
+            items: 저장할 항목
+
+        Returns:
+            저장된 항목 수
+        """
+        with self._lock:
+            run_id = self._conn.execute(
+                "SELECT run_id FROM sync_state WHERE dataset = ?", (dataset,)
+            ).fetchone()[0]
+            rows = []
+            for index, item in enumerate(items):
+                position = (page - 1) * count_per_page + index
+                rows.append(self._to_row(dataset, item, position, run_id))
+
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._insert_rows(rows)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO sync_pages (dataset, page) VALUES (?, ?)", (dataset, page)
+                )
+            return len(rows)
+
+    def finish_run(self, dataset: str) -> int:
+        """
+        동기화를 완료하고 이번 동기화에서 다시 받지 못한(업스트림에서 삭제된) 항목을 제거합니다.
+
+        Args:
+            dataset: 데이터셋 이름
+
+        Returns:
+            제거된 항목 수
+        """
+        with self._lock:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                run_id = self._conn.execute(
+                    "SELECT run_id FROM sync_state WHERE dataset = ?", (dataset,)
+                ).fetchone()[0]
+                removed = self._conn.execute(
+                    "DELETE FROM records WHERE dataset = ? AND run_id < ?", (dataset, run_id)
+                ).rowcount
+                self._conn.execute(
+                    "UPDATE sync_state SET completed_at = ?, completed_run = run_id WHERE dataset = ?",
+                    (time.time(), dataset)
+                )
+            self._ready[dataset] = True
+            logger.info(f"{dataset} 동기화가 완료되었습니다. (삭제된 항목 {removed}건)")
+            return removed
+
+    def get_partition(self, dataset: str, judge_year: str) -> Optional[Dict[str, Any]]:
+        """
+        포상년도 파티션의 마지막 동기화 정보를 반환합니다.
+
+        Args:
+            dataset: 데이터셋 이름
+            judge_year: 포상년도
+
+        Returns:
+            전체 건수, 페이지별 해시, 다음에 확인할 페이지를 담은 딕셔너리, 동기화한 적이 없으면 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT total_count, page_hashes, next_probe, synced_at FROM sync_partitions "
+                "WHERE dataset = ? AND judge_year = ?",
+                (dataset, judge_year)
+            ).fetchone()
+            if row is None:
+                return None
+            total_count, page_hashes, next_probe, synced_at = row
+            return {
+                "totalCount": total_count,
+                "pageHashes": json.loads(page_hashes),
+                "nextProbe": next_probe,
+                "syncedAt": synced_at,
+            }
+
+    def advance_probe(self, dataset: str, judge_year: str, next_probe: int) -> None:
+        """
+        변경되지 않은 파티션에서 다음 동기화 때 확인할 페이지를 기록합니다.
+
+        Args:
+            dataset: 데이터셋 이름
+            judge_year: 포상년도
+            next_probe: 다음에 확인할 페이지 번호
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE sync_partitions SET next_probe = ? WHERE dataset = ? AND judge_year = ?",
+                (next_probe, dataset, judge_year)
+            )
+
+    def apply_partition(
+        self,
+        dataset: str,
+        judge_year: str,
+        items: List[Dict[str, Any]],
+        total_count: int,
+        page_hashes: List[str]
+    ) -> Tuple[int, int, int]:
+        """
+        포상년도 파티션의 전체 항목을 저장된 항목과 비교하여 추가/변경/삭제분만 반영합니다.
+        받은 항목 수가 전체 건수와 다르면 일부 페이지가 빠진 것이므로 삭제분을 반영하지 않고 실패로 처리합니다.
+
+        Args:
+            dataset: 데이터셋 이름
+            judge_year: 포상년도
+            items: 업스트림에서 받은 파티션 전체 항목
+            total_count: 업스트림 전체 건수
+            page_hashes: 파티션 페이지별 항목 해시 (다음 동기화에서 변경 여부를 확인하는 데 사용)
+
+        Returns:
+            (추가된 항목 수, 변경된 항목 수, 삭제된 항목 수) 튜플
+
+        Raises:
+            RuntimeError: 받은 항목 수가 전체 건수와 다른 경우
+        """
+        with self._lock:
+            if len(items) != total_count:
+                raise RuntimeError(
+                    f"{dataset} {judge_year}년 파티션 항목 수({len(items)})가 전체 건수({total_count})와 다릅니다."
+                )
+            existing = {
+                record_key: record_hash(json.loads(data))
+                for record_key, data in self._conn.execute(
+                    "SELECT record_key, data FROM records WHERE dataset = ? AND judge_year = ?",
+                    (dataset, judge_year)
+                )
+            }
+            state = self.get_state(dataset)
+            run_id = state["runId"] if state is not None else 0
+            next_position = self._conn.execute(
+                "SELECT COALESCE(MAX(position), -1) + 1 FROM records WHERE dataset = ?", (dataset,)
+            ).fetchone()[0]
+
+            added, changed = [], []
+            seen = set()
+            for index, item in enumerate(items):
+                mng_no = get_item_field(item, "mngNo")
+                record_key = mng_no if mng_no is not None else f"#{judge_year}:{index}"
+                seen.add(record_key)
+                if record_key not in existing:
+                    added.append(self._to_row(dataset, item, next_position + len(added), run_id, record_key))
+                elif existing[record_key] != record_hash(item):
+                    changed.append((item, record_key))
+            removed = [key for key in existing if key not in seen]
+
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._insert_rows(added)
+                for item, record_key in changed:
+                    # 변경된 항목은 기존 위치를 유지
+                    position = self._conn.execute(
+                        "SELECT position FROM records WHERE dataset = ? AND record_key = ?",
+                        (dataset, record_key)
+                    ).fetchone()[0]
+                    self._insert_rows([self._to_row(dataset, item, position, run_id, record_key)])
+                self._conn.executemany(
+                    "DELETE FROM records WHERE dataset = ? AND record_key = ?",
+                    [(dataset, key) for key in removed]
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO sync_partitions "
+                    "(dataset, judge_year, total_count, page_hashes, next_probe, synced_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (dataset, judge_year, total_count, json.dumps(page_hashes), 2, time.time())
+                )
+            return len(added), len(changed), len(removed)
+
+    def mark_complete(self, dataset: str) -> None:
+        """
+        파티션 단위 동기화로 데이터셋 전체를 갱신한 뒤 조회에 사용할 수 있도록 표시합니다.
+
+        Args:
+            dataset: 데이터셋 이름
+        """
+        with self._lock:
+            state = self.get_state(dataset)
+            run_id = state["runId"] if state is not None else 1
+            now = time.time()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state "
+                "(dataset, run_id, total_count, page_count, started_at, completed_at, completed_run) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    dataset,
+                    run_id,
+                    state["totalCount"] if state is not None else 0,
+                    state["pageCount"] if state is not None else 0,
+                    state["startedAt"] if state is not None else now,
+                    now,
+                    run_id,
+                )
+            )
+            self._ready[dataset] = True
+
+    def query(self, dataset: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        미러에서 검색 조건에 맞는 항목을 조회하여 업스트림과 같은 형식의 응답을 구성합니다.
+
+        Args:
+            dataset: 데이터셋 이름
+            params: build_query_params로 구성한 쿼리 파라미터
+
+        Returns:
+            totalCount, pageCount, pageIndex, countPerPage, itemCount, items를 담은 딕셔너리
+        """
+        with self._lock:
+            page_index = max(int(params.get("nPageIndex") or 1), 1)
+            count_per_page = max(int(params.get("nCountPerPage") or 10), 1)
+
+            clauses = ["dataset = ?"]
+            values: List[Any] = [dataset]
+            for param, column, mode in MIRROR_FIELDS:
+                value = params.get(param)
+                if not value:
+                    continue
+                value = str(value).strip()
+                if mode == "eq":
+                    clauses.append(f"{column} = ?")
+                    values.append(value)
+                elif mode == "prefix":
+                    clauses.append(f"{column} LIKE ? ESCAPE '\\'")
+                    values.append(_escape_like(value) + "%")
+                else:
+                    clauses.append(f"{column} LIKE ? ESCAPE '\\'")
+                    values.append("%" + _escape_like(value) + "%")
+            where = " AND ".join(clauses)
+
+            total_count = self._conn.execute(
+                f"SELECT COUNT(*) FROM records WHERE {where}", values
+            ).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT data FROM records WHERE {where} ORDER BY position LIMIT ? OFFSET ?",
+                values + [count_per_page, (page_index - 1) * count_per_page]
+            ).fetchall()
+            items = [json.loads(row[0]) for row in rows]
+            return {
+                "totalCount": total_count,
+                "pageCount": math.ceil(total_count / count_per_page),
+                "pageIndex": page_index,
+                "countPerPage": count_per_page,
+                "itemCount": len(items),
+                "items": items,
+            }
+
+    def close(self) -> None:
+        """SQLite 연결을 닫습니다."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _to_row(
+        self,
+        dataset: str,
+        item: Dict[str, Any],
+        position: int,
+        run_id: int,
+        record_key: Optional[str] = None
+    ) -> tuple:
+        """항목을 records 테이블의 행으로 변환합니다."""
+        fields = [get_item_field(item, param) for param, _, _ in MIRROR_FIELDS]
+        if record_key is None:
+            # 관리번호가 없는 항목은 위치로 식별
+            record_key = fields[0] if fields[0] is not None else f"#{position}"
+        return (dataset, record_key, *fields, position, run_id, json.dumps(item, ensure_ascii=False))
+
+    def _insert_rows(self, rows: List[tuple]) -> None:
+        """records 테이블에 행을 저장합니다."""
+        columns = ["dataset", "record_key"] + [column for _, column, _ in MIRROR_FIELDS] + ["position", "run_id", "data"]
+        placeholders = ", ".join("?" for _ in columns)
+        self._conn.executemany(
+            f"INSERT OR REPLACE INTO records ({', '.join(columns)}) VALUES ({placeholders})", rows
+        )
+
+def record_hash(item: Dict[str, Any]) -> str:
+    """
+    항목 내용의 해시를 계산합니다.
+
+    Args:
+        item: 공훈록/공적조서 항목
+
+    Returns:
+        SHA-256 해시 문자열
+    """
+    canonical = json.dumps(item, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+def items_hash(items: Iterable[Dict[str, Any]]) -> str:
+    """
+    여러 항목의 내용을 순서대로 합친 해시를 계산합니다.
+
+    Args:
+        items: 공훈록/공적조서 항목 목록
+
+    Returns:
+        SHA-256 해시 문자열
+    """
+    digest = hashlib.sha256()
+    for item in items:
+        digest.update(record_hash(item).encode("ascii"))
+    return digest.hexdigest()
+
+def _escape_like(value: str) -> str:
+    """LIKE 패턴의 특수 문자를 이스케이프합니다."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+# 미러 저장소 인스턴스 생성 (경로를 지정하지 않으면 사용하지 않음)
+mirror_store = MirrorStore(MIRROR_DB_PATH) if MIRROR_DB_PATH else None
@@ -0,0 +1,247 @@
+"""
+독립유공자 공훈록 MCP 서버 - 프로파일링 모듈
+
+이 모듈은 도구 호출을 단계별(캐시 조회, 업스트림 대기, 네트워크, JSON 디코딩, XML 파싱, 응답 직렬화)로
+측정하고, 기준 시간보다 오래 걸린 호출을 인수와 단계별 시간과 함께 순환 로그 파일에 기록합니다.
+기본적으로 꺼져 있으며 PROFILE_ENABLED 환경 변수나 set_profiling 도구로 켤 수 있습니다.
+"""
+
+import json
+import logging
+import time
+from collections import deque
+from contextvars import ContextVar, Token
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from typing import TYPE_CHECKING, Any, Deque, Dict, Optional
+from .config import (
+    logger,
+    PROFILE_ENABLED,
+    PROFILE_SLOW_THRESHOLD_MS,
+    PROFILE_CPROFILE,
+    PROFILE_LOG_PATH,
+    PROFILE_LOG_MAX_BYTES,
+    PROFILE_LOG_BACKUPS,
+)
+from .logs import queued_logger
+
+# cProfile/pstats는 PROFILE_CPROFILE을 사용할 때만 가져옴
+if TYPE_CHECKING:
+    import cProfile
+
+class CallProfile:
+    """도구 호출 한 번의 단계별 측정 결과"""
+
+    __slots__ = ("tool", "arguments", "started", "phases", "profiler", "token")
+
+    def __init__(self, tool: str, arguments: Any):
+        self.tool = tool
+        self.arguments = arguments
+        self.started = time.perf_counter()
+        # 단계 이름 -> [누적 시간(초), 횟수]
+        self.phases: Dict[str, list] = {}
+        self.profiler: Optional["cProfile.Profile"] = None
+        self.token: Optional[Token] = None
+
+    def add(self, phase: str, elapsed: float) -> None:
+        """단계 측정 결과를 더합니다."""
+        entry = self.phases.get(phase)
+        if entry is None:
+            self.phases[phase] = [elapsed, 1]
+        else:
+            entry[0] += elapsed
+            entry[1] += 1
+
+# 현재 작업이 측정 중인 도구 호출 (싱글플라이트 작업처럼 호출 중에 만든 작업에도 전달됨)
+_current_profile: ContextVar[Optional[CallProfile]] = ContextVar("gonghun_call_profile", default=None)
+
+class profile_phase:
+    """
+    측정 중인 도구 호출이 있으면 블록의 실행 시간을 해당 단계에 더하는 컨텍스트 매니저입니다.
+    프로파일링이 꺼져 있으면 컨텍스트 변수 조회 외에는 아무 일도 하지 않습니다.
+    """
+
+    __slots__ = ("phase", "profile", "started")
+
+    def __init__(self, phase: str):
+        self.phase = phase
+        self.profile = _current_profile.get()
+
+    def __enter__(self) -> "profile_phase":
+        if self.profile is not None:
+            self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self.profile is not None:
+            self.profile.add(self.phase, time.perf_counter() - self.started)
+
+class Profiler:
+    """도구 호출 프로파일링 설정과 느린 호출 기록을 관리하는 클래스"""
+
+    def __init__(
+        self,
+        enabled: bool = PROFILE_ENABLED,
+        threshold_ms: float = PROFILE_SLOW_THRESHOLD_MS,
+        use_cprofile: bool = PROFILE_CPROFILE,
+        log_path: str = PROFILE_LOG_PATH
+    ):
+        """
+        프로파일러를 초기화합니다.
+
+        Args:
+            enabled: 단계별 측정 사용 여부
+            threshold_ms: 느린 호출로 기록할 기준 시간(밀리초)
+            use_cprofile: 느린 호출의 cProfile 결과도 기록할지 여부
+            log_path: 느린 호출 기록 파일 경로
+        """
+        self.enabled = enabled
+        self.threshold_ms = threshold_ms
+        self.use_cprofile = use_cprofile
+        self.log_path = log_path
+        self.recent: Deque[Dict[str, Any]] = deque(maxlen=20)
+        self.slow_calls = 0
+        self._cprofile_busy = False
+        self._slow_logger: Optional[logging.Logger] = None
+
+    def configure(
+        self,
+        enabled: Optional[bool] = None,
+        threshold_ms: Optional[float] = None,
+        use_cprofile: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """
+        실행 중에 프로파일링 설정을 바꿉니다.
+
+        Args:
+            enabled: 단계별 측정 사용 여부
+            threshold_ms: 느린 호출 기준 시간(밀리초)
+            use_cprofile: cProfile 사용 여부
+
+        Returns:
+            변경된 설정과 최근 느린 호출 요약
+        """
+        if enabled is not None:
+            self.enabled = enabled
+        if threshold_ms is not None:
+            self.threshold_ms = threshold_ms
+        if use_cprofile is not None:
+            self.use_cprofile = use_cprofile
+        logger.info(
+            f"프로파일링 설정: enabled={self.enabled}, threshold_ms={self.threshold_ms}, cprofile={self.use_cprofile}"
+        )
+        return self.status()
+
+    def status(self) -> Dict[str, Any]:
+        """
+        프로파일링 설정과 최근 느린 호출 요약을 반환합니다.
+
+        Returns:
+            설정, 느린 호출 수, 최근 느린 호출 목록을 담은 딕셔너리
+        """
+        return {
+            "enabled": self.enabled,
+            "thresholdMs": self.threshold_ms,
+            "cprofile": self.use_cprofile,
+            "logPath": self.log_path,
+            "slowCalls": self.slow_calls,
+            "recent": [
+                {key: value for key, value in report.items() if key != "profile"}
+                for report in self.recent
+            ],
+        }
+
+    def start(self, tool: str, arguments: Any) -> Optional[CallProfile]:
+        """
+        도구 호출 측정을 시작합니다.
+
+        Args:
+            tool: 도구 이름
+            arguments: 도구 인수
+
+        Returns:
+            측정 중인 호출 (프로파일링이 꺼져 있으면 None)
+        """
+        if not self.enabled:
+            return None
+        profile = CallProfile(tool, arguments)
+        profile.token = _current_profile.set(profile)
+        # cProfile은 동시에 하나만 실행할 수 있으므로 다른 호출을 측정 중이면 건너뜀
+        # (이벤트 루프 전체를 측정하므로 같은 시간에 실행된 다른 호출의 함수도 결과에 섞일 수 있음)
+        if self.use_cprofile and not self._cprofile_busy:
+            import cProfile
+            try:
+                profile.profiler = cProfile.Profile()
+                profile.profiler.enable()
+                self._cprofile_busy = True
+            except ValueError as e:
+                # 디버거 등 다른 프로파일러가 이미 실행 중인 경우
+                logger.warning(f"cProfile을 시작할 수 없습니다: {str(e)}")
+                profile.profiler = None
+        return profile
+
+    def finish(self, profile: Optional[CallProfile]) -> None:
+        """
+        도구 호출 측정을 마치고, 기준 시간보다 오래 걸렸으면 기록합니다.
+        도구 호출의 finally 블록에서 호출되므로 기록에 실패해도 예외를 전파하지 않고 경고만 남깁니다.
+
+        Args:
+            profile: start가 반환한 측정 중인 호출
+        """
+        if profile is None:
+            return
+        total = time.perf_counter() - profile.started
+        _current_profile.reset(profile.token)
+        if profile.profiler is not None:
+            profile.profiler.disable()
+            self._cprofile_busy = False
+
+        total_ms = total * 1000
+        if total_ms < self.threshold_ms:
+            return
+
+        try:
+            self._report(profile, total_ms)
+        except Exception as e:
+            logger.warning(f"느린 호출 기록 실패: {profile.tool} - {str(e)}")
+
+    def _report(self, profile: CallProfile, total_ms: float) -> None:
+        """느린 호출 보고서를 만들어 최근 목록과 기록 파일에 남깁니다."""
+        phases = {
+            phase: {"ms": round(elapsed * 1000, 2), "count": count}
+            for phase, (elapsed, count) in sorted(profile.phases.items(), key=lambda kv: -kv[1][0])
+        }
+        report = {
+            "time": datetime.now().isoformat(timespec="milliseconds"),
+            "tool": profile.tool,
+            "arguments": profile.arguments,
+            "totalMs": round(total_ms, 2),
+            "phases": phases,
+        }
+        if profile.profiler is not None:
+            import io
+            import pstats
+            out = io.StringIO()
+            pstats.Stats(profile.profiler, stream=out).sort_stats("cumulative").print_stats(25)
+            report["profile"] = out.getvalue()
+
+        self.slow_calls += 1
+        self.recent.append(report)
+        self._write(report)
+
+    def _write(self, report: Dict[str, Any]) -> None:
+        """느린 호출 기록을 순환 로그 파일에 씁니다."""
+        if self._slow_logger is None:
+            # 파일은 처음 기록할 때 작성 스레드에서 엶 (이벤트 루프에서 파일을 열지 않음)
+            self._slow_logger = queued_logger(
+                "gonghun-server.slow-calls",
+                RotatingFileHandler(
+                    self.log_path, maxBytes=PROFILE_LOG_MAX_BYTES, backupCount=PROFILE_LOG_BACKUPS,
+                    encoding="utf-8", delay=True
+                )
+            )
+        self._slow_logger.info(json.dumps(report, ensure_ascii=False, default=str))
+        logger.warning(f"느린 도구 호출: {report['tool']} {report['totalMs']}ms, 단계별: {report['phases']}")
+
+# 프로파일러 인스턴스 생성
+profiler = Profiler()
@@ -0,0 +1,189 @@
+"""
+독립유공자 공훈록 MCP 서버 - 장애 대응 모듈
+
+이 모듈은 업스트림 API 장애에 대응하기 위한 서킷 브레이커, 재시도 대기 시간 계산,
+헤지 요청 지연 시간 계산에 쓰이는 응답 시간 기록을 제공합니다.
+"""
+
+import random
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+from .config import (
+    logger,
+    UPSTREAM_RETRY_BASE_DELAY,
+    UPSTREAM_RETRY_MAX_DELAY,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_TIMEOUT,
+    HEDGE_QUANTILE,
+    HEDGE_MIN_DELAY,
+)
+
+class CircuitOpenError(RuntimeError):
+    """서킷 브레이커가 열려 업스트림 요청을 보내지 않은 경우 발생하는 예외"""
+
+class CircuitBreaker:
+    """연속 실패가 기준을 넘으면 일정 시간 동안 요청을 즉시 실패시키는 서킷 브레이커"""
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_RESET_TIMEOUT
+    ):
+        """
+        서킷 브레이커를 초기화합니다.
+
+        Args:
+            failure_threshold: 서킷을 여는 연속 실패 횟수 (0 이하이면 사용하지 않음)
+            reset_timeout: 서킷을 연 뒤 시험 요청을 허용하기까지의 시간(초)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+
+        # 통계
+        self.opens = 0
+        self.rejected = 0
+
+    def allow(self) -> bool:
+        """
+        요청을 보내도 되는지 확인합니다. 열린 상태에서 reset_timeout이 지나면
+        시험 요청 하나만 허용하고(half_open), 그 결과에 따라 닫거나 다시 엽니다.
+
+        Returns:
+            요청을 보내도 되면 True
+        """
+        if self.failure_threshold <= 0 or self.state == "closed":
+            return True
+
+        now = time.monotonic()
+        if self.state == "open" and now - self.opened_at >= self.reset_timeout:
+            self.state = "half_open"
+            self._probing = False
+
+        # 시험 요청이 결과 없이 취소된 경우를 대비해 reset_timeout이 지나면 다시 시험
+        if self.state == "half_open" and (not self._probing or now - self.opened_at >= 2 * self.reset_timeout):
+            self._probing = True
+            self.opened_at = now - self.reset_timeout
+            logger.info("서킷 브레이커 시험 요청을 보냅니다.")
+            return True
+
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        """업스트림이 정상 응답했음을 기록합니다."""
+        if self.state != "closed":
+            logger.info("업스트림이 복구되어 서킷 브레이커를 닫습니다.")
+        self.state = "closed"
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """업스트림 요청이 실패했음을 기록합니다."""
+        self.failures += 1
+        if self.failure_threshold <= 0:
+            return
+        if self.state == "half_open" or (self.state == "closed" and self.failures >= self.failure_threshold):
+            self.state = "open"
+            self.opened_at = time.monotonic()
+            self._probing = False
+            self.opens += 1
+            logger.warning(
+                f"업스트림 연속 실패 {self.failures}회로 서킷 브레이커를 엽니다. "
+                f"{self.reset_timeout:.0f}초 동안 요청을 보내지 않습니다."
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        서킷 브레이커 상태를 반환합니다.
+
+        Returns:
+            상태, 연속 실패 횟수, 열린 횟수, 거부한 요청 수를 담은 딕셔너리
+        """
+        return {
+            "state": self.state,
+            "consecutiveFailures": self.failures,
+            "opens": self.opens,
+            "rejected": self.rejected,
+        }
+
+class LatencyTracker:
+    """최근 업스트림 응답 시간을 기록하고 분위수를 계산하는 클래스"""
+
+    def __init__(self, size: int = 200):
+        """
+        응답 시간 기록을 초기화합니다.
+
+        Args:
+            size: 보관할 최근 응답 시간 개수
+        """
+        self._samples: Deque[float] = deque(maxlen=size)
+
+    def record(self, latency: float) -> None:
+        """
+        응답 시간을 기록합니다.
+
+        Args:
+            latency: 응답 시간(초)
+        """
+        self._samples.append(latency)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        최근 응답 시간의 분위수를 반환합니다.
+
+        Args:
+            q: 분위 (0~1, 예: 0.95)
+
+        Returns:
+            분위수(초), 기록이 부족하면 None
+        """
+        if len(self._samples) < 20:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def hedge_delay(self) -> float:
+        """
+        헤지 요청을 보내기 전 기다릴 시간을 반환합니다.
+        최근 응답 시간의 HEDGE_QUANTILE 분위수를 사용하며, 기록이 부족하면 HEDGE_MIN_DELAY를 사용합니다.
+
+        Returns:
+            대기 시간(초)
+        """
+        delay = self.quantile(HEDGE_QUANTILE)
+        return max(HEDGE_MIN_DELAY, delay if delay is not None else HEDGE_MIN_DELAY)
+
+def backoff_delay(
+    attempt: int,
+    base: float = UPSTREAM_RETRY_BASE_DELAY,
+    cap: float = UPSTREAM_RETRY_MAX_DELAY
+) -> float:
+    """
+    재시도 전 대기 시간을 계산합니다 (지수 백오프 + full jitter).
+
+    Args:
+        attempt: 재시도 차수 (0부터 시작)
+        base: 첫 재시도의 최대 대기 시간(초)
+        cap: 대기 시간 상한(초)
+
+    Returns:
+        대기 시간(초)
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+# 서킷 브레이커와 응답 시간 기록 인스턴스 생성
+circuit_breaker = CircuitBreaker()
+upstream_latency = LatencyTracker()
+
+# 재시도/헤지 요청 통계
+upstream_counters: Dict[str, int] = {
+    "attempts": 0,
+    "retries": 0,
+    "hedged": 0,
+    "hedgeWins": 0,
+}
@@ -4,17 +4,41 @@
 이 모듈은 MCP 서버의 리소스, 프롬프트, 도구에 대한 핸들러를 정의합니다.
 """
 
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Awaitable, Callable, Iterable, List, Optional, Union
+from urllib.parse import urlencode
 from mcp.server import NotificationOptions
+from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.server.models import InitializationOptions
 import mcp.types as types
 from pydantic import AnyUrl
 
 # MCP 독립유공자 도구 - 국가보훈처 공훈록 및 공적조서 데이터를 조회하는 도구입니다.
 
-from .config import app, logger
-from .utils import parse_resource_uri
-from .api import fetch_merit_list, fetch_public_report
+from .config import app, logger, CACHE_RESPONSE_TEXT, RESOURCE_PAGE_SIZE
+from .utils import (
+    parse_resource_uri,
+    parse_resource_query,
+    format_response,
+    project_fields,
+    make_cache_key,
+)
+from .api import fetch_merit_list, fetch_public_report, fetch_by_ids
+from .cache import cache_manager
+from .metrics import metrics
+from .tools import code_table_text
+from .warmup import cache_warmer
+
+# 목록/단건 리소스를 제공하는 데이터셋 (리소스 타입 -> 조회 함수)
+DATASET_FETCHERS: Dict[str, Callable[..., Awaitable[Dict[str, Any]]]] = {
+    "merit": fetch_merit_list,
+    "report": fetch_public_report,
+}
+
+# 코드 리소스 (경로 -> 코드표 도구 이름)
+CODE_RESOURCES = {
+    "hunkuk": "get_hunkuk_codes",
+    "workout": "get_workout_affil_codes",
+}
 
 @app.list_resources()
 async def handle_list_resources() -> List[types.Resource]:
@@ -30,13 +54,13 @@ async def handle_list_resources() -> List[types.Resource]:
             types.Resource(
                 uri=AnyUrl(f"gonghun://merit/all"),
                 name="독립유공자 공훈록",
-                description="독립유공자 공훈록 정보 - 독립유공자의 기본 정보와 포상 내역을 제공합니다.",
+                description="독립유공자 공훈록 정보 - 독립유공자의 기본 정보와 포상 내역을 제공합니다. (첫 페이지, 다음 페이지는 nextCursor의 URI로 조회)",
                 mimeType="application/json",
             ),
             types.Resource(
                 uri=AnyUrl(f"gonghun://report/all"),
                 name="독립유공자 공적조서",
-                description="독립유공자 공적조서 정보 - 독립유공자의 상세한 활동 내역과 공적 사항을 제공합니다.",
+                description="독립유공자 공적조서 정보 - 독립유공자의 상세한 활동 내역과 공적 사항을 제공합니다. (첫 페이지, 다음 페이지는 nextCursor의 URI로 조회)",
                 mimeType="application/json",
             ),
             types.Resource(
@@ -50,6 +74,12 @@ async def handle_list_resources() -> List[types.Resource]:
                 name="운동계열 코드 정보",
                 description="독립유공자 운동계열 코드 정보 - 3.1운동, 의병활동, 광복군, 임시정부 등 독립운동 유형 분류 체계를 제공합니다.",
                 mimeType="application/json",
+            ),
+            types.Resource(
+                uri=AnyUrl(f"gonghun://stats"),
+                name="서버 실행 지표",
+                description="서버 실행 지표 - 도구/업스트림 응답 시간 히스토그램, 캐시 적중률, 업스트림 상태 코드와 재시도 횟수를 제공합니다.",
+                mimeType="application/json",
             )
         ]
         return resources
@@ -57,14 +87,132 @@ async def handle_list_resources() -> List[types.Resource]:
         logger.error(f"리소스 목록 가져오기 오류: {str(e)}")
         return []
 
+@app.list_resource_templates()
+async def handle_list_resource_templates() -> List[types.ResourceTemplate]:
+    """
+    관리번호나 페이지 번호로 조회하는 리소스 템플릿을 나열합니다.
+    모든 템플릿 URI 뒤에 ?fields=mngNo,nameKo 처럼 응답에 포함할 필드를 지정할 수 있습니다.
+    
+    Returns:
+        리소스 템플릿 목록
+    """
+    return [
+        types.ResourceTemplate(
+            uriTemplate="gonghun://merit/{mngNo}",
+            name="독립유공자 공훈록 (관리번호)",
+            description="관리번호(mngNo)로 독립유공자 한 명의 공훈록을 조회합니다.",
+            mimeType="application/json",
+        ),
+        types.ResourceTemplate(
+            uriTemplate="gonghun://merit/page/{n}",
+            name="독립유공자 공훈록 (페이지)",
+            description=f"독립유공자 공훈록 목록의 n번째 페이지({RESOURCE_PAGE_SIZE}건)를 조회합니다. 다음 페이지 URI는 nextCursor로 제공합니다.",
+            mimeType="application/json",
+        ),
+        types.ResourceTemplate(
+            uriTemplate="gonghun://report/{mngNo}",
+            name="독립유공자 공적조서 (관리번호)",
+            description="관리번호(mngNo)로 독립유공자 한 명의 공적조서를 조회합니다.",
+            mimeType="application/json",
+        ),
+        types.ResourceTemplate(
+            uriTemplate="gonghun://report/page/{n}",
+            name="독립유공자 공적조서 (페이지)",
+            description=f"독립유공자 공적조서 목록의 n번째 페이지({RESOURCE_PAGE_SIZE}건)를 조회합니다. 다음 페이지 URI는 nextCursor로 제공합니다.",
+            mimeType="application/json",
+        ),
+    ]
+
+def _parse_fields(query: Dict[str, str]) -> Optional[List[str]]:
+    """쿼리의 fields 값(쉼표 구분)을 필드 목록으로 변환합니다."""
+    fields = [field.strip() for field in query.get("fields", "").split(",") if field.strip()]
+    return fields or None
+
+def _page_cursor(resource_type: str, data: Dict[str, Any], page: int, fields: Optional[List[str]]) -> Optional[str]:
+    """
+    다음 페이지 리소스 URI를 반환합니다.
+    응답 문자열 캐시 키와 같은 조건만 담도록 원래 쿼리 문자열 대신 정규화한 필드 선택만 붙입니다.
+    
+    Args:
+        resource_type: 리소스 타입 (merit/report)
+        data: 현재 페이지 응답 데이터
+        page: 현재 페이지 번호
+        fields: 항목에 포함할 필드 (다음 페이지에도 그대로 적용)
+        
+    Returns:
+        다음 페이지 URI, 마지막 페이지이면 None
+    """
+    items = data.get("items")
+    if not isinstance(items, list):
+        return None
+    if "totalCount" in data:
+        has_more = page * RESOURCE_PAGE_SIZE < int(data["totalCount"])
+    else:
+        has_more = len(items) == RESOURCE_PAGE_SIZE
+    if not has_more:
+        return None
+    query = urlencode({"fields": ",".join(fields)}, safe=",") if fields else ""
+    return f"gonghun://{resource_type}/page/{page + 1}" + (f"?{query}" if query else "")
+
+async def _read_page(resource_type: str, page: int, fields: Optional[List[str]]) -> Dict[str, Any]:
+    """
+    목록 리소스의 한 페이지를 조회하여 다음 페이지 커서를 붙입니다.
+    
+    Args:
+        resource_type: 리소스 타입 (merit/report)
+        page: 페이지 번호 (1부터)
+        fields: 항목에 포함할 필드
+        
+    Returns:
+        필드가 선택되고 nextCursor가 추가된 응답 데이터
+    """
+    data = await DATASET_FETCHERS[resource_type](
+        page_index=page,
+        count_per_page=RESOURCE_PAGE_SIZE,
+        response_type="JSON"
+    )
+    if "error" in data:
+        return data
+    result = project_fields(data, fields)
+    result = dict(result, nextCursor=_page_cursor(resource_type, data, page, fields))
+    return result
+
+async def _read_record(resource_type: str, mng_no: str, fields: Optional[List[str]]) -> Dict[str, Any]:
+    """
+    관리번호로 한 명의 항목을 조회합니다 (캐시/로컬 미러 우선).
+    
+    Args:
+        resource_type: 리소스 타입 (merit/report)
+        mng_no: 관리번호
+        fields: 항목에 포함할 필드
+        
+    Returns:
+        조회한 항목
+        
+    Raises:
+        RuntimeError: 업스트림 조회가 실패한 경우
+        ValueError: 관리번호에 해당하는 항목이 없는 경우
+    """
+    result = (await fetch_by_ids(DATASET_FETCHERS[resource_type], [mng_no], response_type="JSON"))["results"][0]
+    if "error" in result:
+        raise RuntimeError(result["error"])
+    if not result["found"]:
+        raise ValueError(f"관리번호 {mng_no}에 해당하는 항목이 없습니다.")
+    return project_fields({"items": [result["item"]]}, fields)["items"][0]
+
+def _json_contents(text: str) -> Iterable[ReadResourceContents]:
+    """JSON 문자열을 리소스 내용으로 감쌉니다."""
+    return [ReadResourceContents(content=text, mime_type="application/json")]
+
 @app.read_resource()
-async def handle_read_resource(uri: AnyUrl) -> str:
+async def handle_read_resource(uri: AnyUrl) -> Iterable[ReadResourceContents]:
     """
     특정 독립유공자 공훈록 관련 리소스 정보를 읽습니다.
     이 함수는 MCP가 특정 독립유공자 데이터를 요청할 때 호출됩니다.
+    목록/단건 리소스는 도구와 같은 캐시(응답 문자열 캐시 포함)와 필드 선택 과정을 거칩니다.
     
     Args:
-        uri: 리소스 URI (예: gonghun://merit/all, gonghun://report/all 등)
+        uri: 리소스 URI (예: gonghun://merit/all, gonghun://merit/page/2, gonghun://report/{mngNo} 등)
         
     Returns:
         리소스 내용: JSON 형식의 독립유공자 데이터
@@ -74,39 +222,50 @@ async def handle_read_resource(uri: AnyUrl) -> str:
     """
     try:
         # URI 파싱
-        resource_type, params = parse_resource_uri(str(uri))
+        uri_str = str(uri)
+        resource_type, params = parse_resource_uri(uri_str)
+        query = parse_resource_query(uri_str)
+        fields = _parse_fields(query)
         
-        if resource_type == "merit":
-            # 공훈록 목록 조회
-            data = await fetch_merit_list(
-                page_index=1,
-                count_per_page=10,
-                response_type="JSON"
-            )
-            return str(data)
-        
-        elif resource_type == "report":
-            # 공적조서 조회
-            data = await fetch_public_report(
-                page_index=1,
-                count_per_page=10,
-                response_type="JSON"
-            )
-            return str(data)
-        
-        elif resource_type == "code":
-            from .config import HUNKUK_CODES, WORKOUT_AFFIL_CODES
+        if resource_type in DATASET_FETCHERS:
+            # 공훈록/공적조서 (목록 페이지 또는 관리번호 단건)
+            if not params or params[0] == "all":
+                params = ["page", "1"]
             
-            if params[0] == "hunkuk":
-                # 훈격 코드 정보
-                return str(HUNKUK_CODES)
+            response_key = make_cache_key(f"resource:{resource_type}", {
+                "path": "/".join(params),
+                "fields": ",".join(fields) if fields else None,
+            }) if CACHE_RESPONSE_TEXT else None
+            cached_text = cache_manager.get_text(response_key) if response_key else None
+            if cached_text is not None:
+                # 응답 문자열 캐시 적중도 캐시 예열 순위에 반영
+                cache_warmer.record_response(response_key)
+                return _json_contents(cached_text)
             
-            elif params[0] == "workout":
-                # 운동계열 코드 정보
-                return str(WORKOUT_AFFIL_CODES)
+            with cache_warmer.track(response_key):
+                if params[0] == "page":
+                    if len(params) != 2 or not params[1].isdigit() or int(params[1]) < 1:
+                        raise ValueError(f"잘못된 페이지 번호: {'/'.join(params[1:])}")
+                    data = await _read_page(resource_type, int(params[1]), fields)
+                elif len(params) == 1:
+                    data = await _read_record(resource_type, params[0], fields)
+                else:
+                    raise ValueError(f"지원하지 않는 리소스 경로: {uri_str}")
             
-            else:
-                raise ValueError(f"지원하지 않는 코드 타입: {params[0]}")
+            text = format_response(data)
+            if response_key is not None and "error" not in data and "cacheStatus" not in data:
+                cache_manager.set_text(response_key, text)
+            return _json_contents(text)
+        
+        elif resource_type == "stats":
+            # 서버 실행 지표
+            return _json_contents(format_response(metrics.snapshot()))
+        
+        elif resource_type == "code":
+            if not params or params[0] not in CODE_RESOURCES:
+                raise ValueError(f"지원하지 않는 코드 타입: {params[0] if params else ''}")
+            # 훈격/운동계열 코드 정보
+            return _json_contents(code_table_text(CODE_RESOURCES[params[0]]))
         
         else:
             raise ValueError(f"지원하지 않는 리소스 타입: {resource_type}")
@@ -0,0 +1,148 @@
+"""
+독립유공자 공훈록 MCP 서버 - 세션 모듈
+
+이 모듈은 하나의 서버 프로세스가 여러 MCP 세션(SSE 연결)을 처리할 때 필요한
+세션별 동시 도구 호출 제한, 최대 세션 수 제한, 종료 시 진행 중인 호출을 기다리는 기능을 제공합니다.
+캐시, HTTP 커넥션 풀, 진행 중인 요청 합치기(single-flight)는 모듈 단위 인스턴스이므로 모든 세션이 공유합니다.
+"""
+
+import asyncio
+import weakref
+from typing import Any, Dict, Optional
+from .config import (
+    logger,
+    app,
+    MCP_SESSION_MAX_CONCURRENCY,
+    MCP_MAX_SESSIONS,
+)
+
+class SessionManager:
+    """세션별 동시 도구 호출 수와 연결된 세션 수를 관리하는 클래스"""
+
+    def __init__(
+        self,
+        max_concurrency: int = MCP_SESSION_MAX_CONCURRENCY,
+        max_sessions: int = MCP_MAX_SESSIONS
+    ):
+        """
+        세션 관리자를 초기화합니다.
+
+        Args:
+            max_concurrency: 세션 하나가 동시에 실행할 수 있는 도구 호출 수 (0이면 제한 없음)
+            max_sessions: 동시에 연결할 수 있는 세션 수 (0이면 제한 없음)
+        """
+        self.max_concurrency = max_concurrency
+        self.max_sessions = max_sessions
+        # 세션 객체 -> 세마포어 (세션이 끝나면 자동으로 제거)
+        self._semaphores: "weakref.WeakKeyDictionary[Any, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+        self.sessions = 0
+        self.in_flight = 0
+        self.rejected_sessions = 0
+        self.draining = False
+        self._idle: Optional[asyncio.Event] = None
+
+    def _current_session(self) -> Optional[Any]:
+        """현재 요청을 보낸 MCP 세션 (요청 처리 중이 아니면 None)"""
+        try:
+            return app.request_context.session
+        except LookupError:
+            return None
+
+    async def acquire(self) -> Optional[asyncio.Semaphore]:
+        """
+        도구 호출을 시작하기 전에 세션별 실행 슬롯을 얻습니다.
+        같은 세션의 호출이 이미 max_concurrency개 실행 중이면 하나가 끝날 때까지 기다립니다.
+
+        Returns:
+            release에 전달할 세마포어 (세션 밖에서 호출되었거나 제한이 없으면 None)
+
+        Raises:
+            RuntimeError: 서버가 종료 중인 경우
+        """
+        if self.draining:
+            raise RuntimeError("서버가 종료 중입니다. 잠시 후 다시 연결해주세요.")
+
+        semaphore = None
+        session = self._current_session()
+        if session is not None and self.max_concurrency > 0:
+            semaphore = self._semaphores.get(session)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.max_concurrency)
+                self._semaphores[session] = semaphore
+            await semaphore.acquire()
+
+        self.in_flight += 1
+        if self._idle is not None:
+            self._idle.clear()
+        return semaphore
+
+    def release(self, semaphore: Optional[asyncio.Semaphore]) -> None:
+        """
+        도구 호출이 끝나면 실행 슬롯을 반환합니다.
+
+        Args:
+            semaphore: acquire가 반환한 세마포어
+        """
+        self.in_flight -= 1
+        if semaphore is not None:
+            semaphore.release()
+        if self.in_flight == 0 and self._idle is not None:
+            self._idle.set()
+
+    def open_session(self) -> bool:
+        """
+        새 세션 연결을 등록합니다.
+
+        Returns:
+            연결을 받을 수 있으면 True, 종료 중이거나 최대 세션 수에 도달했으면 False
+        """
+        if self.draining or (self.max_sessions > 0 and self.sessions >= self.max_sessions):
+            self.rejected_sessions += 1
+            return False
+        self.sessions += 1
+        return True
+
+    def close_session(self) -> None:
+        """세션 연결 종료를 기록합니다."""
+        self.sessions -= 1
+
+    async def drain(self, timeout: float) -> bool:
+        """
+        새 도구 호출을 거절하고, 진행 중인 호출이 모두 끝날 때까지 기다립니다.
+
+        Args:
+            timeout: 최대 대기 시간(초)
+
+        Returns:
+            제한 시간 안에 모든 호출이 끝났는지 여부
+        """
+        self.draining = True
+        if self.in_flight == 0:
+            return True
+        logger.info(f"진행 중인 도구 호출 {self.in_flight}건이 끝나기를 기다립니다 (최대 {timeout}초)")
+        self._idle = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.warning(f"종료 대기 시간이 지나 진행 중인 도구 호출 {self.in_flight}건을 중단합니다.")
+            return False
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        세션 상태를 반환합니다.
+
+        Returns:
+            연결된 세션 수, 진행 중인 도구 호출 수, 제한 설정, 종료 중 여부를 담은 딕셔너리
+        """
+        return {
+            "sessions": self.sessions,
+            "maxSessions": self.max_sessions,
+            "rejectedSessions": self.rejected_sessions,
+            "inFlight": self.in_flight,
+            "maxConcurrencyPerSession": self.max_concurrency,
+            "draining": self.draining,
+        }
+
+# 세션 관리자 인스턴스 생성
+session_manager = SessionManager()
@@ -0,0 +1,69 @@
+"""
+독립유공자 공훈록 MCP 서버 - 싱글플라이트 모듈
+
+이 모듈은 동일한 키로 동시에 들어온 업스트림 요청을 하나로 합치는 기능을 제공합니다.
+공유 요청은 기다리는 호출자 중 가장 높은 우선순위로 처리되므로, 백그라운드 갱신이 시작한 요청에
+대화형 호출자가 합류하면 그 요청도 대화형 우선순위로 올라갑니다.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+from .config import logger
+from .limiter import SharedPriority, current_priority, shared_priority_context, upstream_limiter
+
+class SingleFlight:
+    """동일한 키에 대해 진행 중인 요청을 공유하는 클래스"""
+
+    def __init__(self):
+        """싱글플라이트 그룹을 초기화합니다."""
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._priorities: Dict[str, SharedPriority] = {}
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        키에 해당하는 요청이 진행 중이면 그 결과를 기다리고, 없으면 새로 실행합니다.
+        첫 번째 호출자만 func를 실행하며, 동시에 들어온 호출자들은 같은 결과나 예외를 받습니다.
+
+        Args:
+            key: 요청을 식별하는 키 (캐시 키)
+            func: 실제 요청을 수행하는 코루틴 함수
+
+        Returns:
+            func의 실행 결과
+        """
+        task = self._inflight.get(key)
+        priority = current_priority()
+        if task is None:
+            # 공유 요청은 이 호출자의 컨텍스트를 복사해 실행하되, 합류하는 호출자가 높일 수 있는 우선순위를 따름
+            shared = SharedPriority(priority)
+            task = shared_priority_context(shared).run(asyncio.ensure_future, func())
+            self._inflight[key] = task
+            self._priorities[key] = shared
+            task.add_done_callback(lambda t: self._finish(key, t))
+        else:
+            logger.debug(f"진행 중인 요청에 합류합니다: {key}")
+            upstream_limiter.promote(self._priorities[key], priority)
+
+        # 한 호출자가 취소되어도 공유 요청은 계속 진행되도록 보호
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        """완료된 요청을 진행 목록에서 제거합니다."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+            del self._priorities[key]
+        # 모든 호출자가 취소된 경우에도 예외가 회수되도록 처리
+        if not task.cancelled():
+            task.exception()
+
+    def in_flight(self) -> int:
+        """
+        현재 진행 중인 요청 수를 반환합니다.
+
+        Returns:
+            진행 중인 요청 수
+        """
+        return len(self._inflight)
+
+# 싱글플라이트 인스턴스 생성
+single_flight = SingleFlight()
@@ -0,0 +1,147 @@
+"""
+독립유공자 공훈록 MCP 서버 - SSE 서버 모듈
+
+이 모듈은 MCP_TRANSPORT=sse일 때 사용하는 HTTP(SSE) 전송을 제공합니다.
+하나의 오래 실행되는 프로세스가 여러 MCP 세션을 동시에 처리하므로 캐시, HTTP 커넥션 풀,
+진행 중인 요청 합치기를 모든 세션이 공유합니다.
+
+- GET /sse: 세션 연결 (서버 메시지를 SSE로 전송)
+- POST /messages/?session_id=...: 클라이언트 메시지 전송
+- GET /healthz: 세션/도구 호출 상태 (종료 중이면 503)
+
+SIGTERM/SIGINT를 받으면 새 세션과 도구 호출을 거절하고, 진행 중인 도구 호출이 끝나거나
+MCP_SHUTDOWN_GRACE_PERIOD가 지날 때까지 기다린 뒤 연결을 닫습니다. 두 번째 신호를 받으면 바로 종료합니다.
+"""
+
+import asyncio
+from types import FrameType
+from typing import Any, Optional
+
+import uvicorn
+from mcp.server.sse import SseServerTransport
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.routing import Mount, Route
+from starlette.types import Message, Receive, Scope, Send
+
+from .config import (
+    logger,
+    app,
+    MCP_HTTP_HOST,
+    MCP_HTTP_PORT,
+    MCP_SHUTDOWN_GRACE_PERIOD,
+)
+from .sessions import session_manager
+
+class SseEndpoint:
+    """SSE 세션 연결을 받아 MCP 서버를 실행하는 ASGI 앱"""
+
+    def __init__(self, transport: SseServerTransport):
+        self.transport = transport
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not session_manager.open_session():
+            response = PlainTextResponse("세션을 더 받을 수 없습니다.", status_code=503)
+            await response(scope, receive, send)
+            return
+
+        # SSE 전송은 연결이 끊겨도 세션을 끝내지 않으므로, 연결 종료(클라이언트 연결 끊김 또는
+        # 서버 종료로 스트림이 닫힘)를 감지하여 직접 세션을 끝냄
+        closed = asyncio.Event()
+
+        async def watched_receive() -> Message:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                closed.set()
+            return message
+
+        async def watched_send(message: Message) -> None:
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                closed.set()
+
+        try:
+            async with self.transport.connect_sse(scope, watched_receive, watched_send) as (read_stream, write_stream):
+                run_task = asyncio.ensure_future(
+                    app.run(read_stream, write_stream, app.create_initialization_options())
+                )
+                closed_task = asyncio.ensure_future(closed.wait())
+                try:
+                    await asyncio.wait({run_task, closed_task}, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    run_task.cancel()
+                    closed_task.cancel()
+                    await asyncio.gather(run_task, closed_task, return_exceptions=True)
+        finally:
+            session_manager.close_session()
+
+async def healthz(request: Request) -> JSONResponse:
+    """세션 상태를 반환합니다. 종료 중이면 503을 반환하여 부하 분산기가 새 연결을 보내지 않게 합니다."""
+    stats = session_manager.stats()
+    return JSONResponse(stats, status_code=503 if stats["draining"] else 200)
+
+def create_sse_app() -> Starlette:
+    """
+    SSE 전송을 제공하는 ASGI 앱을 만듭니다.
+
+    Returns:
+        Starlette 앱
+    """
+    transport = SseServerTransport("/messages/")
+    return Starlette(
+        routes=[
+            Route("/sse", endpoint=SseEndpoint(transport)),
+            Mount("/messages/", app=transport.handle_post_message),
+            Route("/healthz", endpoint=healthz),
+        ]
+    )
+
+class DrainingServer(uvicorn.Server):
+    """종료 신호를 받으면 진행 중인 도구 호출을 먼저 마친 뒤 종료하는 uvicorn 서버"""
+
+    def __init__(self, config: uvicorn.Config, grace_period: float):
+        super().__init__(config)
+        self.grace_period = grace_period
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._drain_task: Optional[asyncio.Task] = None
+
+    async def serve(self, sockets: Any = None) -> None:
+        self._loop = asyncio.get_running_loop()
+        await super().serve(sockets)
+
+    def handle_exit(self, sig: int, frame: Optional[FrameType]) -> None:
+        if session_manager.draining or self._loop is None:
+            # 두 번째 신호: 기다리지 않고 종료
+            self.should_exit = True
+            self.force_exit = True
+            return
+        session_manager.draining = True
+        self._loop.call_soon_threadsafe(self._start_drain)
+
+    def _start_drain(self) -> None:
+        self._drain_task = asyncio.ensure_future(self._drain())
+
+    async def _drain(self) -> None:
+        logger.info("종료 신호를 받았습니다. 새 세션과 도구 호출을 거절합니다.")
+        await session_manager.drain(self.grace_period)
+        self.should_exit = True
+
+async def serve_sse(host: str = MCP_HTTP_HOST, port: int = MCP_HTTP_PORT) -> None:
+    """
+    SSE 전송으로 MCP 서버를 실행합니다. 종료 신호를 받을 때까지 반환하지 않습니다.
+
+    Args:
+        host: 바인딩할 주소
+        port: 바인딩할 포트
+    """
+    config = uvicorn.Config(
+        create_sse_app(),
+        host=host,
+        port=port,
+        log_level="warning",
+        # 진행 중인 도구 호출은 DrainingServer가 먼저 기다리므로 남은 SSE 연결은 짧게만 기다림
+        timeout_graceful_shutdown=1,
+    )
+    logger.info(f"SSE 전송으로 서버를 실행합니다: http://{host}:{port}/sse")
+    await DrainingServer(config, MCP_SHUTDOWN_GRACE_PERIOD).serve()
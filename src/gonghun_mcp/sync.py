@@ -0,0 +1,378 @@
+"""
+독립유공자 공훈록 MCP 서버 - 동기화 모듈
+
+이 모듈은 공훈록/공적조서 전체 페이지를 받아 로컬 미러에 저장하는 동기화 작업을 담당합니다.
+미러 저장소(SQLite) 호출은 다른 세션의 도구 호출을 막지 않도록 asyncio.to_thread로 실행합니다.
+"""
+
+import argparse
+import asyncio
+import math
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from .config import (
+    logger,
+    MAX_COUNT_PER_PAGE,
+    MIRROR_SYNC_CONCURRENCY,
+    MIRROR_FIRST_JUDGE_YEAR,
+)
+from .api import fetch_merit_list, fetch_public_report
+from .client import http_client_manager
+from .limiter import background_priority
+from .mirror import mirror_store, items_hash
+
+# 동기화 대상 데이터셋과 조회 함수
+DATASETS: Dict[str, Callable[..., Awaitable[Dict[str, Any]]]] = {
+    "merit_list": fetch_merit_list,
+    "public_report": fetch_public_report,
+}
+
+# 백그라운드 동기화 작업
+_sync_task: Optional[asyncio.Task] = None
+
+def _page_items(dataset: str, page: int, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    동기화한 페이지 응답에서 항목 목록을 꺼냅니다.
+    오류 응답을 빈 페이지로 저장하면 이번 실행에서 다시 저장되지 않은 기존 항목이 삭제되므로 실패로 처리합니다.
+
+    Args:
+        dataset: 데이터셋 이름
+        page: 페이지 번호
+        data: 페이지 응답 데이터
+
+    Returns:
+        페이지의 항목 목록
+
+    Raises:
+        RuntimeError: 오류 응답이거나 항목 목록이 없는 경우
+    """
+    if "error" in data:
+        raise RuntimeError(f"{dataset} {page} 페이지 오류 응답: {data.get('message') or data['error']}")
+    items = data.get("items")
+    if not isinstance(items, list):
+        raise RuntimeError(f"{dataset} {page} 페이지 응답에 항목 목록이 없습니다.")
+    return items
+
+async def sync_dataset(
+    dataset: str,
+    concurrency: int = MIRROR_SYNC_CONCURRENCY,
+    resume: bool = True
+) -> Dict[str, Any]:
+    """
+    데이터셋의 전체 페이지를 받아 로컬 미러에 저장합니다.
+    첫 페이지로 전체 건수(totalCount)와 페이지 수(pageCount)를 확인한 뒤 나머지 페이지를
+    제한된 동시성으로 받으며, 페이지마다 체크포인트를 기록하므로 중단되어도 이어서 진행할 수 있습니다.
+
+    Args:
+        dataset: 데이터셋 이름 (merit_list/public_report)
+        concurrency: 동시에 요청할 최대 페이지 수
+        resume: 중단된 동기화를 이어서 진행할지 여부
+
+    Returns:
+        동기화 결과 요약
+
+    Raises:
+        RuntimeError: 미러가 설정되지 않았거나 지원하지 않는 데이터셋이거나 첫 페이지가 오류 응답인 경우
+    """
+    if mirror_store is None:
+        raise RuntimeError("로컬 미러가 설정되지 않았습니다. MIRROR_DB_PATH를 지정해주세요.")
+    if dataset not in DATASETS:
+        raise RuntimeError(f"지원하지 않는 데이터셋: {dataset}")
+
+    fetch = DATASETS[dataset]
+    first = await fetch(page_index=1, count_per_page=MAX_COUNT_PER_PAGE, use_cache=False)
+    first_items = _page_items(dataset, 1, first)
+    total_count = int(first.get("totalCount") or 0)
+    page_count = int(first.get("pageCount") or math.ceil(total_count / MAX_COUNT_PER_PAGE))
+
+    pages = await asyncio.to_thread(mirror_store.begin_run, dataset, total_count, page_count, resume)
+    logger.info(f"{dataset} 동기화 시작: 전체 {total_count}건, 남은 페이지 {len(pages)}/{page_count}")
+
+    stored = 0
+    if 1 in pages:
+        stored += await asyncio.to_thread(mirror_store.store_page, dataset, 1, MAX_COUNT_PER_PAGE, first_items)
+        pages.remove(1)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def sync_page(page: int) -> int:
+        async with semaphore:
+            data = await fetch(page_index=page, count_per_page=MAX_COUNT_PER_PAGE, use_cache=False)
+        items = _page_items(dataset, page, data)
+        return await asyncio.to_thread(mirror_store.store_page, dataset, page, MAX_COUNT_PER_PAGE, items)
+
+    results = await asyncio.gather(*[sync_page(page) for page in pages], return_exceptions=True)
+
+    failed: List[int] = []
+    for page, result in zip(pages, results):
+        if isinstance(result, BaseException):
+            logger.error(f"{dataset} {page} 페이지 동기화 실패: {str(result)}")
+            failed.append(page)
+        else:
+            stored += result
+
+    removed = 0
+    if not failed:
+        removed = await asyncio.to_thread(mirror_store.finish_run, dataset)
+
+    return {
+        "dataset": dataset,
+        "totalCount": total_count,
+        "pageCount": page_count,
+        "storedRecords": stored,
+        "removedRecords": removed,
+        "failedPages": failed,
+        "completed": not failed,
+    }
+
+async def _total_count(fetch: Callable[..., Awaitable[Dict[str, Any]]]) -> Optional[int]:
+    """
+    조건 없이 조회한 데이터셋 전체 건수를 반환합니다.
+
+    Args:
+        fetch: 조회 함수
+
+    Returns:
+        전체 건수, 오류 응답이면 None
+    """
+    data = await fetch(page_index=1, count_per_page=1, use_cache=False)
+    if "error" in data or "totalCount" not in data:
+        return None
+    return int(data["totalCount"])
+
+def judge_years() -> List[str]:
+    """
+    증분 동기화에 사용할 포상년도 파티션 목록을 반환합니다.
+
+    Returns:
+        MIRROR_FIRST_JUDGE_YEAR부터 올해까지의 포상년도 목록
+    """
+    return [str(year) for year in range(MIRROR_FIRST_JUDGE_YEAR, datetime.now().year + 1)]
+
+async def sync_incremental(
+    dataset: str,
+    concurrency: int = MIRROR_SYNC_CONCURRENCY,
+    years: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    포상년도(judgeYear) 파티션 단위로 변경된 부분만 동기화합니다.
+    파티션마다 전체 건수와 일부 페이지(첫 페이지, 마지막 페이지, 실행마다 돌아가며 고르는 중간 페이지 하나)의
+    해시를 지난 동기화 때 저장한 페이지별 해시와 비교하고, 달라진 파티션과 올해 파티션만 전체 페이지를 다시 받아
+    추가/변경/삭제분을 반영합니다. 3페이지 이하의 파티션은 모든 페이지를 확인하므로 변경을 정확히 감지하며,
+    그보다 큰 파티션의 중간 페이지 변경은 돌아가며 확인하는 페이지가 그 페이지에 이를 때 감지됩니다.
+
+    Args:
+        dataset: 데이터셋 이름 (merit_list/public_report)
+        concurrency: 동시에 요청할 최대 페이지 수
+        years: 동기화할 포상년도 목록 (기본값은 전체 포상년도)
+
+    Returns:
+        파티션 확인/재수집 수와 추가/변경/삭제된 항목 수를 담은 요약
+
+    Raises:
+        RuntimeError: 미러가 설정되지 않았거나 지원하지 않는 데이터셋인 경우
+    """
+    if mirror_store is None:
+        raise RuntimeError("로컬 미러가 설정되지 않았습니다. MIRROR_DB_PATH를 지정해주세요.")
+    if dataset not in DATASETS:
+        raise RuntimeError(f"지원하지 않는 데이터셋: {dataset}")
+
+    fetch = DATASETS[dataset]
+    current_year = str(datetime.now().year)
+    partitions = years or judge_years()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_partition_page(judge_year: str, page: int) -> Dict[str, Any]:
+        async with semaphore:
+            return await fetch(
+                page_index=page,
+                count_per_page=MAX_COUNT_PER_PAGE,
+                judge_year=judge_year,
+                use_cache=False
+            )
+
+    # 파티션별 업스트림 전체 건수 (모든 항목이 파티션에 포함되는지 확인하는 데 사용)
+    partition_totals: Dict[str, int] = {}
+
+    async def sync_partition(judge_year: str) -> Optional[tuple]:
+        first = await fetch_partition_page(judge_year, 1)
+        pages = {1: _page_items(dataset, 1, first)}
+        total_count = int(first.get("totalCount") or 0)
+        partition_totals[judge_year] = total_count
+        page_count = max(int(first.get("pageCount") or math.ceil(total_count / MAX_COUNT_PER_PAGE)), 1)
+
+        previous = await asyncio.to_thread(mirror_store.get_partition, dataset, judge_year)
+        unchanged = (
+            previous is not None and judge_year != current_year
+            and previous["totalCount"] == total_count and len(previous["pageHashes"]) == page_count
+        )
+        if unchanged:
+            # 마지막 페이지와 돌아가며 고르는 중간 페이지 하나를 더 받아 저장된 페이지 해시와 비교
+            next_probe = previous["nextProbe"] if 1 < previous["nextProbe"] < page_count else 2
+            probes = sorted({page_count, next_probe} & set(range(2, page_count + 1)))
+            for page, data in zip(probes, await asyncio.gather(*[
+                fetch_partition_page(judge_year, page) for page in probes
+            ])):
+                pages[page] = _page_items(dataset, page, data)
+            unchanged = all(
+                items_hash(items) == previous["pageHashes"][page - 1] for page, items in pages.items()
+            )
+        if unchanged:
+            if page_count > 3:
+                await asyncio.to_thread(
+                    mirror_store.advance_probe, dataset, judge_year,
+                    next_probe + 1 if next_probe + 1 < page_count else 2
+                )
+            return None
+
+        missing = [page for page in range(2, page_count + 1) if page not in pages]
+        for page, data in zip(missing, await asyncio.gather(*[
+            fetch_partition_page(judge_year, page) for page in missing
+        ])):
+            pages[page] = _page_items(dataset, page, data)
+        items = [item for page in sorted(pages) for item in pages[page]]
+        page_hashes = [items_hash(pages[page]) for page in sorted(pages)]
+        # 저장된 항목을 모두 읽어 비교하고 쓰는 작업이므로 스레드에서 실행
+        return await asyncio.to_thread(
+            mirror_store.apply_partition, dataset, judge_year, items, total_count, page_hashes
+        )
+
+    results = await asyncio.gather(*[sync_partition(year) for year in partitions], return_exceptions=True)
+
+    summary = {
+        "dataset": dataset,
+        "partitionsChecked": len(partitions),
+        "partitionsRefetched": 0,
+        "added": 0,
+        "changed": 0,
+        "removed": 0,
+        "failedPartitions": [],
+    }
+    for judge_year, result in zip(partitions, results):
+        if isinstance(result, BaseException):
+            logger.error(f"{dataset} {judge_year}년 파티션 동기화 실패: {str(result)}")
+            summary["failedPartitions"].append(judge_year)
+        elif result is not None:
+            added, changed, removed = result
+            summary["partitionsRefetched"] += 1
+            summary["added"] += added
+            summary["changed"] += changed
+            summary["removed"] += removed
+
+    summary["completed"] = not summary["failedPartitions"]
+    if summary["completed"] and years is None:
+        # 포상년도가 비어 있거나 범위 밖인 항목은 파티션으로 받을 수 없으므로,
+        # 파티션 합계가 전체 건수와 같을 때만 미러를 조회에 사용
+        total_count = await _total_count(fetch)
+        partitioned = sum(partition_totals.values())
+        summary["totalCount"] = total_count
+        summary["partitionedCount"] = partitioned
+        if total_count == partitioned:
+            await asyncio.to_thread(mirror_store.mark_complete, dataset)
+        else:
+            logger.warning(
+                f"{dataset} 포상년도 파티션 합계({partitioned}건)가 전체 건수({total_count}건)와 달라 "
+                f"미러를 조회에 사용하지 않습니다. 전체 동기화(--full)가 필요합니다."
+            )
+
+    logger.info(
+        f"{dataset} 증분 동기화 완료: 파티션 {summary['partitionsRefetched']}/{len(partitions)}개 재수집, "
+        f"추가 {summary['added']}건, 변경 {summary['changed']}건, 삭제 {summary['removed']}건"
+    )
+    return summary
+
+async def sync_all(
+    datasets: Optional[List[str]] = None,
+    concurrency: int = MIRROR_SYNC_CONCURRENCY,
+    resume: bool = True,
+    mode: str = "incremental"
+) -> List[Dict[str, Any]]:
+    """
+    여러 데이터셋을 차례로 동기화합니다.
+
+    Args:
+        datasets: 동기화할 데이터셋 목록 (기본값은 전체)
+        concurrency: 동시에 요청할 최대 페이지 수
+        resume: 중단된 전체 동기화를 이어서 진행할지 여부
+        mode: incremental(포상년도 파티션 단위 증분 동기화) 또는 full(전체 재수집)
+
+    Returns:
+        데이터셋별 동기화 결과 요약
+    """
+    results = []
+    for dataset in datasets or list(DATASETS):
+        if mode == "full":
+            results.append(await sync_dataset(dataset, concurrency, resume))
+        else:
+            results.append(await sync_incremental(dataset, concurrency))
+    return results
+
+def start_background_sync(
+    datasets: Optional[List[str]] = None,
+    resume: bool = True,
+    mode: str = "incremental"
+) -> bool:
+    """
+    백그라운드에서 동기화를 시작합니다. 이미 진행 중이면 새로 시작하지 않습니다.
+    동기화 요청은 백그라운드 우선순위로 처리되어 도구 호출을 지연시키지 않습니다.
+
+    Args:
+        datasets: 동기화할 데이터셋 목록 (기본값은 전체)
+        resume: 중단된 전체 동기화를 이어서 진행할지 여부
+        mode: incremental(증분 동기화) 또는 full(전체 재수집)
+
+    Returns:
+        새로 시작했으면 True, 이미 진행 중이면 False
+    """
+    global _sync_task
+    if _sync_task is not None and not _sync_task.done():
+        return False
+
+    # 동기화 요청은 대화형 도구 호출보다 뒤로 미룸
+    with background_priority():
+        _sync_task = asyncio.ensure_future(sync_all(datasets, resume=resume, mode=mode))
+
+    def _done(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"백그라운드 동기화 실패: {str(task.exception())}")
+
+    _sync_task.add_done_callback(_done)
+    return True
+
+async def get_sync_status() -> Dict[str, Any]:
+    """
+    동기화 상태를 반환합니다. 미러 상태 조회(COUNT)는 스레드에서 실행합니다.
+
+    Returns:
+        진행 여부와 데이터셋별 미러 상태를 담은 딕셔너리
+    """
+    return {
+        "enabled": mirror_store is not None,
+        "running": _sync_task is not None and not _sync_task.done(),
+        "datasets": {
+            dataset: await asyncio.to_thread(mirror_store.get_state, dataset) if mirror_store is not None else None
+            for dataset in DATASETS
+        },
+    }
+
+async def _main(datasets: Optional[List[str]], mode: str) -> None:
+    """명령행에서 동기화를 실행합니다."""
+    await http_client_manager.start()
+    try:
+        for result in await sync_all(datasets, mode=mode):
+            logger.info(f"동기화 결과: {result}")
+    finally:
+        await http_client_manager.close()
+
+def run() -> None:
+    """
+    동기화 명령행 진입점 함수입니다.
+    """
+    parser = argparse.ArgumentParser(description="독립유공자 공훈록 로컬 미러 동기화")
+    parser.add_argument("--dataset", action="append", choices=list(DATASETS), help="동기화할 데이터셋")
+    parser.add_argument("--full", action="store_true", help="증분 동기화 대신 전체를 다시 수집")
+    args = parser.parse_args()
+    try:
+        asyncio.run(_main(args.dataset, "full" if args.full else "incremental"))
+    except KeyboardInterrupt:
+        logger.info("사용자에 의해 동기화가 중지되었습니다. 다음 실행 시 이어서 진행합니다.")
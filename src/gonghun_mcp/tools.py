@@ -6,13 +6,123 @@
 
 import json
 import logging
-from typing import List, Any, Union, Dict, Optional
+from typing import List, Any, Awaitable, Callable, Union, Dict, Optional
 from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource, EmptyResult, LoggingLevel
 
-from .config import logger, app, HUNKUK_CODES, WORKOUT_AFFIL_CODES
-from .api import fetch_merit_list, fetch_public_report
+from .config import (
+    logger,
+    request_logger,
+    app,
+    HUNKUK_CODES,
+    WORKOUT_AFFIL_CODES,
+    FANOUT_MAX_RESULTS,
+    BATCH_MAX_IDS,
+    RESPONSE_FORMAT,
+    CACHE_RESPONSE_TEXT,
+    MAX_COUNT_PER_PAGE,
+)
+from .api import fetch_merit_list, fetch_public_report, fetch_all_pages, fetch_by_ids, fetch_activist_profile
 from .cache import cache_manager
-from .utils import format_response, create_error_response
+from .metrics import metrics
+from .profiling import profiler, profile_phase
+from .sessions import session_manager
+from .warmup import cache_warmer
+from .sync import DATASETS, start_background_sync, get_sync_status
+from .logs import lazy_payload
+from .utils import format_response, create_error_response, make_cache_key
+
+# 정적 코드표 도구 (도구 이름 -> 코드표)
+CODE_TABLES = {
+    "get_hunkuk_codes": HUNKUK_CODES,
+    "get_workout_affil_codes": WORKOUT_AFFIL_CODES,
+}
+
+def code_table_text(name: str) -> str:
+    """
+    코드표 도구의 응답 문자열을 반환합니다. 응답 문자열 캐시를 사용하면 한 번만 직렬화합니다.
+    
+    Args:
+        name: 코드표 도구 이름
+        
+    Returns:
+        직렬화된 코드표
+    """
+    key = make_cache_key(f"response:{name}", {}) if CACHE_RESPONSE_TEXT else None
+    text = cache_manager.get_text(key) if key else None
+    if text is None:
+        text = format_response(CODE_TABLES[name])
+        if key:
+            cache_manager.set_text(key, text)
+    return text
+
+def warm_code_tables() -> None:
+    """캐시 예열: 코드표 응답 문자열을 미리 직렬화하여 캐시합니다."""
+    for name in CODE_TABLES:
+        code_table_text(name)
+
+def _progress_reporter() -> Optional[Callable[[int, int], Awaitable[None]]]:
+    """
+    클라이언트가 진행 상황 토큰을 보낸 경우 MCP 진행 알림을 보내는 함수를 반환합니다.
+    
+    Returns:
+        (진행량, 전체량)을 받아 진행 알림을 보내는 함수, 토큰이 없으면 None
+    """
+    try:
+        ctx = app.request_context
+    except LookupError:
+        return None
+    
+    progress_token = ctx.meta.progressToken if ctx.meta is not None else None
+    if progress_token is None:
+        return None
+    
+    async def report(progress: int, total: int) -> None:
+        await ctx.session.send_progress_notification(progress_token, progress, total)
+    
+    return report
+
+def _response_cache_key(name: str, arguments: Dict[str, Any], filters: Dict[str, Any]) -> Optional[str]:
+    """
+    직렬화된 응답 문자열의 캐시 키를 생성합니다.
+    조회 조건과 페이지 정보뿐 아니라 필드 선택과 출력 형식도 키에 포함합니다.
+    
+    Args:
+        name: 도구 이름
+        arguments: 도구 인수
+        filters: 정규화 전 검색 조건
+        
+    Returns:
+        응답 캐시 키, 응답 문자열 캐시를 사용하지 않으면 None
+    """
+    if not CACHE_RESPONSE_TEXT:
+        return None
+    
+    compact = arguments.get("compact")
+    if compact is None:
+        compact = RESPONSE_FORMAT == "compact"
+    fields = arguments.get("fields")
+    
+    return make_cache_key(f"response:{name}", dict(
+        filters,
+        page_index=arguments.get("page_index", 1),
+        # 도구가 조회할 때처럼 MAX_COUNT_PER_PAGE로 제한한 값 (상한을 넘는 값들이 같은 응답을 따로 캐시하지 않도록)
+        count_per_page=min(arguments.get("count_per_page", 10), MAX_COUNT_PER_PAGE),
+        max_results=arguments.get("max_results"),
+        fields=",".join(fields) if fields else None,
+        compact=bool(compact)
+    ))
+
+def _store_response_text(key: Optional[str], data: Dict[str, Any], text: str) -> None:
+    """
+    오류나 오래된 데이터가 아닌 응답만 직렬화된 문자열로 캐시합니다.
+    
+    Args:
+        key: 응답 캐시 키 (None이면 저장하지 않음)
+        data: 응답 데이터
+        text: 직렬화된 응답 문자열
+    """
+    if key is not None and "error" not in data and "cacheStatus" not in data:
+        cache_manager.set_text(key, text)
 
 @app.list_tools()
 async def list_tools() -> List[Tool]:
@@ -41,6 +151,23 @@ async def list_tools() -> List[Tool]:
                             "default": 10,
                             "maximum": 50
                         },
+                        "max_results": {
+                            "type": "integer",
+                            "description": f"지정하면 여러 페이지를 동시에 조회하여 최대 이 건수까지 한 번에 반환합니다 (page_index/count_per_page 무시, 최대 {FANOUT_MAX_RESULTS}건)",
+                            "minimum": 1,
+                            "maximum": FANOUT_MAX_RESULTS
+                        },
+                        "fields": {
+                            "type": "array",
+                            "description": "응답 항목에 포함할 필드 (예: mngNo, nameKo, hunkuk), 지정하지 않으면 전체 필드",
+                            "items": {
+                                "type": "string"
+                            }
+                        },
+                        "compact": {
+                            "type": "boolean",
+                            "description": "들여쓰기 없이 압축된 JSON으로 응답할지 여부 (기본값은 서버 설정)"
+                        },
                         "mng_no": {
                             "type": "string",
                             "description": "관리번호"
@@ -116,6 +243,23 @@ async def list_tools() -> List[Tool]:
                             "default": 10,
                             "maximum": 50
                         },
+                        "max_results": {
+                            "type": "integer",
+                            "description": f"지정하면 여러 페이지를 동시에 조회하여 최대 이 건수까지 한 번에 반환합니다 (page_index/count_per_page 무시, 최대 {FANOUT_MAX_RESULTS}건)",
+                            "minimum": 1,
+                            "maximum": FANOUT_MAX_RESULTS
+                        },
+                        "fields": {
+                            "type": "array",
+                            "description": "응답 항목에 포함할 필드 (예: mngNo, nameKo, hunkuk), 지정하지 않으면 전체 필드",
+                            "items": {
+                                "type": "string"
+                            }
+                        },
+                        "compact": {
+                            "type": "boolean",
+                            "description": "들여쓰기 없이 압축된 JSON으로 응답할지 여부 (기본값은 서버 설정)"
+                        },
                         "mng_no": {
                             "type": "string",
                             "description": "관리번호"
@@ -178,6 +322,46 @@ async def list_tools() -> List[Tool]:
                     }
                 }
             ),
+            Tool(
+                name="get_merits_by_ids",
+                description="여러 관리번호(mngNo)의 독립유공자 공훈록을 한 번에 조회합니다",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "mng_nos": {
+                            "type": "array",
+                            "description": f"조회할 관리번호 목록 (중복은 한 번만 조회, 최대 {BATCH_MAX_IDS}개)",
+                            "items": {
+                                "type": "string"
+                            },
+                            "maxItems": BATCH_MAX_IDS
+                        },
+                        "compact": {
+                            "type": "boolean",
+                            "description": "들여쓰기 없이 압축된 JSON으로 응답할지 여부 (기본값은 서버 설정)"
+                        }
+                    },
+                    "required": ["mng_nos"]
+                }
+            ),
+            Tool(
+                name="get_activist_profile",
+                description="관리번호로 독립유공자의 공훈록과 공적조서를 함께 조회하여 하나의 프로필로 반환합니다",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "mng_no": {
+                            "type": "string",
+                            "description": "관리번호"
+                        },
+                        "compact": {
+                            "type": "boolean",
+                            "description": "들여쓰기 없이 압축된 JSON으로 응답할지 여부 (기본값은 서버 설정)"
+                        }
+                    },
+                    "required": ["mng_no"]
+                }
+            ),
             Tool(
                 name="get_hunkuk_codes",
                 description="훈격 코드 정보를 조회합니다",
@@ -201,6 +385,71 @@ async def list_tools() -> List[Tool]:
                     "type": "object",
                     "properties": {}
                 }
+            ),
+            Tool(
+                name="sync_mirror",
+                description="공훈록/공적조서 전체 데이터를 로컬 미러로 동기화하는 작업을 백그라운드에서 시작합니다",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "datasets": {
+                            "type": "array",
+                            "description": "동기화할 데이터셋 (기본값은 전체)",
+                            "items": {
+                                "type": "string",
+                                "enum": list(DATASETS.keys())
+                            }
+                        },
+                        "mode": {
+                            "type": "string",
+                            "description": "incremental: 포상년도별로 변경된 부분만 동기화, full: 전체를 다시 수집",
+                            "enum": ["incremental", "full"],
+                            "default": "incremental"
+                        },
+                        "resume": {
+                            "type": "boolean",
+                            "description": "중단된 전체 동기화를 이어서 진행할지 여부",
+                            "default": True
+                        }
+                    }
+                }
+            ),
+            Tool(
+                name="get_mirror_status",
+                description="로컬 미러의 동기화 상태를 조회합니다",
+                inputSchema={
+                    "type": "object",
+                    "properties": {}
+                }
+            ),
+            Tool(
+                name="get_server_stats",
+                description="도구/업스트림 응답 시간, 캐시 적중률, 업스트림 상태 코드 등 서버 실행 지표를 조회합니다",
+                inputSchema={
+                    "type": "object",
+                    "properties": {}
+                }
+            ),
+            Tool(
+                name="set_profiling",
+                description="도구 호출 프로파일링을 켜거나 끄고, 최근 느린 호출의 단계별(캐시/업스트림 대기/네트워크/JSON 디코딩/XML 파싱/직렬화) 시간을 조회합니다",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "enabled": {
+                            "type": "boolean",
+                            "description": "단계별 측정 사용 여부 (생략하면 현재 설정 유지)"
+                        },
+                        "threshold_ms": {
+                            "type": "number",
+                            "description": "느린 호출로 기록할 기준 시간(밀리초)"
+                        },
+                        "cprofile": {
+                            "type": "boolean",
+                            "description": "느린 호출의 cProfile 결과도 기록할지 여부"
+                        }
+                    }
+                }
             )
         ]
     except Exception as e:
@@ -240,17 +489,20 @@ async def call_tool(name: str, arguments: Any) -> List[Union[TextContent, ImageC
     Returns:
         도구 실행 결과
     """
+    # 같은 세션의 동시 도구 호출 수 제한 (SSE 전송에서 여러 세션이 프로세스를 공유)
+    session_slot = await session_manager.acquire()
+    call_started = metrics.tool_started()
+    call_profile = profiler.start(name, arguments)
+    failed = False
     try:
-        logger.info(f"도구 호출: {name}, 인수: {arguments}")
+        request_logger.info("도구 호출: %s, 인수: %s", name, lazy_payload(arguments))
         
         if name == "get_merit_list":
             # 공훈록 목록 조회
             if not isinstance(arguments, dict):
                 arguments = {}
             
-            data = await fetch_merit_list(
-                page_index=arguments.get("page_index", 1),
-                count_per_page=min(arguments.get("count_per_page", 10), 50),
+            filters = dict(
                 response_type="JSON",
                 mng_no=arguments.get("mng_no"),
                 name_ko=arguments.get("name_ko"),
@@ -267,8 +519,44 @@ async def call_tool(name: str, arguments: Any) -> List[Union[TextContent, ImageC
                 achivement=arguments.get("achivement")
             )
             
-            result_json = format_response(data)
-            logger.debug(f"공훈록 목록 조회 결과: {result_json}")
+            response_key = _response_cache_key(name, arguments, filters)
+            with profile_phase("cache"):
+                cached_text = cache_manager.get_text(response_key) if response_key else None
+            if cached_text is not None:
+                # 응답 문자열 캐시 적중도 캐시 예열 순위에 반영
+                cache_warmer.record_response(response_key)
+                return [
+                    TextContent(
+                        type="text",
+                        text=cached_text
+                    )
+                ]
+            
+            # 이 응답을 만들 때 조회한 캐시 키를 응답 캐시 키와 연결
+            with cache_warmer.track(response_key):
+                if arguments.get("max_results") is not None:
+                    # 여러 페이지 동시 조회
+                    data = await fetch_all_pages(
+                        fetch_merit_list,
+                        max_results=min(int(arguments["max_results"]), FANOUT_MAX_RESULTS),
+                        progress_callback=_progress_reporter(),
+                        **filters
+                    )
+                else:
+                    data = await fetch_merit_list(
+                        page_index=arguments.get("page_index", 1),
+                        count_per_page=min(arguments.get("count_per_page", 10), MAX_COUNT_PER_PAGE),
+                        **filters
+                    )
+            
+            with profile_phase("format"):
+                result_json = format_response(
+                    data,
+                    compact=arguments.get("compact"),
+                    fields=arguments.get("fields")
+                )
+            logger.debug("공훈록 목록 조회 결과: %s", lazy_payload(result_json))
+            _store_response_text(response_key, data, result_json)
             
             return [
                 TextContent(
@@ -282,9 +570,7 @@ async def call_tool(name: str, arguments: Any) -> List[Union[TextContent, ImageC
             if not isinstance(arguments, dict):
                 arguments = {}
             
-            data = await fetch_public_report(
-                page_index=arguments.get("page_index", 1),
-                count_per_page=min(arguments.get("count_per_page", 10), 50),
+            filters = dict(
                 response_type="JSON",
                 mng_no=arguments.get("mng_no"),
                 name_ko=arguments.get("name_ko"),
@@ -302,8 +588,44 @@ async def call_tool(name: str, arguments: Any) -> List[Union[TextContent, ImageC
                 achivement_ko=arguments.get("achivement_ko")
             )
             
-            result_json = format_response(data)
-            logger.debug(f"공적조서 조회 결과: {result_json}")
+            response_key = _response_cache_key(name, arguments, filters)
+            with profile_phase("cache"):
+                cached_text = cache_manager.get_text(response_key) if response_key else None
+            if cached_text is not None:
+                # 응답 문자열 캐시 적중도 캐시 예열 순위에 반영
+                cache_warmer.record_response(response_key)
+                return [
+                    TextContent(
+                        type="text",
+                        text=cached_text
+                    )
+                ]
+            
+            # 이 응답을 만들 때 조회한 캐시 키를 응답 캐시 키와 연결
+            with cache_warmer.track(response_key):
+                if arguments.get("max_results") is not None:
+                    # 여러 페이지 동시 조회
+                    data = await fetch_all_pages(
+                        fetch_public_report,
+                        max_results=min(int(arguments["max_results"]), FANOUT_MAX_RESULTS),
+                        progress_callback=_progress_reporter(),
+                        **filters
+                    )
+                else:
+                    data = await fetch_public_report(
+                        page_index=arguments.get("page_index", 1),
+                        count_per_page=min(arguments.get("count_per_page", 10), MAX_COUNT_PER_PAGE),
+                        **filters
+                    )
+            
+            with profile_phase("format"):
+                result_json = format_response(
+                    data,
+                    compact=arguments.get("compact"),
+                    fields=arguments.get("fields")
+                )
+            logger.debug("공적조서 조회 결과: %s", lazy_payload(result_json))
+            _store_response_text(response_key, data, result_json)
             
             return [
                 TextContent(
@@ -312,9 +634,45 @@ async def call_tool(name: str, arguments: Any) -> List[Union[TextContent, ImageC
                 )
             ]
             
+        elif name == "get_merits_by_ids":
+            # 여러 관리번호 일괄 조회
+            if not isinstance(arguments, dict):
+                arguments = {}
+            
+            mng_nos = arguments.get("mng_nos")
+            if not isinstance(mng_nos, list) or not mng_nos:
+                raise ValueError("mng_nos에 조회할 관리번호 목록을 지정해주세요.")
+            if len(mng_nos) > BATCH_MAX_IDS:
+                raise ValueError(f"한 번에 조회할 수 있는 관리번호는 최대 {BATCH_MAX_IDS}개입니다.")
+            
+            data = await fetch_by_ids(fetch_merit_list, mng_nos, response_type="JSON")
+            return [
+                TextContent(
+                    type="text",
+                    text=format_response(data, compact=arguments.get("compact"))
+                )
+            ]
+            
+        elif name == "get_activist_profile":
+            # 공훈록 + 공적조서 통합 프로필 조회
+            if not isinstance(arguments, dict):
+                arguments = {}
+            
+            mng_no = arguments.get("mng_no")
+            if not mng_no or not str(mng_no).strip():
+                raise ValueError("mng_no에 조회할 관리번호를 지정해주세요.")
+            
+            data = await fetch_activist_profile(str(mng_no))
+            return [
+                TextContent(
+                    type="text",
+                    text=format_response(data, compact=arguments.get("compact"))
+                )
+            ]
+            
         elif name == "get_hunkuk_codes":
             # 훈격 코드 정보 조회
-            result_json = format_response(HUNKUK_CODES)
+            result_json = code_table_text(name)
             return [
                 TextContent(
                     type="text",
@@ -324,7 +682,7 @@ async def call_tool(name: str, arguments: Any) -> List[Union[TextContent, ImageC
             
         elif name == "get_workout_affil_codes":
             # 운동계열 코드 정보 조회
-            result_json = format_response(WORKOUT_AFFIL_CODES)
+            result_json = code_table_text(name)
             return [
                 TextContent(
                     type="text",
@@ -344,10 +702,72 @@ async def call_tool(name: str, arguments: Any) -> List[Union[TextContent, ImageC
                     })
                 )
             ]
+            
+        elif name == "sync_mirror":
+            # 로컬 미러 동기화 시작
+            if not isinstance(arguments, dict):
+                arguments = {}
+            
+            status = await get_sync_status()
+            if not status["enabled"]:
+                raise ValueError("로컬 미러가 설정되지 않았습니다. MIRROR_DB_PATH를 지정해주세요.")
+            
+            started = start_background_sync(
+                datasets=arguments.get("datasets"),
+                resume=arguments.get("resume", True),
+                mode=arguments.get("mode", "incremental")
+            )
+            return [
+                TextContent(
+                    type="text",
+                    text=format_response({
+                        "success": True,
+                        "message": "동기화를 시작했습니다." if started else "이미 동기화가 진행 중입니다.",
+                        "status": await get_sync_status()
+                    })
+                )
+            ]
+            
+        elif name == "get_server_stats":
+            # 서버 실행 지표 조회
+            return [
+                TextContent(
+                    type="text",
+                    text=format_response(metrics.snapshot())
+                )
+            ]
+            
+        elif name == "set_profiling":
+            # 프로파일링 설정 변경 및 최근 느린 호출 조회
+            if not isinstance(arguments, dict):
+                arguments = {}
+            threshold_ms = arguments.get("threshold_ms")
+            if threshold_ms is not None and float(threshold_ms) < 0:
+                raise ValueError("threshold_ms는 0 이상이어야 합니다.")
+            return [
+                TextContent(
+                    type="text",
+                    text=format_response(profiler.configure(
+                        enabled=arguments.get("enabled"),
+                        threshold_ms=float(threshold_ms) if threshold_ms is not None else None,
+                        use_cprofile=arguments.get("cprofile")
+                    ))
+                )
+            ]
+            
+        elif name == "get_mirror_status":
+            # 로컬 미러 상태 조회
+            return [
+                TextContent(
+                    type="text",
+                    text=format_response(await get_sync_status())
+                )
+            ]
         else:
             raise ValueError(f"지원하지 않는 도구: {name}")
     except ValueError as e:
         logger.error(f"도구 인수 오류: {str(e)}")
+        failed = True
         return [
             TextContent(
                 type="text",
@@ -356,6 +776,7 @@ async def call_tool(name: str, arguments: Any) -> List[Union[TextContent, ImageC
         ]
     except RuntimeError as e:
         logger.error(f"도구 실행 오류: {str(e)}")
+        failed = True
         return [
             TextContent(
                 type="text",
@@ -364,12 +785,20 @@ async def call_tool(name: str, arguments: Any) -> List[Union[TextContent, ImageC
         ]
     except Exception as e:
         logger.error(f"도구 호출 중 예상치 못한 오류: {str(e)}")
+        failed = True
         return [
             TextContent(
                 type="text",
                 text=format_response(create_error_response(f"도구 실행 중 오류가 발생했습니다: {str(e)}"))
             )
         ]
+    finally:
+        # 기록 중 오류가 나도 세션 슬롯은 반드시 반환 (반환하지 않으면 종료 시 대기가 끝나지 않음)
+        try:
+            metrics.tool_finished(name, call_started, failed)
+            profiler.finish(call_profile)
+        finally:
+            session_manager.release(session_slot)
 
 @app.set_logging_level()
 async def set_logging_level(level: LoggingLevel) -> EmptyResult:
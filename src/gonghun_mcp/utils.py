@@ -4,93 +4,168 @@
 이 모듈은 다양한 유틸리티 함수들을 제공합니다.
 """
 
-import xml.etree.ElementTree as ET
+import hashlib
 import json
-from typing import Dict, Any, Tuple, List, Optional, Union
-from .config import logger, SEX_CODES, HUNKUK_CODES, WORKOUT_AFFIL_CODES
+from urllib.parse import parse_qs
+from typing import IO, TYPE_CHECKING, Dict, Any, Iterator, Tuple, List, Optional, Union
+from .config import (
+    logger,
+    SEX_CODES,
+    HUNKUK_CODES,
+    WORKOUT_AFFIL_CODES,
+    RESPONSE_FORMAT,
+    JSON_BACKEND,
+)
 
-def parse_xml_response(response_text: str) -> Dict[str, Any]:
+# XML 파서는 XML 응답을 처음 파싱할 때 가져옴 (서버 시작 시간 단축)
+if TYPE_CHECKING:
+    import xml.etree.ElementTree as ET
+
+# 스트리밍 파서에 한 번에 전달하는 입력 크기
+XML_CHUNK_SIZE = 64 * 1024
+
+# XML 응답의 페이지 정보 태그와 결과 딕셔너리 키
+XML_HEADER_FIELDS = {
+    "TOTAL_COUNT": "totalCount",
+    "PAGE_COUNT": "pageCount",
+    "PAGE_INDEX": "pageIndex",
+    "COUNT_PER_PAGE": "countPerPage",
+    "ITEM_COUNT": "itemCount",
+}
+
+def _xml_item_to_dict(item_elem: "ET.Element") -> Dict[str, Any]:
     """
-    XML 응답을 파싱하여 딕셔너리로 변환합니다.
+    ITEM 요소를 딕셔너리로 변환합니다.
     
     Args:
-        response_text: XML 형식의 응답 문자열
+        item_elem: ITEM 요소
         
     Returns:
-        파싱된 결과를 담은 딕셔너리
+        변환된 항목 딕셔너리
     """
-    try:
-        root = ET.fromstring(response_text)
-        
-        # 총 개수 및 페이지 정보 파싱
-        total_count = root.find("TOTAL_COUNT")
-        page_count = root.find("PAGE_COUNT")
-        page_index = root.find("PAGE_INDEX")
-        count_per_page = root.find("COUNT_PER_PAGE")
-        item_count = root.find("ITEM_COUNT")
+    item = {}
+    for elem in item_elem:
+        if elem.tag == "REFERENCES":
+            # 참고문헌 파싱
+            references = []
+            for ref_elem in elem.findall("REFERENCE"):
+                ref = {}
+                book_name = ref_elem.find("BOOK_NAME")
+                if book_name is not None:
+                    ref["bookName"] = book_name.text
+                
+                links = []
+                links_elem = ref_elem.find("LINKS")
+                if links_elem is not None:
+                    for link_elem in links_elem.findall("LINK"):
+                        link = {}
+                        name = link_elem.find("NAME")
+                        url = link_elem.find("URL")
+                        if name is not None:
+                            link["name"] = name.text
+                        if url is not None:
+                            link["url"] = url.text
+                        links.append(link)
+                
+                ref["links"] = links
+                references.append(ref)
+            
+            item["references"] = references
+        else:
+            # 일반 태그 파싱
+            tag_name = elem.tag.lower()
+            item[tag_name] = elem.text if elem.text is not None else ""
+    
+    # 코드값을 텍스트로 변환
+    if "sex" in item:
+        item["sexText"] = SEX_CODES.get(item["sex"], "")
+    
+    if "hunkuk" in item:
+        item["hunkukText"] = HUNKUK_CODES.get(item["hunkuk"], "")
+    
+    if "workout_affil" in item:
+        item["workoutAffilText"] = WORKOUT_AFFIL_CODES.get(item["workout_affil"], "")
+    
+    return item
+
+def iter_xml_items(
+    source: Union[str, bytes, IO],
+    header: Optional[Dict[str, Any]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    XML 응답을 스트리밍 방식으로 파싱하여 항목을 하나씩 반환합니다.
+    기존 트리 파서와 같이 루트 바로 아래의 페이지 정보와 루트/ITEMS 바로 아래의 ITEM만 읽으며,
+    처리한 요소는 부모에서 떼어내므로 전체 트리를 메모리에 올리지 않습니다.
+    대량 동기화처럼 항목을 순서대로 처리하는 경우 파일 객체를 그대로 넘겨 사용할 수 있습니다.
+    
+    Args:
+        source: XML 문자열, 바이트 또는 읽기 가능한 파일 객체
+        header: 지정하면 페이지 정보(totalCount 등)를 파싱하는 대로 채워 넣을 딕셔너리
         
-        result = {
-            "totalCount": int(total_count.text) if total_count is not None else 0,
-            "pageCount": int(page_count.text) if page_count is not None else 0,
-            "pageIndex": int(page_index.text) if page_index is not None else 0,
-            "countPerPage": int(count_per_page.text) if count_per_page is not None else 0,
-            "itemCount": int(item_count.text) if item_count is not None else 0,
-            "items": []
-        }
+    Yields:
+        파싱된 항목 딕셔너리
         
-        # 아이템 파싱
-        items_elem = root.find("ITEMS")
-        if items_elem is None:
-            return result
-            
-        for item_elem in items_elem.findall("ITEM"):
-            item = {}
-            for elem in item_elem:
-                if elem.tag == "REFERENCES":
-                    # 참고문헌 파싱
-                    references = []
-                    for ref_elem in elem.findall("REFERENCE"):
-                        ref = {}
-                        book_name = ref_elem.find("BOOK_NAME")
-                        if book_name is not None:
-                            ref["bookName"] = book_name.text
-                        
-                        links = []
-                        links_elem = ref_elem.find("LINKS")
-                        if links_elem is not None:
-                            for link_elem in links_elem.findall("LINK"):
-                                link = {}
-                                name = link_elem.find("NAME")
-                                url = link_elem.find("URL")
-                                if name is not None:
-                                    link["name"] = name.text
-                                if url is not None:
-                                    link["url"] = url.text
-                                links.append(link)
-                        
-                        ref["links"] = links
-                        references.append(ref)
-                    
-                    item["references"] = references
-                else:
-                    # 일반 태그 파싱
-                    tag_name = elem.tag.lower()
-                    item[tag_name] = elem.text if elem.text is not None else ""
-            
-            # 코드값을 텍스트로 변환
-            if "sex" in item:
-                item["sexText"] = SEX_CODES.get(item["sex"], "")
-            
-            if "hunkuk" in item:
-                item["hunkukText"] = HUNKUK_CODES.get(item["hunkuk"], "")
-            
-            if "workout_affil" in item:
-                item["workoutAffilText"] = WORKOUT_AFFIL_CODES.get(item["workout_affil"], "")
-            
-            result["items"].append(item)
+    Raises:
+        ET.ParseError: XML 형식이 올바르지 않은 경우
+    """
+    if isinstance(source, (str, bytes)):
+        # 입력을 복사하지 않도록 일정 크기로 잘라서 전달
+        chunks = (source[i:i + XML_CHUNK_SIZE] for i in range(0, len(source), XML_CHUNK_SIZE))
+    else:
+        chunks = iter(lambda: source.read(XML_CHUNK_SIZE), source.read(0))
+    
+    from xml.etree.ElementTree import XMLPullParser
+    
+    parser = XMLPullParser(events=("start", "end"))
+    # 루트부터 현재 요소까지 열려 있는 요소 (깊이로 루트의 직계 자식인지 확인)
+    path: List["ET.Element"] = []
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from _drain_xml_events(parser, path, header)
+    parser.close()
+    yield from _drain_xml_events(parser, path, header)
+
+def _drain_xml_events(
+    parser: "ET.XMLPullParser",
+    path: List["ET.Element"],
+    header: Optional[Dict[str, Any]]
+) -> Iterator[Dict[str, Any]]:
+    """파서에 쌓인 이벤트를 처리하여 완성된 항목을 반환합니다."""
+    for event, elem in parser.read_events():
+        if event == "start":
+            path.append(elem)
+            continue
+
+        path.pop()
+        depth = len(path)
+        if depth == 1:
+            # 루트의 직계 자식: 페이지 정보 또는 ITEMS
+            if elem.tag in XML_HEADER_FIELDS and header is not None:
+                header[XML_HEADER_FIELDS[elem.tag]] = int(elem.text) if elem.text else 0
+            path[0].remove(elem)
+        elif depth == 2 and path[1].tag == "ITEMS":
+            # ITEMS의 직계 자식: 완성된 항목을 반환하고 부모에서 떼어내 메모리 사용량을 일정하게 유지
+            if elem.tag == "ITEM":
+                yield _xml_item_to_dict(elem)
+            path[1].remove(elem)
+
+def parse_xml_response(response_text: Union[str, bytes]) -> Dict[str, Any]:
+    """
+    XML 응답을 파싱하여 딕셔너리로 변환합니다.
+    
+    Args:
+        response_text: XML 형식의 응답 문자열 또는 바이트
         
+    Returns:
+        파싱된 결과를 담은 딕셔너리
+    """
+    from xml.etree.ElementTree import ParseError
+    
+    try:
+        result = {key: 0 for key in XML_HEADER_FIELDS.values()}
+        result["items"] = list(iter_xml_items(response_text, result))
         return result
-    except ET.ParseError as e:
+    except ParseError as e:
         logger.error(f"XML 파싱 오류: {str(e)}")
         return {
             "error": True,
@@ -105,6 +180,41 @@ def parse_xml_response(response_text: str) -> Dict[str, Any]:
             "items": []
         }
 
+# 항목 필드의 별칭 (JSON 응답은 camelCase, XML 응답은 태그를 소문자로 변환한 snake_case)
+ITEM_FIELD_ALIASES = {
+    "mngNo": ("mngNo", "mng_no", "mngno"),
+    "nameKo": ("nameKo", "name_ko", "nameko"),
+    "nameCh": ("nameCh", "name_ch", "namech"),
+    "diffName": ("diffName", "diff_name", "diffname"),
+    "birthday": ("birthday",),
+    "lastday": ("lastday",),
+    "sex": ("sex",),
+    "registerLargeDiv": ("registerLargeDiv", "register_large_div", "registerlargediv"),
+    "registerMidDiv": ("registerMidDiv", "register_mid_div", "registermiddiv"),
+    "judgeYear": ("judgeYear", "judge_year", "judgeyear"),
+    "hunkuk": ("hunkuk",),
+    "workoutAffil": ("workoutAffil", "workout_affil", "workoutaffil"),
+    "achivement": ("achivement",),
+    "achivement_ko": ("achivement_ko", "achivementKo", "achivementko"),
+}
+
+def get_item_field(item: Dict[str, Any], field: str) -> Optional[str]:
+    """
+    응답 형식(JSON/XML)에 관계없이 항목의 필드 값을 가져옵니다.
+    
+    Args:
+        item: 공훈록/공적조서 항목
+        field: build_query_params의 파라미터 이름 (예: mngNo, nameKo)
+        
+    Returns:
+        필드 값, 없으면 None
+    """
+    for alias in ITEM_FIELD_ALIASES.get(field, (field,)):
+        value = item.get(alias)
+        if value not in (None, ""):
+            return str(value)
+    return None
+
 def parse_resource_uri(uri_str: str) -> Tuple[str, List[str]]:
     """
     리소스 URI를 파싱하여 리소스 타입과 경로 파라미터를 반환합니다.
@@ -121,31 +231,141 @@ def parse_resource_uri(uri_str: str) -> Tuple[str, List[str]]:
     if not uri_str.startswith("gonghun://"):
         raise ValueError(f"지원하지 않는 리소스 URI 형식: {uri_str}")
     
-    # gonghun:// 제거
-    path = uri_str.replace("gonghun://", "")
+    # gonghun:// 와 쿼리 문자열 제거
+    path = uri_str.replace("gonghun://", "").split("?", 1)[0]
     
-    # 첫 번째 '/'까지의 부분이 리소스 타입
-    parts = path.split('/', 1)
-    if len(parts) < 2:
+    # 첫 번째 '/'까지의 부분이 리소스 타입 (gonghun://stats처럼 경로가 없으면 파라미터 없음)
+    parts = path.rstrip('/').split('/', 1)
+    if not parts[0]:
         raise ValueError(f"잘못된 리소스 URI 형식: {uri_str}")
     
     resource_type = parts[0]
-    params = parts[1].split('/')
+    params = parts[1].split('/') if len(parts) > 1 else []
     
     return resource_type, params
 
-def format_response(data: Dict[str, Any]) -> str:
+def parse_resource_query(uri_str: str) -> Dict[str, str]:
+    """
+    리소스 URI의 쿼리 문자열을 파싱합니다 (예: gonghun://merit/page/2?fields=mngNo,nameKo).
+    
+    Args:
+        uri_str: 리소스 URI 문자열
+        
+    Returns:
+        쿼리 파라미터 이름과 값 (같은 이름이 여러 번 나오면 마지막 값)
+    """
+    if "?" not in uri_str:
+        return {}
+    query = parse_qs(uri_str.split("?", 1)[1])
+    return {key: values[-1] for key, values in query.items()}
+
+def _load_orjson() -> Optional[Any]:
+    """JSON_BACKEND 설정에 따라 orjson 모듈을 가져옵니다. 사용하지 않으면 None을 반환합니다."""
+    if JSON_BACKEND == "json":
+        return None
+    try:
+        import orjson
+        return orjson
+    except ImportError:
+        if JSON_BACKEND == "orjson":
+            logger.warning("orjson 패키지가 설치되어 있지 않아 표준 json 모듈을 사용합니다.")
+        return None
+
+_orjson = _load_orjson()
+
+def project_fields(data: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """
+    응답의 각 항목에서 지정한 필드만 남깁니다. 페이지 정보 등 최상위 필드는 유지합니다.
+    필드 이름은 응답 형식(JSON/XML)에 관계없이 camelCase 이름(예: mngNo, nameKo)으로 지정할 수 있습니다.
+    
+    Args:
+        data: 응답 데이터
+        fields: 남길 필드 이름 목록 (없으면 원본을 그대로 반환)
+        
+    Returns:
+        필드가 선택된 응답 데이터
+    """
+    if not fields or not isinstance(data.get("items"), list):
+        return data
+    
+    keys = set()
+    for field in fields:
+        keys.update(ITEM_FIELD_ALIASES.get(field, (field,)))
+    
+    projected = dict(data)
+    projected["items"] = [
+        {key: value for key, value in item.items() if key in keys}
+        for item in data["items"]
+    ]
+    return projected
+
+def format_response(
+    data: Dict[str, Any],
+    compact: Optional[bool] = None,
+    fields: Optional[List[str]] = None
+) -> str:
     """
     응답 데이터를 형식화된 JSON 문자열로 변환합니다.
     
     Args:
         data: 응답 데이터
+        compact: True이면 들여쓰기 없이 직렬화 (기본값은 RESPONSE_FORMAT 설정)
+        fields: 지정하면 각 항목에서 해당 필드만 남김
         
     Returns:
         형식화된 JSON 문자열
     """
+    if compact is None:
+        compact = RESPONSE_FORMAT == "compact"
+    data = project_fields(data, fields)
+    
+    if _orjson is not None:
+        option = 0 if compact else _orjson.OPT_INDENT_2
+        return _orjson.dumps(data, option=option).decode("utf-8")
+    
+    if compact:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
     return json.dumps(data, ensure_ascii=False, indent=2)
 
+def normalize_filters(filters: Dict[str, Any]) -> Dict[str, str]:
+    """
+    검색 조건을 정규화합니다. 빈 값은 제거하고 문자열 앞뒤 공백을 없앱니다.
+    
+    Args:
+        filters: 검색 조건
+        
+    Returns:
+        정규화된 검색 조건
+    """
+    normalized = {}
+    for key, value in filters.items():
+        if value is None:
+            continue
+        value = str(value).strip()
+        if value:
+            normalized[key] = value
+    return normalized
+
+def make_cache_key(prefix: str, filters: Dict[str, Any]) -> str:
+    """
+    정규화된 검색 조건으로 모호하지 않은 캐시 키를 생성합니다.
+    
+    Args:
+        prefix: 캐시 키 접두사 (예: merit_list)
+        filters: 검색 조건 (페이지 정보 포함)
+        
+    Returns:
+        "접두사:해시" 형식의 캐시 키
+    """
+    canonical = json.dumps(
+        normalize_filters(filters),
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":")
+    )
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+    return f"{prefix}:{digest}"
+
 def create_error_response(message: str) -> Dict[str, Any]:
     """
     오류 응답을 생성합니다.
@@ -211,34 +431,22 @@ def build_query_params(
         "type": type
     }
     
-    # 선택적 파라미터 추가
-    if mngNo:
-        params["mngNo"] = mngNo
-    if nameKo:
-        params["nameKo"] = nameKo
-    if nameCh:
-        params["nameCh"] = nameCh
-    if diffName:
-        params["diffName"] = diffName
-    if birthday:
-        params["birthday"] = birthday
-    if lastday:
-        params["lastday"] = lastday
-    if sex:
-        params["sex"] = sex
-    if registerLargeDiv:
-        params["registerLargeDiv"] = registerLargeDiv
-    if registerMidDiv:
-        params["registerMidDiv"] = registerMidDiv
-    if judgeYear:
-        params["judgeYear"] = judgeYear
-    if hunkuk:
-        params["hunkuk"] = hunkuk
-    if workoutAffil:
-        params["workoutAffil"] = workoutAffil
-    if achivement:
-        params["achivement"] = achivement
-    if achivement_ko:
-        params["achivement_ko"] = achivement_ko
+    # 선택적 파라미터 추가 (캐시 키와 업스트림 요청이 같은 조건이 되도록 앞뒤 공백을 제거하고 빈 값은 제외)
+    params.update(normalize_filters({
+        "mngNo": mngNo,
+        "nameKo": nameKo,
+        "nameCh": nameCh,
+        "diffName": diffName,
+        "birthday": birthday,
+        "lastday": lastday,
+        "sex": sex,
+        "registerLargeDiv": registerLargeDiv,
+        "registerMidDiv": registerMidDiv,
+        "judgeYear": judgeYear,
+        "hunkuk": hunkuk,
+        "workoutAffil": workoutAffil,
+        "achivement": achivement,
+        "achivement_ko": achivement_ko,
+    }))
         
     return params
\ No newline at end of file
@@ -0,0 +1,310 @@
+"""
+독립유공자 공훈록 MCP 서버 - 캐시 예열 모듈
+
+이 모듈은 자주 조회된 캐시 키와 업스트림 요청 인수를 작은 JSON 파일에 기록해두고,
+서버가 시작되면 상위 요청과 코드표를 백그라운드 우선순위로 미리 가져와 캐시를 채웁니다.
+배포나 재시작 직후 첫 사용자가 인기 조회마다 업스트림 지연을 그대로 겪지 않도록 하기 위함이며,
+예열은 initialize 응답 이후에 시작하고 대화형 요청보다 늦게 처리됩니다.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+from .config import (
+    logger,
+    WARMUP_PATH,
+    WARMUP_TOP_N,
+    WARMUP_MAX_TRACKED,
+    WARMUP_CONCURRENCY,
+    WARMUP_DELAY,
+    WARMUP_SAVE_INTERVAL,
+)
+from .limiter import background_priority, is_background
+
+# 기록 파일 형식 버전
+RECORD_VERSION = 1
+
+# track 블록 안에서 조회한 캐시 키 목록 (gather로 만든 하위 작업도 같은 목록을 공유)
+_tracked_keys: ContextVar[Optional[List[str]]] = ContextVar("gonghun_warmup_tracked_keys", default=None)
+
+class CacheWarmer:
+    """캐시 키별 조회 횟수를 기록하고 시작 시 상위 요청으로 캐시를 예열하는 클래스"""
+
+    def __init__(
+        self,
+        path: str = WARMUP_PATH,
+        top_n: int = WARMUP_TOP_N,
+        max_tracked: int = WARMUP_MAX_TRACKED,
+        concurrency: int = WARMUP_CONCURRENCY
+    ):
+        """
+        캐시 예열 관리자를 초기화합니다.
+
+        Args:
+            path: 조회 기록 파일 경로 (비워두면 기록과 예열을 하지 않음)
+            top_n: 시작 시 미리 가져올 상위 요청 수
+            max_tracked: 기록할 최대 캐시 키 수 (넘으면 조회 횟수가 적은 절반을 버림)
+            concurrency: 예열 동시 요청 수
+        """
+        self.path = path
+        self.top_n = top_n
+        self.max_tracked = max(max_tracked, 1)
+        self.concurrency = max(concurrency, 1)
+        # 캐시 키 -> [조회 횟수, 엔드포인트, 쿼리 파라미터, 응답 형식]
+        self._records: Dict[str, List[Any]] = {}
+        # 응답 문자열 캐시 키 -> 그 응답을 만들 때 조회한 캐시 키 (최근 사용 순)
+        self._responses: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._dirty = False
+
+        # 예열 진행 상황
+        self.state = "disabled" if not path else "pending"
+        self.planned = 0
+        self.completed = 0
+        self.failed = 0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def record(self, key: str, endpoint: str, params: Dict[str, Any], response_type: str) -> None:
+        """
+        캐시 키 조회를 기록합니다. 예열, 백그라운드 갱신, 미러 동기화처럼 백그라운드 우선순위 작업의 조회는 기록하지 않습니다.
+
+        Args:
+            key: 캐시 키
+            endpoint: 업스트림 API 엔드포인트
+            params: 쿼리 파라미터
+            response_type: 응답 형식 (JSON/XML)
+        """
+        if not self.path or is_background():
+            return
+
+        record = self._records.get(key)
+        if record is None:
+            if len(self._records) >= self.max_tracked:
+                self._trim()
+            self._records[key] = [1, endpoint, dict(params), response_type]
+        else:
+            record[0] += 1
+        self._dirty = True
+
+        tracked = _tracked_keys.get()
+        if tracked is not None:
+            tracked.append(key)
+
+    @contextmanager
+    def track(self, response_key: Optional[str]) -> Iterator[None]:
+        """
+        블록 안에서 조회한 캐시 키를 응답 문자열 캐시 키와 연결합니다.
+        이후 응답 문자열 캐시가 적중하면 record_response로 연결된 캐시 키의 조회를 기록합니다.
+
+        Args:
+            response_key: 응답 문자열 캐시 키 (None이면 연결하지 않음)
+        """
+        if not self.path or response_key is None:
+            yield
+            return
+        keys: List[str] = []
+        token = _tracked_keys.set(keys)
+        try:
+            yield
+        finally:
+            _tracked_keys.reset(token)
+            if keys:
+                self._responses[response_key] = list(dict.fromkeys(keys))
+                self._responses.move_to_end(response_key)
+                while len(self._responses) > self.max_tracked:
+                    self._responses.popitem(last=False)
+
+    def record_response(self, response_key: Optional[str]) -> None:
+        """
+        응답 문자열 캐시 적중을 기록합니다. 업스트림 캐시를 거치지 않은 조회도 실제 조회 빈도에 포함되도록
+        그 응답을 만들 때 조회한 캐시 키의 조회 횟수를 늘립니다.
+
+        Args:
+            response_key: 적중한 응답 문자열 캐시 키
+        """
+        if not self.path or response_key is None or is_background():
+            return
+        keys = self._responses.get(response_key)
+        if not keys:
+            return
+        self._responses.move_to_end(response_key)
+        for key in keys:
+            record = self._records.get(key)
+            if record is not None:
+                record[0] += 1
+                self._dirty = True
+
+    def top(self, n: int) -> List[Dict[str, Any]]:
+        """
+        조회 횟수가 많은 순으로 기록을 반환합니다.
+
+        Args:
+            n: 반환할 최대 개수
+
+        Returns:
+            key, count, endpoint, params, type을 담은 딕셔너리 목록
+        """
+        ranked = sorted(self._records.items(), key=lambda item: item[1][0], reverse=True)[:n]
+        return [
+            {"key": key, "count": count, "endpoint": endpoint, "params": params, "type": response_type}
+            for key, (count, endpoint, params, response_type) in ranked
+        ]
+
+    def load(self) -> int:
+        """
+        기록 파일을 읽어 현재 기록에 합칩니다.
+        이전 실행의 조회 횟수는 절반으로 줄여 합치므로 오래전에 인기 있던 요청은 점차 밀려납니다.
+
+        Returns:
+            읽은 기록 수
+        """
+        if not self.path or not os.path.exists(self.path):
+            return 0
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"캐시 예열 기록 파일을 읽지 못했습니다: {self.path} - {str(e)}")
+            return 0
+        if not isinstance(saved, dict) or saved.get("version") != RECORD_VERSION:
+            return 0
+
+        entries = saved.get("entries", [])
+        for entry in entries:
+            count = max(int(entry["count"]) // 2, 1)
+            record = self._records.get(entry["key"])
+            if record is None:
+                self._records[entry["key"]] = [count, entry["endpoint"], entry["params"], entry["type"]]
+            else:
+                record[0] += count
+        if len(self._records) > self.max_tracked:
+            self._trim()
+        return len(entries)
+
+    def save(self) -> None:
+        """
+        조회 기록을 파일에 저장합니다. 바뀐 내용이 없으면 저장하지 않으며,
+        읽는 쪽이 쓰다 만 파일을 보지 않도록 임시 파일에 쓴 뒤 교체합니다.
+        """
+        if not self.path or not self._dirty:
+            return
+        # 같은 파일을 쓰는 다른 프로세스와 임시 파일이 겹치지 않도록 쓸 때마다 새 임시 파일을 만듦
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({
+                    "version": RECORD_VERSION,
+                    "savedAt": int(time.time()),
+                    "entries": self.top(self.max_tracked),
+                }, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._dirty = False
+
+    async def warm(self) -> None:
+        """
+        기록 파일의 상위 요청과 코드표를 백그라운드 우선순위로 미리 가져옵니다.
+        이미 신선한 캐시(디스크 캐시 포함)가 있는 요청은 업스트림을 호출하지 않습니다.
+        """
+        # 순환 참조를 피하기 위해 실행 시점에 가져옴 (api/tools 모듈이 이 모듈로 조회를 기록)
+        from .api import warm_cache_entry
+        from .tools import warm_code_tables
+
+        self.state = "running"
+        self.started_at = time.time()
+        await asyncio.to_thread(self.load)
+        plan = self.top(self.top_n)
+        self.planned = len(plan)
+        logger.info(f"캐시 예열을 시작합니다: 요청 {self.planned}건과 코드표")
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def warm_one(entry: Dict[str, Any]) -> None:
+            async with semaphore:
+                try:
+                    ok = await warm_cache_entry(entry["endpoint"], entry["params"], entry["type"], entry["key"])
+                except Exception as e:
+                    logger.debug(f"캐시 예열 실패: {entry['key']} - {str(e)}")
+                    ok = False
+                if ok:
+                    self.completed += 1
+                else:
+                    self.failed += 1
+
+        warm_code_tables()
+        with background_priority():
+            await asyncio.gather(*[warm_one(entry) for entry in plan])
+
+        self.state = "done"
+        self.finished_at = time.time()
+        logger.info(
+            f"캐시 예열을 마쳤습니다: 성공 {self.completed}건, 실패 {self.failed}건 "
+            f"({self.finished_at - self.started_at:.1f}초)"
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        예열 진행 상황을 반환합니다.
+
+        Returns:
+            상태(disabled/pending/running/done), 예정/완료/실패 건수, 소요 시간, 기록 중인 키 수를 담은 딕셔너리
+        """
+        if self.started_at is None:
+            duration = None
+        else:
+            duration = round((self.finished_at or time.time()) - self.started_at, 3)
+        return {
+            "state": self.state,
+            "planned": self.planned,
+            "completed": self.completed,
+            "failed": self.failed,
+            "durationSeconds": duration,
+            "trackedKeys": len(self._records),
+            "path": self.path or None,
+        }
+
+    def _trim(self) -> None:
+        """조회 횟수가 적은 기록을 버려 기록 수를 상한의 절반으로 줄입니다."""
+        keep = sorted(self._records.items(), key=lambda item: item[1][0], reverse=True)[:self.max_tracked // 2]
+        self._records = dict(keep)
+
+async def run_warmup(delay: float = WARMUP_DELAY, save_interval: float = WARMUP_SAVE_INTERVAL) -> None:
+    """
+    서버 시작 후 캐시를 예열하고, 이후 조회 기록을 주기적으로 저장합니다.
+    작업이 취소될 때(서버 종료) 마지막으로 한 번 더 저장합니다.
+
+    Args:
+        delay: 예열 시작 전 대기 시간(초), initialize 응답과 첫 요청이 먼저 처리되도록 함
+        save_interval: 조회 기록 저장 주기(초)
+    """
+    if not cache_warmer.path:
+        return
+    try:
+        await asyncio.sleep(delay)
+        try:
+            await cache_warmer.warm()
+        except Exception as e:
+            cache_warmer.state = "done"
+            logger.warning(f"캐시 예열 중 오류 발생: {str(e)}")
+        while True:
+            await asyncio.sleep(save_interval)
+            try:
+                cache_warmer.save()
+            except OSError as e:
+                logger.warning(f"캐시 예열 기록 저장 실패: {cache_warmer.path} - {str(e)}")
+    finally:
+        try:
+            cache_warmer.save()
+        except OSError:
+            pass
+
+# 캐시 예열 관리자 인스턴스 생성
+cache_warmer = CacheWarmer()
@@ -0,0 +1,11 @@
+"""
+테스트 공통 설정
+
+gonghun_mcp.config는 가져올 때 환경 변수를 읽으므로, 테스트가 작업 디렉터리에 로그/캐시 파일을 만들지 않도록
+패키지를 가져오기 전에 파일 출력을 끕니다.
+"""
+
+import os
+
+for name in ("LOG_FILE", "CACHE_DB_PATH", "MIRROR_DB_PATH", "METRICS_EXPORT_PATH", "WARMUP_PATH"):
+    os.environ[name] = ""
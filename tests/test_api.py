@@ -0,0 +1,171 @@
+"""API 조회 함수 테스트"""
+
+import asyncio
+from typing import Any, Dict
+
+import pytest
+
+from gonghun_mcp import api
+from gonghun_mcp.api import fetch_activist_profile, fetch_all_pages, fetch_by_ids, fetch_merit_list
+from gonghun_mcp.cache import CacheManager
+from gonghun_mcp.config import MAX_COUNT_PER_PAGE
+
+async def fetch_partial_match(mng_no: str = None, **_: Any) -> Dict[str, Any]:
+    """관리번호 검색이 부분 일치하여 다른 사람의 항목만 돌려주는 업스트림"""
+    return {"totalCount": 1, "items": [{"mngNo": f"{mng_no}9", "nameKo": "다른 사람"}]}
+
+async def fetch_exact_match(mng_no: str = None, **_: Any) -> Dict[str, Any]:
+    return {"totalCount": 2, "items": [
+        {"mngNo": f"{mng_no}9", "nameKo": "다른 사람"},
+        {"mngNo": mng_no, "nameKo": "찾는 사람"},
+    ]}
+
+def test_fetch_by_ids_without_exact_match_is_not_found():
+    result = asyncio.run(fetch_by_ids(fetch_partial_match, ["000123"]))
+
+    assert result["foundCount"] == 0
+    assert result["results"] == [{"mngNo": "000123", "found": False}]
+
+def test_fetch_by_ids_picks_exact_match():
+    result = asyncio.run(fetch_by_ids(fetch_exact_match, ["000123"]))
+
+    assert result["foundCount"] == 1
+    assert result["results"][0]["item"]["nameKo"] == "찾는 사람"
+
+@pytest.mark.parametrize("max_results", [0, -5])
+def test_fetch_all_pages_rejects_max_results_below_one(max_results):
+    calls = []
+
+    async def fetch(**kwargs: Any) -> Dict[str, Any]:
+        calls.append(kwargs)
+        return {"totalCount": 0, "items": []}
+
+    with pytest.raises(ValueError):
+        asyncio.run(fetch_all_pages(fetch, max_results=max_results))
+    assert calls == []
+
+def test_profile_error_reports_both_failures(monkeypatch):
+    async def merit_down(**_: Any) -> Dict[str, Any]:
+        raise RuntimeError("공훈록 시간 초과")
+
+    async def report_down(**_: Any) -> Dict[str, Any]:
+        raise RuntimeError("공적조서 503")
+
+    monkeypatch.setattr(api, "fetch_merit_list", merit_down)
+    monkeypatch.setattr(api, "fetch_public_report", report_down)
+
+    with pytest.raises(RuntimeError) as excinfo:
+        asyncio.run(fetch_activist_profile("000123"))
+    assert "공훈록 시간 초과" in str(excinfo.value)
+    assert "공적조서 503" in str(excinfo.value)
+
+def test_filters_are_normalized_for_the_upstream_request(monkeypatch):
+    requests = []
+
+    async def fetch_cached(endpoint, params, response_type, cache_key):
+        requests.append((dict(params), cache_key))
+        return {"totalCount": 0, "items": []}
+
+    monkeypatch.setattr(api, "_fetch_cached", fetch_cached)
+    asyncio.run(fetch_merit_list(count_per_page=MAX_COUNT_PER_PAGE, name_ko=" 홍길동 ", hunkuk=""))
+    asyncio.run(fetch_merit_list(count_per_page=MAX_COUNT_PER_PAGE, name_ko="홍길동"))
+
+    (padded, padded_key), (plain, plain_key) = requests
+    assert padded["nameKo"] == "홍길동" and "hunkuk" not in padded
+    assert padded == plain and padded_key == plain_key
+
+def test_sliced_page_falls_back_when_a_block_fails(monkeypatch):
+    requests = []
+
+    async def fetch_cached(endpoint, params, response_type, cache_key):
+        requests.append(dict(params))
+        if params["nCountPerPage"] != MAX_COUNT_PER_PAGE:
+            return {"error": True, "message": "업스트림 오류"}
+        if params["nPageIndex"] == 2:
+            return {"error": True, "message": "XML 파싱 오류", "items": []}
+        return {"totalCount": 100, "items": [{"mngNo": str(index)} for index in range(MAX_COUNT_PER_PAGE)]}
+
+    monkeypatch.setattr(api, "_fetch_cached", fetch_cached)
+    # 46번째부터 9건: 첫 번째와 두 번째 블록에 걸친 페이지
+    page = asyncio.run(fetch_merit_list(page_index=6, count_per_page=9))
+
+    assert page.get("error") is True
+    assert requests[-1]["nCountPerPage"] == 9
+
+@pytest.fixture
+def stale_cache(monkeypatch):
+    """저장 즉시 soft TTL이 지나는 캐시와 호출을 기록하는 업스트림"""
+    cache = CacheManager(timeout_minutes=0, stale_timeout_minutes=10, sweep_interval=3600)
+    cache.set("key", {"items": ["old"]})
+    monkeypatch.setattr(api, "cache_manager", cache)
+    monkeypatch.setattr(api.cache_warmer, "record", lambda *args: None)
+    calls = []
+
+    def use(upstream):
+        async def request_upstream(endpoint, params, response_type, cache_key):
+            calls.append(cache_key)
+            return await upstream(cache_key)
+        monkeypatch.setattr(api, "_request_upstream_shared", request_upstream)
+        return calls
+
+    use.cache = cache
+    return use
+
+def test_stale_entry_is_served_while_revalidating(stale_cache, monkeypatch):
+    monkeypatch.setattr(api, "CACHE_STALE_MODE", "revalidate")
+
+    async def refresh(cache_key):
+        await asyncio.sleep(0)
+        stale_cache.cache.set(cache_key, {"items": ["new"]})
+        return {"items": ["new"]}
+
+    calls = stale_cache(refresh)
+
+    async def main():
+        data = await api._fetch_cached("/list", {}, "JSON", "key")
+        # 갱신을 기다리지 않고 오래된 데이터를 바로 반환
+        assert calls == []
+        await asyncio.gather(*api._background_tasks)
+        return data
+
+    data = asyncio.run(main())
+
+    assert data["items"] == ["old"]
+    assert data["cacheStatus"]["stale"] is True
+    assert data["cacheStatus"]["reason"] == "revalidating"
+    assert calls == ["key"]
+    assert stale_cache.cache.lookup("key")[0] == {"items": ["new"]}
+
+def test_stale_entry_is_served_on_upstream_error(stale_cache, monkeypatch):
+    monkeypatch.setattr(api, "CACHE_STALE_MODE", "on_error")
+
+    async def down(cache_key):
+        raise RuntimeError("업스트림 503")
+
+    calls = stale_cache(down)
+    data = asyncio.run(api._fetch_cached("/list", {}, "JSON", "key"))
+
+    assert calls == ["key"]
+    assert data["items"] == ["old"]
+    assert data["cacheStatus"]["reason"] == "upstream_error"
+
+def test_stale_entry_is_refreshed_synchronously_when_upstream_succeeds(stale_cache, monkeypatch):
+    monkeypatch.setattr(api, "CACHE_STALE_MODE", "on_error")
+
+    async def fresh(cache_key):
+        return {"items": ["new"]}
+
+    stale_cache(fresh)
+
+    assert asyncio.run(api._fetch_cached("/list", {}, "JSON", "key")) == {"items": ["new"]}
+
+def test_stale_entry_is_not_used_when_stale_mode_is_off(stale_cache, monkeypatch):
+    monkeypatch.setattr(api, "CACHE_STALE_MODE", "off")
+
+    async def down(cache_key):
+        raise RuntimeError("업스트림 503")
+
+    stale_cache(down)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(api._fetch_cached("/list", {}, "JSON", "key"))
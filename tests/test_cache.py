@@ -0,0 +1,124 @@
+"""메모리 캐시 테스트"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from gonghun_mcp.cache import CacheManager
+from gonghun_mcp.cache_backend import CacheBackend
+from gonghun_mcp.disk_cache import DiskCache
+
+def test_sweep_removes_expired_text_behind_longer_lived_data():
+    cache = CacheManager(timeout_minutes=0, stale_timeout_minutes=0, sweep_interval=3600)
+    cache.timeout = 0.05
+    cache.stale_timeout = 10.0
+    cache.set("data1", {"items": []})
+    cache.set_text("text1", "x" * 10000)
+
+    time.sleep(0.1)
+
+    assert cache.sweep_expired() == 1
+    assert len(cache) == 1
+    assert cache.get_text("text1") is None
+    assert cache.lookup("data1")[0] == {"items": []}
+
+def test_sweep_skips_overwritten_entries():
+    cache = CacheManager(sweep_interval=3600)
+    cache.timeout = 0.05
+    cache.stale_timeout = 0.05
+    cache.set("key", {"version": 1})
+    cache.stale_timeout = 10.0
+    cache.set("key", {"version": 2})
+
+    time.sleep(0.1)
+
+    assert cache.sweep_expired() == 0
+    assert cache.lookup("key")[0] == {"version": 2}
+
+def test_disk_hits_batch_accessed_at_updates(tmp_path):
+    disk = DiskCache(str(tmp_path / "cache.db"), compact_interval=3600)
+    disk.set("key", {"items": [1]}, 60)
+    before = disk._conn.execute("SELECT accessed_at FROM cache WHERE key = 'key'").fetchone()[0]
+    time.sleep(0.01)
+
+    assert disk.get("key")[0] == {"items": [1]}
+    assert disk._conn.execute("SELECT accessed_at FROM cache WHERE key = 'key'").fetchone()[0] == before
+
+    disk.compact()
+    assert disk._conn.execute("SELECT accessed_at FROM cache WHERE key = 'key'").fetchone()[0] > before
+    disk.close()
+
+def test_lookup_async_reads_backend_off_the_event_loop(tmp_path):
+    disk = DiskCache(str(tmp_path / "cache.db"))
+    disk.set("key", {"items": [1]}, 60)
+    cache = CacheManager(backend=disk)
+    threads = []
+    get = disk.get
+
+    def recording_get(key):
+        threads.append(threading.current_thread())
+        return get(key)
+
+    disk.get = recording_get
+    data, stale, _ = asyncio.run(cache.lookup_async("key"))
+
+    assert data == {"items": [1]} and not stale
+    assert threads and threads[0] is not threading.main_thread()
+    assert cache.stats()["diskHits"] == 1
+    cache.close()
+
+def test_least_recently_used_entry_is_evicted_over_entry_limit():
+    cache = CacheManager(max_entries=2, sweep_interval=3600)
+    cache.set("a", {"v": 1})
+    cache.set("b", {"v": 2})
+    # 조회한 항목은 최근 사용으로 옮겨져 제거 대상에서 밀려남
+    assert cache.get("a") == {"v": 1}
+    cache.set("c", {"v": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": 1}
+    assert cache.get("c") == {"v": 3}
+    assert cache.stats()["evictions"] == 1
+
+def test_entries_are_evicted_by_estimated_size():
+    cache = CacheManager(max_bytes=10000, sweep_interval=3600)
+    cache.set("a", {"text": "a" * 4000})
+    cache.set("b", {"text": "b" * 4000})
+    cache.set_text("c", "c" * 4000)
+
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    assert cache.get_text("c") == "c" * 4000
+    assert cache.total_bytes <= cache.max_bytes
+    assert cache.total_bytes == sum(entry.size for entry in cache._entries.values())
+
+def test_entry_larger_than_byte_limit_is_not_cached():
+    cache = CacheManager(max_bytes=1000, sweep_interval=3600)
+    cache.set("small", {"v": 1})
+    cache.set("huge", {"text": "x" * 5000})
+
+    assert cache.get("huge") is None
+    assert cache.get("small") == {"v": 1}
+    assert cache.stats()["evictions"] == 0
+
+def test_expired_entries_are_removed_on_lookup():
+    cache = CacheManager(sweep_interval=3600)
+    cache.timeout = 0.01
+    cache.stale_timeout = 0.01
+    cache.set("key", {"v": 1})
+
+    time.sleep(0.03)
+
+    assert cache.lookup("key") == (None, False, 0.0)
+    assert len(cache) == 0 and cache.total_bytes == 0
+
+def test_cache_backend_requires_storage_methods():
+    class PartialBackend(CacheBackend):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        PartialBackend()
+    assert isinstance(DiskCache(":memory:"), CacheBackend)
@@ -0,0 +1,153 @@
+"""업스트림 제한기 테스트"""
+
+import asyncio
+
+from gonghun_mcp.limiter import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, UpstreamLimiter, background_priority
+
+def make_limiter(limit: int = 1, **kwargs) -> UpstreamLimiter:
+    return UpstreamLimiter(rate=0, initial_limit=limit, min_limit=1, max_limit=kwargs.pop("max_limit", 8), **kwargs)
+
+def test_interactive_waiters_run_before_background_in_arrival_order():
+    limiter = make_limiter()
+    order = []
+
+    async def request(name, priority):
+        await limiter.acquire(priority)
+        order.append(name)
+        limiter.release(0.0, True)
+
+    async def main():
+        await limiter.acquire()
+        waiters = [
+            asyncio.ensure_future(request("background-1", PRIORITY_BACKGROUND)),
+            asyncio.ensure_future(request("interactive-1", PRIORITY_INTERACTIVE)),
+            asyncio.ensure_future(request("background-2", PRIORITY_BACKGROUND)),
+            asyncio.ensure_future(request("interactive-2", PRIORITY_INTERACTIVE)),
+        ]
+        await asyncio.sleep(0)
+        limiter.release(0.0, True)
+        await asyncio.gather(*waiters)
+
+    asyncio.run(main())
+    assert order == ["interactive-1", "interactive-2", "background-1", "background-2"]
+
+def test_background_priority_context_applies_to_acquire():
+    limiter = make_limiter()
+    order = []
+
+    async def request(name):
+        await limiter.acquire()
+        order.append(name)
+        limiter.release(0.0, True)
+
+    async def main():
+        await limiter.acquire()
+        with background_priority():
+            background = asyncio.ensure_future(request("background"))
+        interactive = asyncio.ensure_future(request("interactive"))
+        await asyncio.sleep(0)
+        limiter.release(0.0, True)
+        await asyncio.gather(background, interactive)
+
+    asyncio.run(main())
+    assert order == ["interactive", "background"]
+
+def test_limit_grows_additively_and_halves_on_failure():
+    limiter = make_limiter(limit=4, latency_target=1.0)
+
+    async def main():
+        await limiter.acquire()
+        limiter.release(0.1, True)
+        assert limiter.limit == 4.25
+
+        await limiter.acquire()
+        limiter.release(0.1, False)
+        assert limiter.limit == 2.125
+        assert limiter.decreases == 1
+
+        # 같은 목표 시간 안의 실패는 한 번만 줄임
+        await limiter.acquire()
+        limiter.release(5.0, True)
+        assert limiter.limit == 2.125
+
+    asyncio.run(main())
+
+def test_limit_stays_within_bounds():
+    limiter = UpstreamLimiter(rate=0, initial_limit=2, min_limit=2, max_limit=2, latency_target=0.0)
+
+    async def main():
+        await limiter.acquire()
+        limiter.release(0.0, True)
+        assert limiter.limit == 2
+        await limiter.acquire()
+        limiter.release(1.0, False)
+        assert limiter.limit == 2
+
+    asyncio.run(main())
+
+def test_abandon_returns_slot_without_adjusting_limit():
+    limiter = make_limiter(limit=2)
+
+    async def main():
+        await limiter.acquire()
+        limiter.abandon()
+
+    asyncio.run(main())
+    assert limiter.in_flight == 0
+    assert limiter.limit == 2
+    assert limiter.decreases == 0
+
+def test_cancelled_waiter_is_skipped_and_does_not_leak_a_slot():
+    limiter = make_limiter()
+    order = []
+
+    async def request(name):
+        await limiter.acquire()
+        order.append(name)
+        limiter.release(0.0, True)
+
+    async def main():
+        await limiter.acquire()
+        cancelled = asyncio.ensure_future(request("cancelled"))
+        waiting = asyncio.ensure_future(request("waiting"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        limiter.release(0.0, True)
+        await waiting
+        assert cancelled.cancelled()
+
+    asyncio.run(main())
+    assert order == ["waiting"]
+    assert limiter.in_flight == 0
+    assert limiter.stats()["waiting"] == 0
+
+def test_cancel_after_slot_granted_returns_the_slot():
+    limiter = make_limiter()
+
+    async def main():
+        await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        # 슬롯을 넘겨받았지만 아직 실행되지 않은 대기 요청을 취소
+        limiter.release(0.0, True)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+
+    asyncio.run(main())
+    assert limiter.in_flight == 0
+
+def test_token_bucket_throttles_beyond_burst():
+    limiter = UpstreamLimiter(rate=50, burst=1, initial_limit=8, min_limit=1, max_limit=8)
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for _ in range(3):
+            await limiter.acquire()
+            limiter.release(0.0, True)
+        return loop.time() - started
+
+    elapsed = asyncio.run(main())
+    assert elapsed >= 0.03
+    assert limiter.throttled == 2
@@ -0,0 +1,33 @@
+"""도구 호출 프로파일링 테스트"""
+
+import asyncio
+import json
+
+from gonghun_mcp import tools
+from gonghun_mcp.profiling import Profiler
+
+def test_unwritable_slow_call_log_keeps_tool_result(monkeypatch, tmp_path):
+    slow_profiler = Profiler(enabled=True, threshold_ms=0, log_path=str(tmp_path / "missing" / "slow.log"))
+    monkeypatch.setattr(tools, "profiler", slow_profiler)
+    in_flight = tools.session_manager.in_flight
+
+    result = asyncio.run(tools.call_tool("set_profiling", {"enabled": True}))
+
+    assert json.loads(result[0].text)["enabled"] is True
+    assert slow_profiler.slow_calls == 1
+    assert tools.session_manager.in_flight == in_flight
+
+def test_slow_call_report_failure_is_logged_not_raised(monkeypatch):
+    slow_profiler = Profiler(enabled=True, threshold_ms=0)
+
+    def fail_write(report):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(slow_profiler, "_write", fail_write)
+    monkeypatch.setattr(tools, "profiler", slow_profiler)
+    in_flight = tools.session_manager.in_flight
+
+    result = asyncio.run(tools.call_tool("set_profiling", {"enabled": True}))
+
+    assert json.loads(result[0].text)["enabled"] is True
+    assert tools.session_manager.in_flight == in_flight
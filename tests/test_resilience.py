@@ -0,0 +1,150 @@
+"""서킷 브레이커, 재시도, 헤지 요청 테스트"""
+
+import asyncio
+import time
+from typing import Any, List
+
+import httpx
+import pytest
+
+from gonghun_mcp import api
+from gonghun_mcp.limiter import UpstreamLimiter
+from gonghun_mcp.resilience import CircuitBreaker, CircuitOpenError
+
+class FakeClient:
+    """정해 둔 상태 코드나 예외를 차례로 돌려주는 HTTP 클라이언트"""
+
+    def __init__(self, outcomes: List[Any], delays: List[float] = ()):
+        self.outcomes = list(outcomes)
+        self.delays = list(delays)
+        self.calls = 0
+        self.cancelled = 0
+
+    async def get(self, endpoint: str, params: Any = None) -> httpx.Response:
+        index = self.calls
+        self.calls += 1
+        try:
+            if index < len(self.delays):
+                await asyncio.sleep(self.delays[index])
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        outcome = self.outcomes[min(index, len(self.outcomes) - 1)]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome, json={"call": index}, request=httpx.Request("GET", endpoint))
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """재시도 대기 없이 새 제한기와 서킷 브레이커로 업스트림 요청 경로를 실행"""
+    limiter = UpstreamLimiter(rate=0, initial_limit=4, min_limit=1, max_limit=4)
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    monkeypatch.setattr(api, "upstream_limiter", limiter)
+    monkeypatch.setattr(api, "circuit_breaker", breaker)
+    monkeypatch.setattr(api, "backoff_delay", lambda attempt: 0)
+    monkeypatch.setattr(api, "UPSTREAM_RETRIES", 2)
+    monkeypatch.setattr(api, "HEDGE_ENABLED", False)
+
+    def use(client: FakeClient) -> FakeClient:
+        async def get_client():
+            return client
+        monkeypatch.setattr(api.http_client_manager, "get_client", get_client)
+        return client
+
+    use.limiter = limiter
+    use.breaker = breaker
+    return use
+
+def test_circuit_opens_after_threshold_and_probes_once_when_half_open():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    # 시험 요청의 결과가 나오기 전에는 다른 요청을 보내지 않음
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow()
+
+def test_failed_half_open_probe_reopens_the_circuit():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow()
+
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert breaker.opens == 2
+    assert not breaker.allow()
+
+def test_retryable_statuses_are_retried(upstream):
+    client = upstream(FakeClient([503, 429, 200]))
+
+    response = asyncio.run(api._get_with_retries("https://upstream/list", {}))
+
+    assert response.status_code == 200
+    assert client.calls == 3
+    assert upstream.breaker.failures == 0
+    assert upstream.limiter.in_flight == 0
+
+def test_non_retryable_status_is_not_retried(upstream):
+    client = upstream(FakeClient([404, 200]))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(api._get_with_retries("https://upstream/list", {}))
+    assert client.calls == 1
+    assert upstream.breaker.failures == 0
+
+def test_retries_stop_after_limit(upstream):
+    client = upstream(FakeClient([502]))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(api._get_with_retries("https://upstream/list", {}))
+    assert client.calls == 3
+    assert upstream.breaker.failures == 3
+
+def test_transport_errors_are_retried(upstream):
+    client = upstream(FakeClient([httpx.ConnectError("연결 실패"), 200]))
+
+    assert asyncio.run(api._get_with_retries("https://upstream/list", {})).status_code == 200
+    assert client.calls == 2
+
+def test_open_circuit_rejects_without_calling_upstream(upstream):
+    client = upstream(FakeClient([200]))
+    for _ in range(3):
+        upstream.breaker.record_failure()
+
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(api._get_with_retries("https://upstream/list", {}))
+    assert client.calls == 0
+
+def test_hedged_request_wins_and_cancels_the_slow_one(upstream, monkeypatch):
+    monkeypatch.setattr(api, "HEDGE_ENABLED", True)
+    monkeypatch.setattr(api.upstream_latency, "hedge_delay", lambda: 0.01)
+    client = upstream(FakeClient([200], delays=[5.0, 0.0]))
+
+    response = asyncio.run(api._get_with_retries("https://upstream/list", {}))
+
+    assert response.json() == {"call": 1}
+    assert client.calls == 2
+    assert client.cancelled == 1
+    # 취소된 요청의 슬롯은 동시 요청 수 조정 없이 반환
+    assert upstream.limiter.in_flight == 0
+    assert upstream.limiter.decreases == 0
+
+def test_fast_first_request_is_not_hedged(upstream, monkeypatch):
+    monkeypatch.setattr(api, "HEDGE_ENABLED", True)
+    monkeypatch.setattr(api.upstream_latency, "hedge_delay", lambda: 1.0)
+    client = upstream(FakeClient([200]))
+
+    assert asyncio.run(api._get_with_retries("https://upstream/list", {})).json() == {"call": 0}
+    assert client.calls == 1
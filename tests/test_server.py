@@ -0,0 +1,69 @@
+"""리소스 템플릿 라우팅과 페이지 커서 테스트"""
+
+import asyncio
+import json
+from typing import Any, Dict
+
+import pytest
+from pydantic import AnyUrl
+
+from gonghun_mcp import server
+from gonghun_mcp.cache import CacheManager
+from gonghun_mcp.config import RESOURCE_PAGE_SIZE
+
+@pytest.fixture
+def dataset(monkeypatch):
+    """호출을 기록하고 관리번호나 페이지에 맞는 항목을 돌려주는 공훈록 조회 함수"""
+    calls = []
+
+    async def fetch(page_index: int = 1, count_per_page: int = 10, mng_no: str = None, **kwargs: Any) -> Dict[str, Any]:
+        calls.append({"page_index": page_index, "count_per_page": count_per_page, "mng_no": mng_no})
+        if mng_no is not None:
+            return {"totalCount": 1, "items": [{"mngNo": mng_no, "nameKo": "홍길동", "achivement": "공적"}]}
+        start = (page_index - 1) * count_per_page
+        return {
+            "totalCount": 2 * RESOURCE_PAGE_SIZE,
+            "items": [{"mngNo": str(start + i), "nameKo": "이름"} for i in range(count_per_page)],
+        }
+
+    monkeypatch.setattr(server, "DATASET_FETCHERS", {"merit": fetch, "report": fetch})
+    monkeypatch.setattr(server, "cache_manager", CacheManager(sweep_interval=3600))
+    return calls
+
+def read(uri: str) -> Dict[str, Any]:
+    contents = asyncio.run(server.handle_read_resource(AnyUrl(uri)))
+    return json.loads(contents[0].content)
+
+def test_all_resource_reads_first_page_with_cursor(dataset):
+    data = read("gonghun://merit/all")
+
+    assert dataset == [{"page_index": 1, "count_per_page": RESOURCE_PAGE_SIZE, "mng_no": None}]
+    assert data["nextCursor"] == "gonghun://merit/page/2"
+
+def test_last_page_has_no_cursor(dataset):
+    data = read("gonghun://report/page/2")
+
+    assert dataset[0]["page_index"] == 2
+    assert data["nextCursor"] is None
+
+def test_record_template_reads_one_item_with_fields(dataset):
+    data = read("gonghun://report/000123?fields=mngNo,nameKo")
+
+    assert dataset[0]["mng_no"] == "000123"
+    assert data == {"mngNo": "000123", "nameKo": "홍길동"}
+
+def test_cursor_carries_only_fields_used_for_the_cached_response(dataset):
+    first = read("gonghun://merit/page/1?fields=mngNo&debug=1")
+    second = read("gonghun://merit/page/1?fields=mngNo")
+
+    assert first["nextCursor"] == "gonghun://merit/page/2?fields=mngNo"
+    # 두 번째 요청은 응답 문자열 캐시를 사용하므로 커서가 같아야 함
+    assert second == first
+    assert len(dataset) == 1
+    assert first["items"][0] == {"mngNo": "0"}
+
+@pytest.mark.parametrize("uri", ["gonghun://merit/page/0", "gonghun://merit/page/x", "gonghun://merit/1/2"])
+def test_invalid_resource_paths_are_rejected(dataset, uri):
+    with pytest.raises(ValueError):
+        read(uri)
+    assert dataset == []
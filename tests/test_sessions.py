@@ -0,0 +1,102 @@
+"""세션별 동시 호출 제한과 종료 대기 테스트"""
+
+import asyncio
+import contextvars
+
+import pytest
+
+from gonghun_mcp.sessions import SessionManager
+
+class FakeSession:
+    """MCP 세션 대신 사용하는 객체 (약한 참조 키로 쓸 수 있어야 함)"""
+
+current_session = contextvars.ContextVar("current_session", default=None)
+
+def make_manager(max_concurrency: int = 1, max_sessions: int = 0) -> SessionManager:
+    manager = SessionManager(max_concurrency=max_concurrency, max_sessions=max_sessions)
+    manager._current_session = current_session.get
+    return manager
+
+def test_session_limit_rejects_extra_sessions():
+    manager = make_manager(max_sessions=2)
+
+    assert manager.open_session()
+    assert manager.open_session()
+    assert not manager.open_session()
+    manager.close_session()
+    assert manager.open_session()
+
+    assert manager.stats()["sessions"] == 2
+    assert manager.stats()["rejectedSessions"] == 1
+
+def test_calls_in_one_session_wait_for_its_slot_but_other_sessions_do_not():
+    manager = make_manager(max_concurrency=1)
+    first, second = FakeSession(), FakeSession()
+    order = []
+
+    async def call(session, name, hold):
+        current_session.set(session)
+        slot = await manager.acquire()
+        order.append(f"{name}:start")
+        await hold.wait()
+        order.append(f"{name}:end")
+        manager.release(slot)
+
+    async def main():
+        hold = asyncio.Event()
+        tasks = [
+            asyncio.ensure_future(call(first, "a1", hold)),
+            asyncio.ensure_future(call(first, "a2", hold)),
+            asyncio.ensure_future(call(second, "b1", hold)),
+        ]
+        await asyncio.sleep(0.01)
+        # 같은 세션의 두 번째 호출만 기다리고 다른 세션의 호출은 바로 실행
+        assert order == ["a1:start", "b1:start"]
+        assert manager.in_flight == 2
+        hold.set()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+
+    assert order.index("a2:start") > order.index("a1:end")
+    assert manager.in_flight == 0
+
+def test_calls_outside_a_session_are_not_limited():
+    manager = make_manager(max_concurrency=1)
+
+    async def main():
+        slots = [await manager.acquire() for _ in range(3)]
+        assert slots == [None, None, None]
+        assert manager.in_flight == 3
+        for slot in slots:
+            manager.release(slot)
+
+    asyncio.run(main())
+    assert manager.in_flight == 0
+
+def test_drain_waits_for_in_flight_calls_and_rejects_new_ones():
+    manager = make_manager()
+
+    async def main():
+        slot = await manager.acquire()
+        drained = asyncio.ensure_future(manager.drain(timeout=1.0))
+        await asyncio.sleep(0.01)
+        assert not drained.done()
+        with pytest.raises(RuntimeError):
+            await manager.acquire()
+        assert not manager.open_session()
+
+        manager.release(slot)
+        return await drained
+
+    assert asyncio.run(main()) is True
+
+def test_drain_times_out_when_calls_do_not_finish():
+    manager = make_manager()
+
+    async def main():
+        await manager.acquire()
+        return await manager.drain(timeout=0.01)
+
+    assert asyncio.run(main()) is False
+    assert manager.stats()["draining"] is True
@@ -0,0 +1,60 @@
+"""싱글플라이트 우선순위 테스트"""
+
+import asyncio
+
+from gonghun_mcp import singleflight
+from gonghun_mcp.limiter import UpstreamLimiter, background_priority
+from gonghun_mcp.singleflight import SingleFlight
+
+def test_interactive_joiner_promotes_background_flight(monkeypatch):
+    limiter = UpstreamLimiter(rate=0, initial_limit=1, min_limit=1, max_limit=1)
+    monkeypatch.setattr(singleflight, "upstream_limiter", limiter)
+    flight = SingleFlight()
+    order = []
+
+    async def request(name):
+        await limiter.acquire()
+        order.append(name)
+        limiter.release(0.0, True)
+        return name
+
+    async def main():
+        # 슬롯을 하나 차지해 이후 요청이 모두 대기열에서 기다리게 함
+        await limiter.acquire()
+        with background_priority():
+            other = asyncio.ensure_future(request("other-background"))
+            await asyncio.sleep(0)
+            refresh = asyncio.ensure_future(flight.do("key", lambda: request("shared")))
+            await asyncio.sleep(0)
+        joined = asyncio.ensure_future(flight.do("key", lambda: request("unused")))
+        await asyncio.sleep(0)
+        limiter.release(0.0, True)
+        return await asyncio.gather(other, refresh, joined)
+
+    assert asyncio.run(main()) == ["other-background", "shared", "shared"]
+    assert order == ["shared", "other-background"]
+
+def test_background_flight_stays_background_without_interactive_joiner(monkeypatch):
+    limiter = UpstreamLimiter(rate=0, initial_limit=1, min_limit=1, max_limit=1)
+    monkeypatch.setattr(singleflight, "upstream_limiter", limiter)
+    flight = SingleFlight()
+    order = []
+
+    async def request(name):
+        await limiter.acquire()
+        order.append(name)
+        limiter.release(0.0, True)
+        return name
+
+    async def main():
+        await limiter.acquire()
+        with background_priority():
+            refresh = asyncio.ensure_future(flight.do("key", lambda: request("shared")))
+            await asyncio.sleep(0)
+        interactive = asyncio.ensure_future(request("interactive"))
+        await asyncio.sleep(0)
+        limiter.release(0.0, True)
+        await asyncio.gather(refresh, interactive)
+
+    asyncio.run(main())
+    assert order == ["interactive", "shared"]
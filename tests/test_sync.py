@@ -0,0 +1,184 @@
+"""로컬 미러 동기화 테스트"""
+
+import asyncio
+import math
+import threading
+from typing import Any, Dict, List, Optional, Set
+
+import pytest
+
+from gonghun_mcp import api, sync
+from gonghun_mcp.config import MAX_COUNT_PER_PAGE
+from gonghun_mcp.mirror import MirrorStore
+
+def make_items(count: int, judge_year: str = "1990") -> List[Dict[str, Any]]:
+    return [
+        {"mngNo": f"{index:06d}", "nameKo": f"홍길동{index}", "judgeYear": judge_year}
+        for index in range(count)
+    ]
+
+class FakeFetch:
+    """업스트림 조회 함수를 흉내 내며, 지정한 페이지는 오류 응답을 반환"""
+
+    def __init__(self, items: List[Dict[str, Any]], error_pages: Optional[Set[int]] = None):
+        self.items = items
+        self.error_pages = error_pages or set()
+
+    async def __call__(
+        self,
+        page_index: int = 1,
+        count_per_page: int = 10,
+        judge_year: Optional[str] = None,
+        use_cache: bool = True,
+        **_: Any
+    ) -> Dict[str, Any]:
+        if page_index in self.error_pages:
+            return {"error": True, "message": "업스트림 오류", "items": []}
+        items = [item for item in self.items if judge_year is None or item["judgeYear"] == judge_year]
+        start = (page_index - 1) * count_per_page
+        return {
+            "totalCount": len(items),
+            "pageCount": math.ceil(len(items) / count_per_page),
+            "pageIndex": page_index,
+            "items": items[start:start + count_per_page],
+        }
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    mirror = MirrorStore(str(tmp_path / "mirror.db"))
+    monkeypatch.setattr(sync, "mirror_store", mirror)
+    yield mirror
+    mirror.close()
+
+def record_count(store: MirrorStore, dataset: str = "merit_list") -> int:
+    return store._conn.execute("SELECT COUNT(*) FROM records WHERE dataset = ?", (dataset,)).fetchone()[0]
+
+def test_full_sync_error_page_keeps_existing_records(store, monkeypatch):
+    items = make_items(MAX_COUNT_PER_PAGE + 10)
+    monkeypatch.setitem(sync.DATASETS, "merit_list", FakeFetch(items))
+    assert asyncio.run(sync.sync_dataset("merit_list", resume=False))["completed"]
+    assert record_count(store) == len(items)
+
+    monkeypatch.setitem(sync.DATASETS, "merit_list", FakeFetch(items, error_pages={2}))
+    result = asyncio.run(sync.sync_dataset("merit_list", resume=False))
+
+    assert not result["completed"]
+    assert result["failedPages"] == [2]
+    assert result["removedRecords"] == 0
+    assert record_count(store) == len(items)
+
+def test_full_sync_error_first_page_raises(store, monkeypatch):
+    items = make_items(10)
+    monkeypatch.setitem(sync.DATASETS, "merit_list", FakeFetch(items))
+    asyncio.run(sync.sync_dataset("merit_list", resume=False))
+
+    monkeypatch.setitem(sync.DATASETS, "merit_list", FakeFetch(items, error_pages={1}))
+    with pytest.raises(RuntimeError):
+        asyncio.run(sync.sync_dataset("merit_list", resume=False))
+    assert record_count(store) == len(items)
+
+def test_incremental_error_page_keeps_partition(store, monkeypatch):
+    items = make_items(MAX_COUNT_PER_PAGE + 10)
+    monkeypatch.setitem(sync.DATASETS, "merit_list", FakeFetch(items))
+    assert asyncio.run(sync.sync_incremental("merit_list", years=["1990"]))["added"] == len(items)
+
+    # 건수가 바뀌어 파티션을 다시 받는 중 두 번째 페이지가 오류 응답
+    changed = items + make_items(1)
+    changed[-1]["mngNo"] = "900000"
+    monkeypatch.setitem(sync.DATASETS, "merit_list", FakeFetch(changed, error_pages={2}))
+    result = asyncio.run(sync.sync_incremental("merit_list", years=["1990"]))
+
+    assert result["failedPartitions"] == ["1990"]
+    assert result["removed"] == 0
+    assert record_count(store) == len(items)
+
+def test_incremental_not_ready_when_partitions_miss_records(store, monkeypatch):
+    items = make_items(5, judge_year="1990") + [
+        {"mngNo": "900000", "nameKo": "포상년도 없음", "judgeYear": ""}
+    ]
+    monkeypatch.setitem(sync.DATASETS, "merit_list", FakeFetch(items))
+    monkeypatch.setattr(sync, "judge_years", lambda: ["1990"])
+    result = asyncio.run(sync.sync_incremental("merit_list"))
+
+    assert result["completed"]
+    assert result["partitionedCount"] == 5
+    assert result["totalCount"] == 6
+    assert not store.is_ready("merit_list")
+
+def test_incremental_ready_when_partitions_cover_all(store, monkeypatch):
+    monkeypatch.setitem(sync.DATASETS, "merit_list", FakeFetch(make_items(5, judge_year="1990")))
+    monkeypatch.setattr(sync, "judge_years", lambda: ["1990"])
+    asyncio.run(sync.sync_incremental("merit_list"))
+
+    assert store.is_ready("merit_list")
+
+def record_threads(monkeypatch, store: MirrorStore, names: List[str]) -> Dict[str, List[threading.Thread]]:
+    """저장소 메서드가 실행된 스레드를 기록"""
+    threads: Dict[str, List[threading.Thread]] = {name: [] for name in names}
+    for name in names:
+        method = getattr(store, name)
+
+        def recording(*args: Any, _name: str = name, _method: Any = method, **kwargs: Any) -> Any:
+            threads[_name].append(threading.current_thread())
+            return _method(*args, **kwargs)
+
+        monkeypatch.setattr(store, name, recording)
+    return threads
+
+def test_full_sync_writes_mirror_off_the_event_loop(store, monkeypatch):
+    monkeypatch.setitem(sync.DATASETS, "merit_list", FakeFetch(make_items(MAX_COUNT_PER_PAGE + 10)))
+    threads = record_threads(monkeypatch, store, ["begin_run", "store_page", "finish_run"])
+
+    assert asyncio.run(sync.sync_dataset("merit_list", resume=False))["completed"]
+
+    for name, called in threads.items():
+        assert called, name
+        assert all(thread is not threading.main_thread() for thread in called), name
+
+def test_mirror_query_runs_off_the_event_loop(store, monkeypatch):
+    monkeypatch.setitem(sync.DATASETS, "merit_list", FakeFetch(make_items(15)))
+    asyncio.run(sync.sync_dataset("merit_list", resume=False))
+    monkeypatch.setattr(api, "mirror_store", store)
+    monkeypatch.setattr(api, "DATA_SOURCE", "mirror")
+    threads = record_threads(monkeypatch, store, ["query"])
+
+    data = asyncio.run(api.fetch_merit_list(page_index=2, count_per_page=10))
+
+    assert data["totalCount"] == 15 and data["itemCount"] == 5
+    assert threads["query"] and threads["query"][0] is not threading.main_thread()
+
+def test_incremental_rotating_probe_finds_middle_page_change(store, monkeypatch):
+    items = make_items(MAX_COUNT_PER_PAGE * 4 + 10)
+    monkeypatch.setitem(sync.DATASETS, "merit_list", FakeFetch(items))
+    asyncio.run(sync.sync_incremental("merit_list", years=["1990"]))
+
+    # 건수, 첫 페이지, 마지막 페이지는 그대로이고 세 번째 페이지 항목만 바뀜
+    changed = [dict(item) for item in items]
+    changed[MAX_COUNT_PER_PAGE * 2]["nameKo"] = "이름 변경"
+    monkeypatch.setitem(sync.DATASETS, "merit_list", FakeFetch(changed))
+
+    # 첫 실행은 두 번째 페이지를 확인하므로 변경을 찾지 못하고, 다음 실행에서 세 번째 페이지를 확인
+    assert asyncio.run(sync.sync_incremental("merit_list", years=["1990"]))["partitionsRefetched"] == 0
+    result = asyncio.run(sync.sync_incremental("merit_list", years=["1990"]))
+
+    assert result["partitionsRefetched"] == 1
+    assert result["changed"] == 1
+
+def test_incremental_unchanged_partition_is_not_refetched(store, monkeypatch):
+    monkeypatch.setitem(sync.DATASETS, "merit_list", FakeFetch(make_items(MAX_COUNT_PER_PAGE * 2 + 10)))
+    asyncio.run(sync.sync_incremental("merit_list", years=["1990"]))
+
+    result = asyncio.run(sync.sync_incremental("merit_list", years=["1990"]))
+
+    assert result["partitionsRefetched"] == 0
+
+def test_incremental_sync_uses_mirror_off_the_event_loop(store, monkeypatch):
+    monkeypatch.setitem(sync.DATASETS, "merit_list", FakeFetch(make_items(5, judge_year="1990")))
+    monkeypatch.setattr(sync, "judge_years", lambda: ["1990"])
+    threads = record_threads(monkeypatch, store, ["get_partition", "apply_partition", "mark_complete"])
+
+    assert asyncio.run(sync.sync_incremental("merit_list"))["completed"]
+
+    for name, called in threads.items():
+        assert called, name
+        assert all(thread is not threading.main_thread() for thread in called), name
@@ -0,0 +1,66 @@
+"""응답 파싱과 쿼리 파라미터 유틸리티 테스트"""
+
+import json
+
+import pytest
+
+from benchmarks.bench_xml_parser import parse_with_tree
+from benchmarks.payloads import make_page, page_to_xml
+from gonghun_mcp.utils import format_response, parse_xml_response, project_fields
+
+@pytest.mark.parametrize("count, achivement_length", [(1, 10), (50, 200), (50, 2000)])
+def test_streaming_parser_matches_tree_parser(count, achivement_length):
+    xml = page_to_xml(make_page(count_per_page=count, achivement_length=achivement_length))
+
+    streamed = parse_xml_response(xml.encode("utf-8"))
+
+    assert streamed == parse_with_tree(xml)
+    assert streamed["items"][0]["references"][0]["links"]
+
+def test_streaming_parser_reads_only_direct_children():
+    xml = (
+        "<RESULT><TOTAL_COUNT>2</TOTAL_COUNT><PAGE_COUNT>1</PAGE_COUNT><ITEMS>"
+        "<ITEM><MNG_NO>1</MNG_NO><TOTAL_COUNT>99</TOTAL_COUNT>"
+        "<REFERENCES><REFERENCE><BOOK_NAME>책</BOOK_NAME><ITEM>중첩</ITEM></REFERENCE></REFERENCES></ITEM>"
+        "<ITEM><MNG_NO>2</MNG_NO></ITEM>"
+        "</ITEMS><EXTRA><ITEM><MNG_NO>3</MNG_NO></ITEM></EXTRA></RESULT>"
+    )
+
+    streamed = parse_xml_response(xml)
+
+    assert streamed == parse_with_tree(xml)
+    assert streamed["totalCount"] == 2
+    assert [item["mng_no"] for item in streamed["items"]] == ["1", "2"]
+
+def test_project_fields_keeps_selected_item_fields_for_both_formats():
+    data = {
+        "totalCount": 2,
+        "pageIndex": 1,
+        "items": [
+            {"mngNo": "1", "nameKo": "홍길동", "achivement": "공적"},
+            {"mng_no": "2", "name_ko": "김철수", "achivement": "공적"},
+        ],
+    }
+
+    projected = project_fields(data, ["mngNo", "nameKo"])
+
+    assert projected["items"] == [{"mngNo": "1", "nameKo": "홍길동"}, {"mng_no": "2", "name_ko": "김철수"}]
+    assert projected["totalCount"] == 2 and projected["pageIndex"] == 1
+    # 원본은 바뀌지 않음
+    assert "achivement" in data["items"][0]
+
+def test_project_fields_without_fields_returns_original():
+    data = {"items": [{"mngNo": "1"}]}
+
+    assert project_fields(data, None) is data
+    assert project_fields(data, []) is data
+
+def test_compact_response_has_no_whitespace_and_same_content():
+    data = {"totalCount": 1, "items": [{"mngNo": "1", "nameKo": "홍길동", "achivement": "공적"}]}
+
+    compact = format_response(data, compact=True, fields=["nameKo"])
+    pretty = format_response(data, compact=False, fields=["nameKo"])
+
+    assert compact == '{"totalCount":1,"items":[{"nameKo":"홍길동"}]}'
+    assert "\n" in pretty and len(pretty) > len(compact)
+    assert json.loads(pretty) == json.loads(compact)
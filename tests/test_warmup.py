@@ -0,0 +1,37 @@
+"""캐시 예열 테스트"""
+
+import asyncio
+
+from gonghun_mcp.limiter import background_priority
+from gonghun_mcp.warmup import CacheWarmer
+
+def counts(warmer: CacheWarmer):
+    return {entry["key"]: entry["count"] for entry in warmer.top(10)}
+
+def test_response_text_hits_count_toward_tracked_keys(tmp_path):
+    warmer = CacheWarmer(path=str(tmp_path / "warmup.json"))
+
+    async def fetch_blocks() -> None:
+        # gather로 만든 하위 작업의 조회도 같은 응답에 연결
+        async def fetch(key: str) -> None:
+            warmer.record(key, "endpoint", {"page": key}, "JSON")
+        await asyncio.gather(fetch("block1"), fetch("block2"))
+
+    async def miss_then_hits() -> None:
+        with warmer.track("response"):
+            await fetch_blocks()
+        for _ in range(3):
+            warmer.record_response("response")
+
+    asyncio.run(miss_then_hits())
+
+    assert counts(warmer) == {"block1": 4, "block2": 4}
+
+def test_background_hits_are_not_recorded(tmp_path):
+    warmer = CacheWarmer(path=str(tmp_path / "warmup.json"))
+    with warmer.track("response"):
+        warmer.record("block", "endpoint", {}, "JSON")
+    with background_priority():
+        warmer.record_response("response")
+
+    assert counts(warmer) == {"block": 1}